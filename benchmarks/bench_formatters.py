@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# measures per-call latency and throughput of format_post(), format_notification() and format_conversation()
+# for all synthetic cases in fixtures.py, needs neither a display nor a network connection
+#
+# usage: python benchmarks/bench_formatters.py [--iterations N] [--filter TEXT] [--output FILE]
+#
+# results are written as JSON, so two runs (e.g. before and after a commit) can be compared
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+# allow running this script straight from a source checkout
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fixtures
+
+from mammudon.emojis import EmojiIndex
+from mammudon.format_post import format_post, format_notification, format_conversation
+
+MY_ID = 1
+
+# number of custom emojis on the simulated instance, large instances have thousands
+INSTANCE_EMOJIS = 5000
+
+
+def git_revision() -> str:
+	try:
+		return subprocess.run(
+			["git", "rev-parse", "--short", "HEAD"],
+			cwd=os.path.dirname(os.path.abspath(__file__)),
+			capture_output=True, text=True, check=True
+		).stdout.strip()
+	except Exception:
+		return ""
+
+
+def measure(call, iterations: int) -> dict:
+	# warm up the template registry and whatever else gets cached on first use
+	html = call()
+
+	timings: list[int] = []
+	for _ in range(iterations):
+		start = time.perf_counter_ns()
+		call()
+		timings.append(time.perf_counter_ns() - start)
+
+	timings.sort()
+	total = sum(timings)
+
+	return {
+		"iterations": iterations,
+		"mean_us": total / iterations / 1000,
+		"median_us": statistics.median(timings) / 1000,
+		"p95_us": timings[min(iterations - 1, iterations * 95 // 100)] / 1000,
+		"min_us": timings[0] / 1000,
+		"max_us": timings[-1] / 1000,
+		"calls_per_second": iterations * 1e9 / total if total else 0.0,
+		"html_bytes": len(html),
+	}
+
+
+def main() -> int:
+	parser = argparse.ArgumentParser(description="Benchmark the mammudon HTML formatters")
+	parser.add_argument("--iterations", type=int, default=200, help="timed calls per case (default: 200)")
+	parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+	parser.add_argument("--theme", default="light")
+	parser.add_argument("--layout", default="default")
+	parser.add_argument("--output", default="-", help="JSON output file, - for stdout (default)")
+	args = parser.parse_args()
+
+	values = {"theme": args.theme, "layout": args.layout, "expand_spoilers": "1"}
+
+	benchmarks = []
+
+	with contextlib.redirect_stdout(io.StringIO()):
+		emoji_index = EmojiIndex(fixtures.custom_emojis(INSTANCE_EMOJIS))
+
+	for name, post, boosted_by in fixtures.statuses():
+		benchmarks.append(("format_post", name, lambda p=post, b=boosted_by: format_post(values, p, b, emoji_index)))
+
+	for name, notification in fixtures.notifications():
+		benchmarks.append(("format_notification", name, lambda n=notification: format_notification(values, MY_ID, n)))
+
+	for name, conversation in fixtures.conversations():
+		benchmarks.append(("format_conversation", name, lambda c=conversation: format_conversation(values, MY_ID, c)))
+
+	results: list[dict] = []
+	for formatter, name, call in benchmarks:
+		if args.filter not in formatter + "." + name:
+			continue
+
+		# the formatters print debug messages, keep them out of the measurements and the JSON output
+		with contextlib.redirect_stdout(io.StringIO()):
+			result = measure(call, args.iterations)
+
+		result["formatter"] = formatter
+		result["case"] = name
+		results.append(result)
+
+		print("%-20s %-26s %9.1f µs median %9.1f µs p95 %9.0f calls/s" % (
+			formatter, name, result["median_us"], result["p95_us"], result["calls_per_second"]
+		), file=sys.stderr)
+
+	# overall throughput per formatter, counting every case equally
+	totals: dict[str, dict] = {}
+	for result in results:
+		total = totals.setdefault(result["formatter"], {"cases": 0, "calls": 0, "seconds": 0.0})
+		total["cases"] += 1
+		total["calls"] += result["iterations"]
+		total["seconds"] += result["iterations"] * result["mean_us"] / 1e6
+
+	for total in totals.values():
+		total["calls_per_second"] = total["calls"] / total["seconds"] if total["seconds"] else 0.0
+
+	report = {
+		"meta": {
+			"date": datetime.datetime.now().astimezone().isoformat(timespec="seconds"),
+			"revision": git_revision(),
+			"python": platform.python_version(),
+			"platform": platform.platform(),
+			"theme": args.theme,
+			"layout": args.layout,
+			"instance_emojis": INSTANCE_EMOJIS,
+		},
+		"totals": totals,
+		"results": results,
+	}
+
+	if args.output == "-":
+		json.dump(report, sys.stdout, indent=2)
+		print()
+	else:
+		with open(args.output, "w") as file:
+			json.dump(report, file, indent=2)
+
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# measures how long it takes to build the widgets of the forms in mammudon.ui_forms.COMPILED_FORMS, once with
+# loadUi() parsing the .ui file like before, once with the compiled form from mammudon/forms/, runs on Qt's offscreen
+# platform, so it needs no display - forms with a QWebEngineView need a working web engine
+#
+# usage: python benchmarks/bench_forms.py [--iterations N] [--filter TEXT] [--output FILE]
+#
+# the JSON output has the same layout as bench_formatters.py, so compare.py works for it, too
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import time
+
+# allow running this script straight from a source checkout
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6 import QtCore
+from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.uic import loadUi
+
+from bench_formatters import git_revision
+from mammudon.ui_forms import COMPILED_FORMS, form_class, load_form, ui_file_name
+
+
+def build_with_load_ui(name: str) -> QWidget:
+	widget = QWidget()
+	loadUi(ui_file_name(name), widget)
+	return widget
+
+
+def build_compiled(name: str) -> QWidget:
+	widget = QWidget()
+	load_form(name, widget)
+	return widget
+
+
+def measure(build, name: str, iterations: int) -> dict:
+	# warm up, the first loadUi() imports the uic loader, the first compiled form imports its module
+	build(name)
+
+	timings: list[int] = []
+	for _ in range(iterations):
+		start = time.perf_counter_ns()
+		widget = build(name)
+		timings.append(time.perf_counter_ns() - start)
+		widget.deleteLater()
+
+	QApplication.processEvents()
+	timings.sort()
+
+	return {
+		"iterations": iterations,
+		"mean_us": sum(timings) / iterations / 1000,
+		"median_us": statistics.median(timings) / 1000,
+		"p95_us": timings[min(iterations - 1, iterations * 95 // 100)] / 1000,
+	}
+
+
+def main() -> int:
+	parser = argparse.ArgumentParser(description="Benchmark building the mammudon post and column widgets")
+	parser.add_argument("--iterations", type=int, default=200, help="timed widgets per case (default: 200)")
+	parser.add_argument("--filter", default="", help="only run forms whose name contains this text")
+	parser.add_argument("--output", default="-", help="JSON output file, - for stdout (default)")
+	args = parser.parse_args()
+
+	app = QApplication(sys.argv)
+
+	results: list[dict] = []
+	skipped: list[str] = []
+	for name in COMPILED_FORMS:
+		if args.filter not in name:
+			continue
+
+		# ui_forms prints debug messages when it falls back to loadUi, keep them out of the JSON output
+		with contextlib.redirect_stdout(io.StringIO()):
+			try:
+				compiled = form_class(name)
+				build_with_load_ui(name)
+			except Exception as e:
+				print(name, "can't be built here:", e, file=sys.stderr)
+				skipped.append(name)
+				continue
+
+		if not compiled:
+			print(name, "has no up-to-date compiled form, run \"python -m mammudon.ui_forms\"", file=sys.stderr)
+			skipped.append(name)
+			continue
+
+		for formatter, build in [("loadUi", build_with_load_ui), ("compiled", build_compiled)]:
+			result = measure(build, name, args.iterations)
+			result["formatter"] = formatter
+			result["case"] = name
+			results.append(result)
+
+			print("%-20s %-26s %9.1f µs median %9.1f µs p95" % (
+				formatter, name, result["median_us"], result["p95_us"]
+			), file=sys.stderr)
+
+	report = {
+		"meta": {
+			"revision": git_revision(),
+			"date": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+			"qt": QtCore.QT_VERSION_STR,
+			"platform": app.platformName(),
+		},
+		"results": results,
+		"skipped_forms": skipped,
+	}
+
+	if args.output == "-":
+		json.dump(report, sys.stdout, indent=2)
+		print()
+	else:
+		with open(args.output, "w") as file:
+			json.dump(report, file, indent=2)
+
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
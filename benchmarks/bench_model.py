@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# measures the TimelineModel without any widgets: adding a whole timeline of statuses in random order, with
+# replies arriving before and after their parents, and purging it down to half its length again, the time per
+# post should stay about the same for all timeline lengths
+#
+# usage: python benchmarks/bench_model.py [--iterations N] [--lengths N,N,...] [--output FILE]
+#
+# the JSON output has the same layout as bench_formatters.py, so compare.py works for it, too
+
+import argparse
+import copy
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+# allow running this script straight from a source checkout
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fixtures
+
+from bench_formatters import git_revision
+from mammudon.timeline_model import TimelineModel
+
+# part of the posts that are replies to an earlier post of the same timeline
+REPLY_RATIO = 0.3
+
+
+def timeline(length: int) -> list[dict]:
+	randomizer = random.Random(length)
+
+	posts: list[dict] = []
+	for post_id in range(1, length + 1):
+		in_reply_to_id = None
+		if post_id > 1 and randomizer.random() < REPLY_RATIO:
+			in_reply_to_id = randomizer.randrange(1, post_id)
+
+		posts.append(fixtures.status(post_id, in_reply_to_id=in_reply_to_id))
+
+	# streaming and reloading deliver posts in any order, so some replies come before their parents
+	randomizer.shuffle(posts)
+	return posts
+
+
+def measure(length: int, iterations: int) -> tuple[dict, dict]:
+	posts = timeline(length)
+
+	insert_timings: list[int] = []
+	purge_timings: list[int] = []
+	for _ in range(iterations):
+		# add_status() changes the dicts, so every run gets fresh ones
+		statuses = copy.deepcopy(posts)
+		model = TimelineModel(count_as_unread=True)
+
+		start = time.perf_counter_ns()
+		for status in statuses:
+			model.add_status(status)
+		insert_timings.append(time.perf_counter_ns() - start)
+
+		start = time.perf_counter_ns()
+		while len(model) > length // 2:
+			model.remove(model.oldest())
+		purge_timings.append(time.perf_counter_ns() - start)
+
+	return summary(insert_timings, length), summary(purge_timings, length - length // 2)
+
+
+def summary(timings: list[int], posts: int) -> dict:
+	timings.sort()
+
+	return {
+		"iterations": len(timings),
+		"posts": posts,
+		"mean_us": sum(timings) / len(timings) / 1000,
+		"median_us": statistics.median(timings) / 1000,
+		"p95_us": timings[min(len(timings) - 1, len(timings) * 95 // 100)] / 1000,
+		"median_us_per_post": statistics.median(timings) / 1000 / posts,
+	}
+
+
+def main() -> int:
+	parser = argparse.ArgumentParser(description="Benchmark the mammudon timeline model")
+	parser.add_argument("--iterations", type=int, default=5, help="timed runs per timeline length (default: 5)")
+	parser.add_argument("--lengths", default="500,1000,2000,5000", help="timeline lengths (default: 500,1000,2000,5000)")
+	parser.add_argument("--output", default="-", help="JSON output file, - for stdout (default)")
+	args = parser.parse_args()
+
+	results: list[dict] = []
+	for length in [int(length) for length in args.lengths.split(",")]:
+		for formatter, result in zip(["model_insert", "model_purge"], measure(length, args.iterations)):
+			result["formatter"] = formatter
+			result["case"] = str(length) + " posts"
+			results.append(result)
+
+			print("%-20s %-26s %9.1f µs median %9.2f µs per post" % (
+				formatter, result["case"], result["median_us"], result["median_us_per_post"]
+			), file=sys.stderr)
+
+	report = {
+		"meta": {
+			"revision": git_revision(),
+			"date": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+		},
+		"results": results,
+	}
+
+	if args.output == "-":
+		json.dump(report, sys.stdout, indent=2)
+		print()
+	else:
+		with open(args.output, "w") as file:
+			json.dump(report, file, indent=2)
+
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
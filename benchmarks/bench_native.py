@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# measures the native (QLabel) render path for all synthetic posts in fixtures.py that qualify for it: latency of
+# format_native_post() plus showing the result in a QLabel, and the memory each shown post costs, runs on Qt's
+# offscreen platform, so it needs no display - the web path needs a running web engine, see render_stats.py
+#
+# usage: python benchmarks/bench_native.py [--iterations N] [--posts N] [--filter TEXT] [--output FILE]
+#
+# the JSON output has the same layout as bench_formatters.py, so compare.py works for it, too
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import time
+
+# allow running this script straight from a source checkout
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6 import QtCore
+from PyQt6.QtWidgets import QApplication, QLabel
+
+import fixtures
+
+from bench_formatters import git_revision
+from mammudon.format_post import format_native_post
+from mammudon.render_stats import resident_memory
+
+
+def native_label(html: str) -> QLabel:
+	# same setup as PostView.native_view
+	label = QLabel()
+	label.setTextFormat(QtCore.Qt.TextFormat.RichText)
+	label.setWordWrap(True)
+	label.setMargin(8)
+	label.setTextInteractionFlags(QtCore.Qt.TextInteractionFlag.TextBrowserInteraction)
+	label.setText(html)
+	label.resize(400, label.heightForWidth(400))
+	return label
+
+
+def measure(values: dict, post: dict, boosted_by: dict, iterations: int, posts: int) -> dict:
+	# warm up the template registry and Qt's font cache
+	html = format_native_post(values, post, boosted_by)
+	native_label(html)
+
+	timings: list[int] = []
+	for _ in range(iterations):
+		start = time.perf_counter_ns()
+		native_label(format_native_post(values, post, boosted_by))
+		timings.append(time.perf_counter_ns() - start)
+
+	timings.sort()
+
+	# keep a timeline's worth of labels alive to see what each one costs
+	memory_before = resident_memory(os.getpid())
+	labels = [native_label(format_native_post(values, post, boosted_by)) for _ in range(posts)]
+	memory_after = resident_memory(os.getpid())
+	del labels
+
+	return {
+		"iterations": iterations,
+		"mean_us": sum(timings) / iterations / 1000,
+		"median_us": statistics.median(timings) / 1000,
+		"p95_us": timings[min(iterations - 1, iterations * 95 // 100)] / 1000,
+		"html_bytes": len(html),
+		"bytes_per_post": max(0, memory_after - memory_before) // posts,
+	}
+
+
+def main() -> int:
+	parser = argparse.ArgumentParser(description="Benchmark the mammudon native post render path")
+	parser.add_argument("--iterations", type=int, default=200, help="timed posts per case (default: 200)")
+	parser.add_argument("--posts", type=int, default=500, help="posts kept alive for the memory measurement (default: 500)")
+	parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+	parser.add_argument("--theme", default="light")
+	parser.add_argument("--layout", default="default")
+	parser.add_argument("--output", default="-", help="JSON output file, - for stdout (default)")
+	args = parser.parse_args()
+
+	app = QApplication(sys.argv)
+
+	values = {"theme": args.theme, "layout": args.layout, "expand_spoilers": "1"}
+
+	results: list[dict] = []
+	skipped: list[str] = []
+	for name, post, boosted_by in fixtures.statuses():
+		if args.filter not in name:
+			continue
+
+		# the formatters print debug messages, keep them out of the measurements and the JSON output
+		with contextlib.redirect_stdout(io.StringIO()):
+			if not format_native_post(values, post, boosted_by):
+				skipped.append(name)
+				continue
+
+			result = measure(values, post, boosted_by, args.iterations, args.posts)
+
+		result["formatter"] = "native_post"
+		result["case"] = name
+		results.append(result)
+
+		print("%-20s %-26s %9.1f µs median %9.1f µs p95 %9d bytes per post" % (
+			"native_post", name, result["median_us"], result["p95_us"], result["bytes_per_post"]
+		), file=sys.stderr)
+
+	print("needs the web path:", ", ".join(skipped), file=sys.stderr)
+
+	report = {
+		"meta": {
+			"revision": git_revision(),
+			"date": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+			"qt": QtCore.QT_VERSION_STR,
+			"platform": app.platformName(),
+			"theme": args.theme,
+			"layout": args.layout,
+		},
+		"results": results,
+		"web_path_cases": skipped,
+	}
+
+	if args.output == "-":
+		json.dump(report, sys.stdout, indent=2)
+		print()
+	else:
+		with open(args.output, "w") as file:
+			json.dump(report, file, indent=2)
+
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
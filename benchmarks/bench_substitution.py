@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# compares the old chain of str.replace() calls against the compiled Template.render()
+# when filling post.html for the demo status used by the preferences preview
+#
+# usage: python benchmarks/bench_substitution.py [iterations]
+
+import ast
+import os
+import sys
+import timeit
+
+# allow running this script straight from a source checkout
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mammudon.format_post import format_poll
+from mammudon.templates import Template, templates
+
+
+def load_demo(file_name: str) -> dict:
+	with open(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "mammudon", "res", file_name), 'r') as file:
+		return ast.literal_eval(file.read())
+
+
+def post_values(values: dict, post: dict, boosted_by: dict) -> dict[str, str]:
+	templates.select(values)
+
+	poll_html = format_poll(values, post["poll"])
+
+	return {
+		"theme_name": templates.theme_name,
+		"media_hover_css": "",
+		"boost": templates.layout("boosted_by.html").render(
+			boosted_by_url=boosted_by["url"],
+			boosted_by_avatar=boosted_by["avatar"],
+			boosted_by_acct=boosted_by["acct"],
+			boosted_by_display_name=boosted_by["display_name"],
+		),
+		"in_reply_to": "",
+		"post_account_url": post["account"]["url"],
+		"post_account_avatar": post["account"]["avatar"],
+		"post_id": str(post["id"]),
+		"post_account_display_name": post["account"]["display_name"],
+		"post_account_acct": post["account"]["acct"],
+		"spoiler_start": templates.layout("spoiler_start.html").render(spoiler_text=post["spoiler_text"], spoiler_open=" open"),
+		"post_content": post["content"],
+		"poll_content": poll_html,
+		"media_html": "",
+		"card_html": "",
+		"spoiler_end": templates.layout("spoiler_end.html").text,
+	}
+
+
+# the way format_post() filled post.html before Template was compiled into segments
+def replace_chain(text: str, values: dict[str, str]) -> str:
+	for slot, value in values.items():
+		text = text.replace("%" + slot + "%", value)
+	return text
+
+
+def main() -> int:
+	iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+	values = {"theme": "light", "layout": "default", "expand_spoilers": True}
+	post_values_dict = post_values(values, load_demo("demo_status.dict"), load_demo("demo_boosted_by.dict"))
+
+	post_text: str = templates.layout("post.html").text
+	post_template = Template(post_text)
+
+	# compile once per layout file in the registry, so measure it separately
+	compile_time = timeit.timeit(lambda: Template(post_text), number=iterations // 10) / (iterations // 10)
+	replace_time = min(timeit.repeat(lambda: replace_chain(post_text, post_values_dict), number=iterations, repeat=5)) / iterations
+	render_time = min(timeit.repeat(lambda: post_template.render(**post_values_dict), number=iterations, repeat=5)) / iterations
+
+	print("post.html, %d slots, %d bytes rendered" % (len(post_values_dict), len(post_template.render(**post_values_dict))))
+	print("compile once:    %8.2f µs" % (compile_time * 1e6))
+	print("replace() chain: %8.2f µs per post" % (replace_time * 1e6))
+	print("Template.render: %8.2f µs per post" % (render_time * 1e6))
+	print("speedup:         %8.2fx" % (replace_time / render_time))
+
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# compares two JSON reports written by bench_formatters.py, e.g. from before and after a commit
+#
+# usage: python benchmarks/compare.py before.json after.json [--threshold PERCENT]
+
+import argparse
+import json
+import sys
+
+
+def main() -> int:
+	parser = argparse.ArgumentParser(description="Compare two bench_formatters.py JSON reports")
+	parser.add_argument("before")
+	parser.add_argument("after")
+	parser.add_argument("--threshold", type=float, default=10.0, help="flag cases slower by more than this many percent (default: 10)")
+	args = parser.parse_args()
+
+	with open(args.before, "r") as file:
+		before = json.load(file)
+	with open(args.after, "r") as file:
+		after = json.load(file)
+
+	print("before:", before["meta"]["revision"] or "?", before["meta"]["date"])
+	print("after: ", after["meta"]["revision"] or "?", after["meta"]["date"])
+
+	before_results = {(result["formatter"], result["case"]): result for result in before["results"]}
+
+	regressions = 0
+	for result in after["results"]:
+		key = (result["formatter"], result["case"])
+		old = before_results.get(key)
+		if not old:
+			print("%-20s %-26s %9.1f µs median (new case)" % (key[0], key[1], result["median_us"]))
+			continue
+
+		change = (result["median_us"] - old["median_us"]) * 100 / old["median_us"]
+
+		marker = ""
+		if change > args.threshold:
+			marker = "  <-- slower"
+			regressions += 1
+
+		print("%-20s %-26s %9.1f -> %9.1f µs median %+7.1f%%%s" % (key[0], key[1], old["median_us"], result["median_us"], change, marker))
+
+	# non-zero exit code, so this can be used in scripts
+	return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,200 @@
+# synthetic status, notification and conversation dicts in all the shapes the formatters handle,
+# shaped like what Mastodon.py returns, but generated locally so benchmarks need no network
+
+import copy
+import datetime
+
+MEDIA_TYPES = ["image", "video", "gifv", "audio", "unknown"]
+CARD_TYPES = ["link", "rich", "video", "photo"]
+
+NOTIFICATION_TYPES = ["mention", "reblog", "favourite", "follow", "follow_request", "poll", "status", "update"]
+
+PARAGRAPH = (
+	'<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore '
+	'et dolore magna aliqua. <a href="https://example.social/tags/mammudon" class="mention hashtag" rel="tag">'
+	'#<span>mammudon</span></a> <span class="h-card"><a href="https://example.social/@someone" class="u-url mention">'
+	'@<span>someone</span></a></span> <a href="https://example.org/article?id=1&amp;page=2" target="_blank" '
+	'rel="nofollow noopener noreferrer"><span class="invisible">https://</span>example.org/article</a></p>'
+)
+
+
+def account(account_id: int, emojis: list[dict] | None = None) -> dict:
+	return {
+		"id": account_id,
+		"username": "user" + str(account_id),
+		"acct": "user" + str(account_id) + "@example.social",
+		"display_name": "User " + str(account_id) + (" :blobcat:" if emojis else ""),
+		"url": "https://example.social/@user" + str(account_id),
+		"avatar": "https://example.social/avatars/" + str(account_id) + ".png",
+		"emojis": emojis or [],
+	}
+
+
+def custom_emojis(count: int, prefix: str = "emoji") -> list[dict]:
+	return [
+		{
+			"shortcode": prefix + str(index),
+			"url": "https://example.social/emojis/" + prefix + str(index) + ".png",
+			"static_url": "https://example.social/emojis/" + prefix + str(index) + "_static.png",
+			"visible_in_picker": True,
+		}
+		for index in range(count)
+	]
+
+
+def media_attachment(media_type: str, index: int, with_preview: bool = True, with_description: bool = True) -> dict:
+	return {
+		"id": 1000 + index,
+		"type": media_type,
+		"url": "https://files.example.social/media/" + str(index) + "." + media_type,
+		"preview_url": "https://files.example.social/preview/" + str(index) + ".png" if with_preview else None,
+		"description": 'A "described" <image> & number ' + str(index) if with_description else None,
+		"meta": {
+			"small": {"width": 640, "height": 360 if index % 2 else 480, "aspect": 1.77 if index % 2 else 1.33},
+			"focus": {"x": 0.25 * (index % 3), "y": -0.1 * (index % 4)},
+		},
+	}
+
+
+def card(card_type: str, with_image: bool = True) -> dict:
+	return {
+		"url": "https://example.org/article/" + card_type,
+		"title": "An article about " + card_type + " cards",
+		"description": "This is what the " + card_type + " card looks like, with <special> & \"quoted\" characters.",
+		"type": card_type,
+		"image": "https://example.org/card.png" if with_image else None,
+		"language": "en",
+		"provider_name": "Example" if with_image else None,
+	}
+
+
+def poll(multiple: bool = False, voted: bool = False, expired: bool = False, options: int = 4) -> dict:
+	return {
+		"id": 4242,
+		"expires_at": datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc),
+		"expired": expired,
+		"multiple": multiple,
+		"votes_count": 100 * options,
+		"voters_count": 90 * options,
+		"voted": voted,
+		"own_votes": [1] if voted else [],
+		"options": [{"title": "Option number " + str(index), "votes_count": 37 * (index + 1)} for index in range(options)],
+		"emojis": [],
+	}
+
+
+def status(status_id: int, **kwargs) -> dict:
+	post = {
+		"id": status_id,
+		"created_at": datetime.datetime(2024, 1, 1, 12, 0, tzinfo=datetime.timezone.utc),
+		"edited_at": None,
+		"in_reply_to_id": None,
+		"in_reply_to_account_id": None,
+		"account": account(1),
+		"content": PARAGRAPH,
+		"spoiler_text": "",
+		"sensitive": False,
+		"media_attachments": [],
+		"mentions": [],
+		"emojis": [],
+		"card": None,
+		"poll": None,
+		"reblog": None,
+		"replies_count": 3,
+		"reblogs_count": 5,
+		"favourites_count": 8,
+	}
+	post.update(kwargs)
+	return post
+
+
+# list of (case name, status dict, boosted_by dict) for format_post()
+def statuses() -> list[tuple[str, dict, dict]]:
+	cases: list[tuple[str, dict, dict]] = [
+		("text", status(1), {}),
+		("text_long", status(2, content=PARAGRAPH * 8), {}),
+		("spoiler", status(3, spoiler_text="Spoiler about <things> & stuff", sensitive=True), {}),
+		("boost", status(4), account(2)),
+		("reply", status(
+			5, in_reply_to_id=1, in_reply_to_account_id=2,
+			mentions=[{"id": 2, "url": "https://example.social/@user2", "acct": "user2@example.social"}]
+		), {}),
+		("poll_single", status(6, poll=poll()), {}),
+		("poll_multiple", status(7, poll=poll(multiple=True)), {}),
+		("poll_voted", status(8, poll=poll(voted=True)), {}),
+		("poll_expired", status(9, poll=poll(expired=True)), {}),
+	]
+
+	status_id = 100
+	for media_type in MEDIA_TYPES:
+		for count in range(1, 5):
+			media = [media_attachment(media_type, index, with_description=bool(index % 2 == 0)) for index in range(count)]
+			cases.append(("media_" + media_type + "_" + str(count), status(status_id, media_attachments=media), {}))
+			status_id += 1
+
+	cases.append(("media_image_no_preview", status(status_id, media_attachments=[media_attachment("image", 0, with_preview=False)]), {}))
+	status_id += 1
+	cases.append(("media_audio_no_preview", status(status_id, media_attachments=[media_attachment("audio", 0, with_preview=False, with_description=False)]), {}))
+	status_id += 1
+
+	for card_type in CARD_TYPES:
+		for with_image in [True, False]:
+			cases.append(("card_" + card_type + ("_image" if with_image else ""), status(status_id, card=card(card_type, with_image)), {}))
+			status_id += 1
+
+	# lots of shortcodes in the content and the names, resolved from the post, the author, the booster and the instance
+	post_emojis = custom_emojis(20, "post")
+	content = PARAGRAPH + "<p>" + " ".join(":post" + str(index % 20) + ": :emoji" + str(index * 37) + ":" for index in range(60)) + "</p>"
+	cases.append(("emoji_heavy", status(
+		status_id, content=content, emojis=post_emojis, account=account(3, custom_emojis(5, "blobcat"))
+	), account(4, custom_emojis(5, "blobcat"))))
+	status_id += 1
+
+	cases.append(("everything", status(
+		status_id,
+		content=PARAGRAPH * 3 + "<p>:emoji1: :emoji2: :emoji3:</p>",
+		spoiler_text="Content warning",
+		sensitive=True,
+		media_attachments=[media_attachment("image", index) for index in range(4)],
+		poll=poll(multiple=True),
+		account=account(5, custom_emojis(2, "blobcat")),
+	), account(6)))
+
+	return cases
+
+
+# list of (case name, notification dict) for format_notification()
+def notifications() -> list[tuple[str, dict]]:
+	cases: list[tuple[str, dict]] = []
+
+	notification_id = 9000
+	for notification_type in NOTIFICATION_TYPES:
+		notification = {
+			"id": notification_id,
+			"type": notification_type,
+			"created_at": datetime.datetime(2024, 1, 1, 12, 0, tzinfo=datetime.timezone.utc),
+			"account": account(7),
+		}
+
+		if notification_type not in ["follow", "follow_request"]:
+			notification["status"] = status(notification_id, poll=poll(expired=True) if notification_type == "poll" else None)
+
+		cases.append((notification_type, notification))
+		notification_id += 1
+
+	# poll notifications for our own polls use a different template
+	own_poll = copy.deepcopy(cases[NOTIFICATION_TYPES.index("poll")][1])
+	own_poll["id"] = notification_id
+	own_poll["account"] = account(1)
+	cases.append(("poll_own", own_poll))
+
+	return cases
+
+
+# list of (case name, conversation dict) for format_conversation()
+def conversations() -> list[tuple[str, dict]]:
+	return [
+		("direct", {"id": 1, "unread": True, "accounts": [account(8)], "last_status": status(10)}),
+		("group", {"id": 2, "unread": False, "accounts": [account(8 + index) for index in range(6)], "last_status": status(11)}),
+		("no_status", {"id": 3, "unread": False, "accounts": [account(8)], "last_status": None}),
+	]
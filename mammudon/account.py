@@ -8,11 +8,25 @@ from PyQt6.QtWidgets import QWidget, QMessageBox
 from mastodon import Mastodon, CallbackStreamListener
 
 from mammudon.debugging import debug
+from mammudon.drain_scheduler import drain_scheduler
+from mammudon.emojis import EmojiIndex
+from mammudon.format_post import format_post, format_notification, format_conversation
+from mammudon.image_cache import image_cache
 from mammudon.listener import Listener
+from mammudon.memory_governor import memory_governor
+from mammudon.post_view_pool import post_view_pool
 from mammudon.prefs import preferences
+from mammudon.render_cache import RenderCache, post_fingerprint, notification_fingerprint, conversation_fingerprint
+from mammudon.render_stats import render_stats
+from mammudon.status_store import StatusStore
+from mammudon.web_profile import web_profile
 
 
 class ActionThread(QThread):
+	# signals
+	action_done = pyqtSignal(object, object)  # (action item, update dict), handled on the GUI thread
+	action_failed = pyqtSignal(object)  # action item
+
 	def __init__(self, mastodon: Mastodon, action_queue: list[dict]):
 		super().__init__()
 		self.mastodon = mastodon
@@ -29,7 +43,6 @@ class ActionThread(QThread):
 			try:
 				action: str = action_item["action"]
 				status_id: int = action_item["status_id"]
-				callback = action_item["callback"]
 
 				status: dict
 
@@ -39,7 +52,7 @@ class ActionThread(QThread):
 					else:
 						status = self.mastodon.status_unfavourite(status_id)
 
-					callback(status_id, {"action": "favourite", "result": status})
+					self.action_done.emit(action_item, {"action": "favourite", "result": status})
 
 				elif action == "bookmark":
 					if action_item["bookmarked"]:
@@ -47,45 +60,50 @@ class ActionThread(QThread):
 					else:
 						status = self.mastodon.status_unbookmark(status_id)
 
-					callback(status_id, {"action": "delete", "result": status})
+					self.action_done.emit(action_item, {"action": "bookmark", "result": status})
 
 				elif action == "delete":
 					status = self.mastodon.status_delete(status_id)
-					callback(status_id, {"action": "delete", "result": status})
+					self.action_done.emit(action_item, {"action": "delete", "result": status})
 
 				elif action == "mute":
 					if action_item["muted"]:
 						status = self.mastodon.status_mute(status_id)
 					else:
 						status = self.mastodon.status_unmute(status_id)
-					callback(status_id, {"action": "mute", "result": status})
+					self.action_done.emit(action_item, {"action": "mute", "result": status})
 
 				elif action == "boost":
 					if action_item["boosted"]:
 						status = self.mastodon.status_reblog(status_id)
 					else:
 						status = self.mastodon.status_unreblog(status_id)
-					callback(status_id, {"action": "boost", "result": status})
+					self.action_done.emit(action_item, {"action": "boost", "result": status})
 
 				elif action == "reload":
 					status: dict = self.mastodon.status(status_id)
-					callback(status_id, {"action": "reload", "result": status})
+					self.action_done.emit(action_item, {"action": "reload", "result": status})
 
 				elif action == "reload_notification":
 					notification: dict = self.mastodon.notifications(id=status_id)
 					debug(notification)
-					callback(status_id, {"action": "reload_notification", "result": notification})
+					self.action_done.emit(action_item, {"action": "reload_notification", "result": notification})
 
 				# TODO: conversations work differently (see https://mastodonpy.readthedocs.io/en/stable/02_return_values.html#conversation-dicts)
 				#       so this here probably just doesn't work yet
 				elif action == "reload_conversation":
 					conversation: list = self.mastodon.conversations(min_id=status_id, max_id=status_id)
-					callback(status_id, {"action": "reload_conversation", "result": conversation})
+					self.action_done.emit(action_item, {"action": "reload_conversation", "result": conversation})
 				else:
 					debug("unknown action item", action_item)
+
+					# let the status_store forget about it, or the same action would wait for this one forever
+					self.action_failed.emit(action_item)
 					breakpoint()
 
 			except Exception as e:
+				self.action_failed.emit(action_item)
+
 				str_args: list[str] = []
 				for x in e.args:
 					str_args.append(str(x))
@@ -118,6 +136,11 @@ class Account(QObject):
 		self.instance = {}
 		self.timelines: dict[str, dict[str, str | bool | QWidget | Listener]] = {}
 		self.custom_emojis: list[dict] = []
+		self.emoji_index: EmojiIndex = EmojiIndex()
+		# rendered HTML shared by all timelines of this account
+		self.render_cache: RenderCache = RenderCache()
+		# one copy of every status shown by the timelines of this account
+		self.status_store: StatusStore = StatusStore()
 		self.is_composing_post: QWidget | None = None
 
 		self.account_login = account_data.get("login", "")
@@ -223,6 +246,9 @@ class Account(QObject):
 
 		self.account_username = "@" + self.account["username"] + "@" + self.instance["uri"]
 		self.custom_emojis = self.mastodon.custom_emojis()
+		# build the shortcode lookup only once per login instead of walking the list for every post
+		self.emoji_index = EmojiIndex(self.custom_emojis)
+		self.render_cache.clear()
 
 		self.health_timer = QTimer()
 		self.health_timer.timeout.connect(self.health)
@@ -233,6 +259,9 @@ class Account(QObject):
 		self.login_status.emit("success")
 
 		self.action_thread: ActionThread = ActionThread(self.mastodon, self.action_queue)
+		self.action_thread.action_done.connect(self.on_action_done)
+		self.action_thread.action_failed.connect(self.on_action_failed)
+		self.action_thread.finished.connect(self.on_action_thread_finished)
 
 	def add_timeline(self, name: str, friendly_name: str, scroller: QWidget) -> None:
 		if name in self.timelines:
@@ -283,7 +312,34 @@ class Account(QObject):
 	def access_token(self) -> str:
 		return self.account_access_token
 
+	def format_post(self, post: dict, boosted_by: dict) -> str:
+		return self.render_cache.render(
+			post_fingerprint(preferences.values, post, boosted_by, self.emoji_index),
+			format_post, preferences.values, post, boosted_by, self.emoji_index
+		)
+
+	def format_notification(self, notification: dict) -> str:
+		return self.render_cache.render(
+			notification_fingerprint(preferences.values, notification),
+			format_notification, preferences.values, self.account["id"], notification
+		)
+
+	def format_conversation(self, conversation: dict) -> str:
+		return self.render_cache.render(
+			conversation_fingerprint(preferences.values, conversation),
+			format_conversation, preferences.values, self.account["id"], conversation
+		)
+
 	def health(self) -> None:
+		self.render_cache.log_stats(self.account_username)
+		self.status_store.log_stats(self.account_username)
+		post_view_pool.log_stats()
+		render_stats.log_stats()
+		web_profile.log_stats()
+		image_cache.log_stats()
+		memory_governor.log_stats()
+		drain_scheduler.log_stats()
+
 		try:
 			if self.mastodon.stream_healthy():
 				return
@@ -366,10 +422,45 @@ class Account(QObject):
 		for timeline_name in self.timelines:
 			self.remove_timeline(timeline_name)
 
+	# the same action on the same status, asked for by more than one timeline, only goes to the server once
+	@staticmethod
+	def action_key(action: dict) -> tuple:
+		return tuple(sorted((key, value) for key, value in action.items() if key != "callback"))
+
 	def status_action(self, action: dict) -> None:
+		if not self.status_store.request(self.action_key(action), action["callback"]):
+			return
+
 		self.action_queue.append(action)
 		self.action_thread.start()
 
+	# slot
+	def on_action_done(self, action: dict, update: dict) -> None:
+		result = update["result"]
+
+		if update["action"] == "delete":
+			self.status_store.delete(action["status_id"])
+
+		elif update["action"] in ["favourite", "bookmark", "mute", "boost", "reload"] and result:
+			# a boost comes back as the new status that boosts the original one
+			self.status_store.update(result.get("reblog", None) or result)
+
+		for callback in self.status_store.answer(self.action_key(action)):
+			callback(action["status_id"], update)
+
+	# slot
+	def on_action_failed(self, action: dict) -> None:
+		# let the next try go to the server again
+		self.status_store.answer(self.action_key(action))
+
+	# slot
+	def on_action_thread_finished(self) -> None:
+		# an action appended while the thread was leaving its loop did not get picked up, start() does nothing on
+		# a thread that is still running, so wait for it to be done for good and start it again
+		if self.action_queue:
+			self.action_thread.wait()
+			self.action_thread.start()
+
 	# TODO: move to ActionThread
 	def follow_account(self, account_id: object) -> None:
 		try:
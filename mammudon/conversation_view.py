@@ -9,14 +9,16 @@ from PyQt6.QtGui import QAction, QContextMenuEvent
 from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineSettings
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWidgets import QWidget, QMenu, QApplication
-from PyQt6.uic import loadUi
+
+from mammudon.ui_forms import load_form
+from mammudon.web_profile import web_profile
 
 
 # TODO: Why do we need a subclass for this to make installEventFilter work?
 class ConversationPage(QWebEnginePage):
 
 	def __init__(self, parent):
-		super(QWebEnginePage, self).__init__(parent)
+		super(QWebEnginePage, self).__init__(web_profile.profile(), parent)
 
 
 class ConversationView(QWidget):
@@ -29,7 +31,7 @@ class ConversationView(QWidget):
 
 		self.id = conversation_id
 
-		loadUi(os.path.join(os.path.dirname(__file__), "ui", "conversation_view.ui"), self)
+		load_form("conversation_view", self)
 
 		self.web_view: QWebEngineView = self.findChild(QWebEngineView, "conversationView")
 
@@ -4,14 +4,13 @@ import weakref
 import webbrowser
 
 from PyQt6.QtCore import pyqtSignal, QTimer
-from PyQt6.QtWidgets import QMessageBox, QApplication, QWidget
+from PyQt6.QtWidgets import QMessageBox, QWidget
 
 from mammudon.account import Account
 from mammudon.conversation_view import ConversationView
 from mammudon.debugging import debug
-from mammudon.format_post import format_conversation
+from mammudon.drain_scheduler import drain_scheduler
 from mammudon.listener import Listener
-from mammudon.prefs import preferences
 from mammudon.scroller import Scroller
 
 
@@ -60,11 +59,7 @@ class Conversations(Scroller):
 		# first timeline update shortly after creating the container, will be adjusted in the reload function
 		self.update_timer.start(1000)
 
-		# update the remaining time display on the reload button periodically
-		self.remaining_time_updater = QTimer()
-		self.remaining_time_updater.timeout.connect(self.remaining_time)
-		self.remaining_time_updater.setSingleShot(True)
-		# timer gets started in self.on_reload_button_clicked() first, and then in each self.remaining_time() call
+		# the remaining time display on the reload button gets updated periodically by the drain_scheduler
 
 	def __del__(self) -> None:
 		debug("__del__eting timeline", self.scroller_name, "of account", self.account.account_username)
@@ -120,7 +115,7 @@ class Conversations(Scroller):
 		if not conversation_view:
 			conversation_view = ConversationView(conversation_id=conversation_id)
 
-			conversation_html = format_conversation(preferences.values, self.my_id, conversation)
+			conversation_html = self.account.format_conversation(conversation)
 			conversation_view.set_html(conversation_html)
 
 			self.minimized.connect(conversation_view.minimized)
@@ -143,7 +138,7 @@ class Conversations(Scroller):
 
 		else:
 			# TODO: is there something else we need to do when we already know this conversation?
-			conversation_view.set_html(format_conversation(preferences.values, self.my_id, conversation))
+			conversation_view.set_html(self.account.format_conversation(conversation))
 
 		conversation_view.original_post = conversation
 
@@ -159,7 +154,7 @@ class Conversations(Scroller):
 				# first time loading or manual reload will pull in the whole timeline
 				# TODO: unsure if the same timeline length should be applied to conversations
 				timeline: list[dict] = self.mastodon.conversations(
-					limit=preferences.values["max_timeline_length"]
+					limit=self.timeline_length()
 				)
 			else:
 				# get the newest posts
@@ -168,7 +163,7 @@ class Conversations(Scroller):
 				# TODO: conversations work differently (see https://mastodonpy.readthedocs.io/en/stable/02_return_values.html#conversation-dicts)
 				#       so this here probably just doesn't work yet
 				timeline: list[dict] = self.mastodon.conversations(
-					limit=preferences.values["max_timeline_length"], since_id=self.newest_id
+					limit=self.timeline_length(), since_id=self.newest_id
 				)
 
 			if len(timeline):
@@ -193,7 +188,7 @@ class Conversations(Scroller):
 		self.update_timer.start(self.refresh_time)
 
 		# pull the queued posts into our timeline right after
-		self.remaining_time_updater.start(10)
+		drain_scheduler.countdown_soon(self)
 
 		self.full_reload = False
 
@@ -203,7 +198,6 @@ class Conversations(Scroller):
 			remaining_update_time = 0
 		self.reload_button.setText(str(remaining_update_time // 1000))
 		self.add_queued_conversations()
-		self.remaining_time_updater.start(5000)
 
 		# DEBUG: check if all deleted conversations really get freed from memory
 		# if self.deleted_posts:  # this is how it should be later without the debugging signature
@@ -241,17 +235,22 @@ class Conversations(Scroller):
 			# update the button, too
 			self.reload_button.setText(str(self.update_timer.remainingTime() // 1000))
 
+			# they all go in together with the next run of the event loop, see Scroller.insert_pending()
 			for conversation in insert_queue.values():
 				debug("adding queued conversation", conversation["id"], "in timeline", self.scroller_name)
-				self.add_post(conversation)
+				self.schedule_insert(conversation)
 				self.conversation_queue.pop(conversation["id"])
-				QApplication.instance().processEvents()
 
 		if len(self.conversation_queue):
 			debug("conversation queue not yet empty, probably a thread put something in it while we were adding ... will be in the next round - in timeline", self.scroller_name)
 		# else:
 		# 	debug("conversation queue empty, good! - in timeline", self.scroller_name)
 
+		# with conversations waiting to be inserted, inserts_done() purges once they are in
+		if not self.pending_inserts:
+			self.purge_conversations()
+
+	def inserts_done(self) -> None:
 		self.purge_conversations()
 
 	def connect_to_stream_listener(self, stream_name: str, stream_listener: Listener) -> None:
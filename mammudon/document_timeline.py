@@ -0,0 +1,388 @@
+# alternative to Timeline, which renders all posts of a timeline into a single web document instead
+# of using one PostView with its own QWebEngineView per post, selectable in the preferences
+
+import json
+import webbrowser
+
+from PyQt6 import QtCore
+from PyQt6.QtCore import QObject, QEvent, QUrl, QChildEvent
+from PyQt6.QtGui import QAction, QCursor, QMouseEvent
+from PyQt6.QtWebEngineCore import QWebEngineSettings
+from PyQt6.QtWebEngineWidgets import QWebEngineView
+from PyQt6.QtWidgets import QApplication, QMenu
+
+from mammudon.account import Account
+from mammudon.debugging import debug
+from mammudon.fragments import post_body
+from mammudon.image_browser import ImageBrowser
+from mammudon.media_playback import MediaPlayback
+from mammudon.memory_governor import STATUS_OVERHEAD
+from mammudon.model_timeline import ModelTimeline
+from mammudon.prefs import preferences
+from mammudon.status_post import PostPage
+from mammudon.templates import templates
+from mammudon.timeline_model import PostRecord
+
+
+class DocumentTimeline(ModelTimeline):
+
+	# the document shows every post from its formatted HTML
+	native_posts = False
+
+	def __init__(
+			self,
+			account: Account,
+			name: str,
+			friendly_name: str):
+
+		super().__init__(account, name, friendly_name)
+
+		# the model's records keep the formatted post documents, to rebuild the post's HTML when the counters
+		# change, this is the HTML of each post as it was last sent to the document, to skip updates that change nothing
+		self.post_html: dict[int, str] = {}
+
+		# JavaScript calls that came in while the document was still loading
+		self.page_loaded = False
+		self.pending_scripts: list[str] = []
+
+		self.image_browser: ImageBrowser | None = None
+		self.media_playback: MediaPlayback | None = None
+		self.menus: QMenu | None = None
+
+		# the document scrolls by itself
+		self.scroll_area.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+
+		self.web_view = QWebEngineView(self.timeline_view)
+		self.web_page = PostPage(self.web_view)
+		self.web_view.setPage(self.web_page)
+		self.web_view.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.NoContextMenu)
+		self.web_page.settings().setAttribute(QWebEngineSettings.WebAttribute.PlaybackRequiresUserGesture, False)
+
+		self.timeline_view.layout().addWidget(self.web_view)
+
+		# catch mouse clicks on the document to mark posts read, see PostView for how this works
+		self.web_view.installEventFilter(self)
+
+		# connect signals
+		self.web_page.loadFinished.connect(self.on_load_finished)
+		self.web_page.link_clicked.connect(self.link_clicked)
+
+		templates.select(preferences.values)
+		self.web_page.setHtml(templates.layout("timeline.html").render(theme_name=templates.theme_name))
+
+	def __del__(self) -> None:
+		debug("__del__eting document timeline", self.scroller_name, "of account", self.account.account_username)
+
+	def eventFilter(self, o: QObject, e: QEvent) -> bool:
+		if o is self.timeline_icon_widget:
+			# catch mouse clicks on the timeline icon to jump to next unread post
+			if e.type() == QEvent.Type.MouseButtonRelease:
+				self.run_script("scrollToNextUnread();")
+			return False
+
+		# the page doesn't notice when the whole timeline gets hidden or shown, so tell it
+		if o is self.web_view:
+			if e.type() == QEvent.Type.Hide:
+				self.run_script("pauseMedia(document);")
+			elif e.type() == QEvent.Type.Show:
+				self.run_script("resumeVisibleMedia();")
+
+		# the QWebEngineView gets a new focus proxy child that receives the actual mouse clicks
+		if e.type() == QEvent.Type.ChildAdded:
+			e: QChildEvent
+			e.child().installEventFilter(self)
+			return False
+
+		if e.type() == QEvent.Type.MouseButtonPress:
+			e: QMouseEvent
+			position = e.position()
+			self.web_page.runJavaScript("readPostAt(" + str(position.x()) + ", " + str(position.y()) + ");", self.read_callback)
+			return False
+
+		# pass on any event we are not interested in
+		return False
+
+	def on_load_finished(self, ok: bool) -> None:
+		if not ok:
+			debug("could not load timeline document for", self.friendly_name)
+			return
+
+		self.page_loaded = True
+
+		for script in self.pending_scripts:
+			self.web_page.runJavaScript(script)
+		self.pending_scripts = []
+
+	def run_script(self, script: str) -> None:
+		if not self.page_loaded:
+			self.pending_scripts.append(script)
+			return
+
+		self.web_page.runJavaScript(script)
+
+	def read_callback(self, post_id: str) -> None:
+		if post_id:
+			self.set_read(int(post_id))
+
+	def set_read(self, post_id: int) -> None:
+		record = self.model.record(post_id)
+		if not record or not record.unread:
+			return
+
+		# the model takes it off the unread counter
+		self.model.set_unread(post_id, False)
+		self.run_script("markRead(" + json.dumps(str(post_id)) + ");")
+
+	def render_post(self, record: PostRecord) -> str:
+		post = record.post
+		body, media_hover_css = post_body(record.post_html, "post-" + str(post["id"]))
+
+		templates.select(preferences.values)
+		return templates.layout("timeline_post.html").render(
+			unread=" timeline-post-unread" if record.unread and self.count_as_unread else "",
+			post_id=str(post["id"]),
+			sort_id=str(post["mammudon_sort_id"]),
+			media_hover_css=media_hover_css,
+			post_body=body,
+			reply_count=str(post["replies_count"]),
+			boost_count=str(post["reblogs_count"]),
+			favourite_count=str(post["favourites_count"]),
+			# streaming posts don't provide these, so guard against NoneType
+			boosted=" timeline-action-active" if post.get("reblogged", False) else "",
+			favourited=" timeline-action-active" if post.get("favourited", False) else "",
+			bookmarked=" timeline-action-active" if post.get("bookmarked", False) else "",
+		)
+
+	def show_post(self, record: PostRecord, _content_changed: bool) -> None:
+		self.update_post(record)
+
+	# (re-)send the post to the document, if anything changed
+	def update_post(self, record: PostRecord) -> None:
+		post = record.post
+
+		html = self.render_post(record)
+		if self.post_html.get(post["id"]) == html:
+			return
+
+		self.post_html[post["id"]] = html
+
+		self.run_script(
+			"insertPost(" + json.dumps(str(post["id"])) + ", " + json.dumps(str(post["mammudon_sort_id"])) + ", " + json.dumps(html) + ");"
+		)
+
+	# slot, the model took it off the unread counter already
+	def on_post_removed(self, post_id: int, _record: PostRecord) -> None:
+		self.post_html.pop(post_id, None)
+		self.run_script("removePost(" + json.dumps(str(post_id)) + ");")
+
+	# slot, the document doesn't show the edit history, so there is no need to fetch it
+	def on_post_updated(self, _post_id: int, _content_changed: bool) -> None:
+		pass
+
+	def application_minimized(self) -> None:
+		self.run_script("pauseMedia(document);")
+		super().application_minimized()
+
+	# the whole timeline is a single page, the HTML of the posts lives inside of it
+	def memory_usage(self) -> dict[str, int]:
+		return {
+			"pages": 1,
+			"html": 0,
+			"statuses": sum(len(record.post["content"]) + STATUS_OVERHEAD for record in self.model.records.values()),
+		}
+
+	def find_post_by_poll(self, poll_id: str) -> dict | None:
+		for record in self.model.records.values():
+			post = record.post
+			if post["poll"] and str(post["poll"]["id"]) == poll_id:
+				return post
+		return None
+
+	def find_post_by_media(self, media_url: str) -> dict | None:
+		for record in self.model.records.values():
+			post = record.post
+			for attachment in post.get("media_attachments", []):
+				if attachment["url"] == media_url:
+					return post
+		return None
+
+	def link_clicked(self, qurl: QUrl) -> None:
+		scheme = qurl.scheme()
+		url = qurl.toString()
+
+		# one of our action links underneath a post was clicked
+		if scheme == "mammudon-action":
+			# mammudon-action://action/post_id
+			self.post_action(qurl.host(), int(qurl.path()[1:]))
+			return
+
+		# a link with regard to a poll function was clicked
+		if scheme == "poll":
+			# poll://subcommand/poll_id
+			poll_id = qurl.path()[1:]  # skip leading "/"
+
+			post = self.find_post_by_poll(poll_id)
+			if not post:
+				debug("poll", poll_id, "not found in timeline", self.scroller_name)
+				return
+
+			self.set_read(post["id"])
+
+			if qurl.host() == "vote":
+				# gather all checked options of this post's poll and send them to vote_callback()
+				self.web_page.runJavaScript(
+					"pollVotes(" + json.dumps(str(post["id"])) + ");",
+					lambda voted_options: self.vote_callback(post["id"], poll_id, voted_options)
+				)
+			elif qurl.host() == "refresh":
+				self.refresh_poll(post["id"])
+			elif qurl.host() == "results":
+				# TODO: allow showing poll results and switching back to voting
+				debug(poll_id, post["id"])
+			else:
+				debug("unknown poll subcommand:", qurl.host(), qurl)
+
+			return
+
+		# an image was clicked
+		if scheme == "media-image":
+			if self.image_browser:
+				self.image_browser.close()
+				return
+
+			post = self.find_post_by_media(url.split(":", 1)[1])
+			if post:
+				media: list[str] = []
+
+				attachment: dict
+				for attachment in post["media_attachments"]:
+					media.append(attachment["url"])
+
+				self.set_read(post["id"])
+
+				self.image_browser = ImageBrowser(media, media.index(url.split(":", 1)[1]))
+				self.image_browser.closed.connect(self.on_image_browser_closed)
+				self.image_browser.show()
+
+			return
+
+		# a video or gifv was clicked
+		if scheme == "media-video" or scheme == "media-gifv":
+			if self.media_playback:
+				self.media_playback.close()
+				return
+
+			self.web_page.runJavaScript("v = document.getElementsByTagName('video'); for(p of v) { p.pause(); }")
+			self.media_playback = MediaPlayback(url.split(":", 1)[1])
+			self.media_playback.closed.connect(self.on_media_playback_closed)
+			self.media_playback.show()
+			return
+
+		# account image or name, boosting account or @mention clicked
+		for record in self.model.records.values():
+			post = record.post
+			if url == post["account"]["url"]:
+				self.open_account_profile(post["account"]["id"])
+				return
+
+			if url == post.get("mammudon_boosted_by_url"):
+				self.open_account_profile(post["mammudon_boosted_by_id"])
+				return
+
+			for mention in post["mentions"]:
+				if mention["url"] == url:
+					self.open_account_profile(mention["id"])
+					return
+
+			# check if a #hashtag was clicked
+			for tag in post.get("tags", []):
+				if tag["url"] == url:
+					debug("hashtag", "#" + tag["name"])
+					return
+
+		# remove our custom media-...: scheme if present to allow
+		# the web browser to open the url - this can be removed once
+		# all media-...: links are handled by us
+		if scheme.startswith("media-"):
+			debug(scheme, qurl)
+			url = url.replace(scheme + ":", "")
+
+		# if all else fails, send this link to the system web browser
+		debug(url)
+		webbrowser.open(url)
+
+	def post_action(self, action: str, post_id: int) -> None:
+		record = self.model.record(post_id)
+		if not record:
+			debug("action", action, "for unknown post", post_id, "in timeline", self.scroller_name)
+			return
+
+		post = record.post
+		self.set_read(post_id)
+
+		if action == "reply":
+			self.reply_to_post.emit(post, True)
+
+		# TODO: boost with visibility
+		elif action == "boost":
+			self.send_status_action(post_id, "boost", boosted=not post.get("reblogged", False))
+
+		elif action == "favourite":
+			self.send_status_action(post_id, "favourite", favourited=not post.get("favourited", False))
+
+		elif action == "bookmark":
+			self.send_status_action(post_id, "bookmark", bookmarked=not post.get("bookmarked", False))
+
+		elif action == "menu":
+			self.show_post_menu(post)
+
+		else:
+			debug("unknown post action", action, "for post", post_id)
+
+	def show_post_menu(self, post: dict) -> None:
+		self.menus = QMenu()
+
+		# this is a post that the user sent themselves, so add a few more functions
+		if post["account"]["id"] == self.my_id:
+			# TODO: ask for confirmation
+			action_delete: QAction = self.menus.addAction("Delete")
+			action_delete.triggered.connect(lambda: self.send_status_action(post["id"], "delete"))
+
+			action_mute: QAction = self.menus.addAction("Mute Conversation")
+			action_mute.setCheckable(True)
+			action_mute.setChecked(post.get("muted", False))
+			action_mute.triggered.connect(lambda checked: self.send_status_action(post["id"], "mute", muted=checked))
+
+		action_copy_link: QAction = self.menus.addAction("Copy Link")
+		action_copy_link.triggered.connect(lambda: QApplication.clipboard().setText(post["url"]))
+
+		action_browser: QAction = self.menus.addAction("Open in Browser")
+		action_browser.triggered.connect(lambda: self.in_browser(post))
+
+		action_reload: QAction = self.menus.addAction("Reload")
+		action_reload.triggered.connect(lambda: self.send_status_action(post["id"], "reload"))
+
+		self.menus.popup(QCursor.pos())
+
+	def vote_callback(self, post_id: int, poll_id: str, voted_options: list[int]) -> None:
+		# do not send empty votes
+		if not voted_options:
+			return
+
+		self.vote_in_poll(post_id, poll_id, voted_options)
+
+	def on_image_browser_closed(self) -> None:
+		self.image_browser = None
+
+	def on_media_playback_closed(self) -> None:
+		self.media_playback = None
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
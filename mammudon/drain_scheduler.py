@@ -0,0 +1,166 @@
+import time
+
+from PyQt6.QtCore import QTimer
+
+from mammudon.debugging import debug
+
+# milliseconds between two runs of the columns' remaining_time(), which updates the reload button countdown and
+# pulls the queued posts in
+COUNTDOWN_INTERVAL = 5000
+
+# milliseconds to wait after a reload before the queued posts get pulled in
+COUNTDOWN_SOON = 10
+
+# milliseconds between two slices of inserting pending posts, about one frame
+FRAME_INTERVAL = 16
+
+# milliseconds of each frame all columns together may spend inserting posts, leaves the rest of the frame for
+# layout and painting, the columns the user looks at get their turn first
+FRAME_BUDGET = 10
+
+
+# one scheduler for all columns of all accounts: runs the reload button countdowns of all columns together, and
+# inserts the posts waiting in the columns in small slices, one per frame, within a shared time budget, so ten
+# columns reloading at once don't freeze the window, the focused column goes first, then the visible ones
+class DrainScheduler:
+	def __init__(self):
+		# all columns by id(), Scroller can't be put in a set or used as a key, see its __eq__()
+		self.scrollers: dict[int, object] = {}
+
+		# id() of the column the mouse was in last
+		self.focused = 0
+
+		# columns that reloaded and want their queued posts pulled in right away, by id(), see countdown_soon()
+		self.due: dict[int, object] = {}
+
+		# created on first use, QTimer needs a running QApplication
+		self.countdown_timer: QTimer | None = None
+		self.soon_timer: QTimer | None = None
+		self.frame_timer: QTimer | None = None
+
+		self.frames = 0
+		self.inserted = 0
+		self.over_budget = 0
+
+	def timers(self) -> None:
+		if self.countdown_timer:
+			return
+
+		self.countdown_timer = QTimer()
+		self.countdown_timer.timeout.connect(self.countdown)
+		self.countdown_timer.setSingleShot(True)
+		self.countdown_timer.start(COUNTDOWN_INTERVAL)
+
+		self.soon_timer = QTimer()
+		self.soon_timer.timeout.connect(self.countdown_due)
+		self.soon_timer.setSingleShot(True)
+
+		self.frame_timer = QTimer()
+		self.frame_timer.timeout.connect(self.drain)
+		self.frame_timer.setSingleShot(True)
+
+	def add_scroller(self, scroller) -> None:
+		self.timers()
+		self.scrollers[id(scroller)] = scroller
+
+	def remove_scroller(self, scroller) -> None:
+		self.scrollers.pop(id(scroller), None)
+		self.due.pop(id(scroller), None)
+
+		if self.focused == id(scroller):
+			self.focused = 0
+
+	def set_focused(self, scroller) -> None:
+		self.focused = id(scroller)
+
+	# a column reloaded, so run its countdown right away to pull its queued posts in, only this column's, the others
+	# keep waiting for the shared countdown, or all columns would insert their queues along with every reload
+	def countdown_soon(self, scroller) -> None:
+		self.timers()
+		self.due[id(scroller)] = scroller
+
+		if not self.soon_timer.isActive():
+			self.soon_timer.start(COUNTDOWN_SOON)
+
+	def countdown_due(self) -> None:
+		due = list(self.due.values())
+		self.due.clear()
+
+		for scroller in due:
+			scroller.remaining_time()
+
+	def countdown(self) -> None:
+		# the shared countdown pulls in the queues of the due columns, too
+		self.due.clear()
+
+		for scroller in list(self.scrollers.values()):
+			scroller.remaining_time()
+
+		self.countdown_timer.start(COUNTDOWN_INTERVAL)
+
+	# a column has posts waiting to be inserted
+	def wake(self) -> None:
+		self.timers()
+
+		# the first slice goes in with the next run of the event loop, the following ones one frame apart
+		if not self.frame_timer.isActive():
+			self.frame_timer.start(0)
+
+	# focused column first, then the visible ones, then the ones scrolled out of view or hidden
+	def waiting_scrollers(self) -> list:
+		waiting = [
+			(key != self.focused, not scroller.is_on_screen(), scroller)
+			for key, scroller in self.scrollers.items() if scroller.pending_inserts
+		]
+		waiting.sort(key=lambda entry: entry[:2])
+
+		return [scroller for _focused, _hidden, scroller in waiting]
+
+	def drain(self) -> None:
+		start = time.perf_counter()
+		self.frames += 1
+
+		for scroller in self.waiting_scrollers():
+			budget = FRAME_BUDGET - (time.perf_counter() - start) * 1000
+
+			# every column inserts at least one post per frame, so none of them starves
+			self.inserted += scroller.insert_pending(max(0.0, budget))
+
+		elapsed = (time.perf_counter() - start) * 1000
+		if elapsed > FRAME_BUDGET * 2:
+			self.over_budget += 1
+			debug("inserting posts took", int(elapsed), "ms, frame budget is", FRAME_BUDGET, "ms")
+
+		if any(scroller.pending_inserts for scroller in self.scrollers.values()):
+			self.frame_timer.start(FRAME_INTERVAL)
+
+	def stats(self) -> dict[str, int]:
+		return {
+			"columns": len(self.scrollers),
+			"waiting": sum(len(scroller.pending_inserts) for scroller in self.scrollers.values()),
+			"frames": self.frames,
+			"inserted": self.inserted,
+			"over_budget": self.over_budget,
+		}
+
+	def log_stats(self) -> None:
+		stats = self.stats()
+
+		debug(
+			"drain scheduler:", stats["inserted"], "posts inserted in", stats["frames"], "frames,",
+			stats["over_budget"], "frames over budget,", stats["waiting"], "posts waiting in", stats["columns"], "columns"
+		)
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
+
+
+# offer global "drain_scheduler" to all other modules
+drain_scheduler = DrainScheduler()
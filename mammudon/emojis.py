@@ -0,0 +1,71 @@
+import re
+from html import escape
+
+from mammudon.debugging import debug
+from mammudon.image_cache import image_url
+
+
+class EmojiIndex:
+	# :shortcode: tokens as used by mastodon, shortcodes are letters, digits and underscores only
+	shortcode_pattern = re.compile(r":([a-zA-Z0-9_]+):")
+
+	def __init__(self, custom_emojis: list[dict] | None = None):
+		# shortcode -> finished <img> tag, so looking up a match is all that's left to do per post
+		self.emojis: dict[str, str] = {}
+
+		# changes whenever emojis get added, so rendered posts can tell if they are outdated
+		self.version = 0
+
+		if custom_emojis:
+			self.add(custom_emojis)
+
+	@staticmethod
+	def emoji_html(emoji: dict) -> str:
+		# the title uses &#58; instead of ":" so the shortcode inside can never be matched again
+		return '<img class="custom-emoji" title="&#58;' + emoji["shortcode"] + '&#58;" src="' + escape(image_url("emoji", emoji["url"])) + '">'
+
+	def add(self, custom_emojis: list[dict]) -> None:
+		emoji: dict
+		for emoji in custom_emojis:
+			self.emojis[emoji["shortcode"]] = self.emoji_html(emoji)
+
+		self.version += 1
+
+		debug("emoji index now has", len(self.emojis), "custom emojis")
+
+	# replace all known :shortcode: tokens in a single scan, emoji lists passed in from the status itself
+	# (author, post, poll, booster) take precedence over the instance emojis, unknown shortcodes stay as they are
+	def replace(self, html: str, *emoji_lists: list[dict]) -> str:
+		emojis: dict[str, str] = self.emojis
+
+		# only build a local lookup table when the status brings its own emojis
+		local_emojis: dict[str, str] = {}
+		for emoji_list in emoji_lists:
+			emoji: dict
+			for emoji in emoji_list or []:
+				local_emojis.setdefault(emoji["shortcode"], self.emoji_html(emoji))
+
+		if not emojis and not local_emojis:
+			return html
+
+		def lookup(match: re.Match) -> str:
+			shortcode = match.group(1)
+			emoji_html = local_emojis.get(shortcode)
+			if emoji_html is None:
+				emoji_html = emojis.get(shortcode)
+				if emoji_html is None:
+					return match.group(0)
+
+			return emoji_html
+
+		return self.shortcode_pattern.sub(lookup, html)
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
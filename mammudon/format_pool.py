@@ -0,0 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
+
+# formatting posts into HTML does not need any widgets, so it runs in these worker threads and
+# the GUI thread only gets the finished HTML handed back to put into the views
+# NOTE: format_post() is pure python and holds the GIL, so more workers would not format faster,
+#       two are enough to keep the GUI thread from waiting on a whole batch of posts
+format_pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="format_pool")
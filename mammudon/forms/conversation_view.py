@@ -0,0 +1,65 @@
+# Form implementation generated from reading ui file 'mammudon/ui/conversation_view.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_ConversationView(object):
+	def setupUi(self, ConversationView):
+		ConversationView.setObjectName("ConversationView")
+		ConversationView.resize(315, 67)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(ConversationView.sizePolicy().hasHeightForWidth())
+		ConversationView.setSizePolicy(sizePolicy)
+		ConversationView.setMinimumSize(QtCore.QSize(0, 0))
+		ConversationView.setMaximumSize(QtCore.QSize(16777215, 16777215))
+		self.horizontalLayout = QtWidgets.QHBoxLayout(ConversationView)
+		self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+		self.horizontalLayout.setSpacing(2)
+		self.horizontalLayout.setObjectName("horizontalLayout")
+		self.conversationView = QtWebEngineWidgets.QWebEngineView(parent=ConversationView)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.MinimumExpanding)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(16)
+		sizePolicy.setHeightForWidth(self.conversationView.sizePolicy().hasHeightForWidth())
+		self.conversationView.setSizePolicy(sizePolicy)
+		self.conversationView.setMinimumSize(QtCore.QSize(0, 48))
+		self.conversationView.setMaximumSize(QtCore.QSize(16777215, 16777215))
+		self.conversationView.setAcceptDrops(False)
+		self.conversationView.setUrl(QtCore.QUrl("about:blank"))
+		self.conversationView.setObjectName("conversationView")
+		self.horizontalLayout.addWidget(self.conversationView)
+		self.debugCopyRaw = QtGui.QAction(parent=ConversationView)
+		self.debugCopyRaw.setMenuRole(QtGui.QAction.MenuRole.NoRole)
+		self.debugCopyRaw.setObjectName("debugCopyRaw")
+		self.debugCopyHtml = QtGui.QAction(parent=ConversationView)
+		self.debugCopyHtml.setMenuRole(QtGui.QAction.MenuRole.NoRole)
+		self.debugCopyHtml.setObjectName("debugCopyHtml")
+		self.conversationActionReload = QtGui.QAction(parent=ConversationView)
+		icon = QtGui.QIcon()
+		icon.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/reload.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+		self.conversationActionReload.setIcon(icon)
+		self.conversationActionReload.setMenuRole(QtGui.QAction.MenuRole.NoRole)
+		self.conversationActionReload.setObjectName("conversationActionReload")
+
+		self.retranslateUi(ConversationView)
+		QtCore.QMetaObject.connectSlotsByName(ConversationView)
+
+	def retranslateUi(self, ConversationView):
+		_translate = QtCore.QCoreApplication.translate
+		ConversationView.setWindowTitle(_translate("ConversationView", "Conversation View"))
+		self.debugCopyRaw.setText(_translate("ConversationView", "Copy Raw Post"))
+		self.debugCopyHtml.setText(_translate("ConversationView", "Copy HTML Source"))
+		self.conversationActionReload.setText(_translate("ConversationView", "Reload Conversation"))
+from PyQt6 import QtWebEngineWidgets
+
+
+FORM_CLASS = "Ui_ConversationView"
+UI_HASH = "73c0a49d4b28697dde0a68d35dcca4e89c5d0c2e"
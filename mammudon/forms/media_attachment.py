@@ -0,0 +1,243 @@
+# Form implementation generated from reading ui file 'mammudon/ui/media_attachment.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MediaAttachment(object):
+	def setupUi(self, MediaAttachment):
+		MediaAttachment.setObjectName("MediaAttachment")
+		MediaAttachment.resize(294, 121)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.MinimumExpanding, QtWidgets.QSizePolicy.Policy.Expanding)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(MediaAttachment.sizePolicy().hasHeightForWidth())
+		MediaAttachment.setSizePolicy(sizePolicy)
+		MediaAttachment.setMinimumSize(QtCore.QSize(48, 48))
+		palette = QtGui.QPalette()
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Base, brush)
+		brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Window, brush)
+		brush = QtGui.QBrush(QtGui.QColor(251, 251, 251))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Base, brush)
+		brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Window, brush)
+		brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Base, brush)
+		brush = QtGui.QBrush(QtGui.QColor(0, 0, 0))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Window, brush)
+		MediaAttachment.setPalette(palette)
+		MediaAttachment.setToolTip("")
+		MediaAttachment.setAutoFillBackground(True)
+		self.verticalLayout = QtWidgets.QVBoxLayout(MediaAttachment)
+		self.verticalLayout.setObjectName("verticalLayout")
+		self.editDeleteHBox = QtWidgets.QHBoxLayout()
+		self.editDeleteHBox.setSpacing(2)
+		self.editDeleteHBox.setObjectName("editDeleteHBox")
+		self.deleteButton = QtWidgets.QPushButton(parent=MediaAttachment)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.deleteButton.sizePolicy().hasHeightForWidth())
+		self.deleteButton.setSizePolicy(sizePolicy)
+		self.deleteButton.setMinimumSize(QtCore.QSize(0, 0))
+		self.deleteButton.setMaximumSize(QtCore.QSize(32, 32))
+		palette = QtGui.QPalette()
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.WindowText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 64))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Button, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Text, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.ButtonText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255, 128))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.PlaceholderText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.WindowText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 64))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Button, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Text, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.ButtonText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255, 128))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.PlaceholderText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(145, 145, 144))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.WindowText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 64))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Button, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Text, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.ButtonText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255, 128))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.PlaceholderText, brush)
+		self.deleteButton.setPalette(palette)
+		font = QtGui.QFont()
+		font.setPointSize(16)
+		font.setBold(True)
+		self.deleteButton.setFont(font)
+		self.deleteButton.setAutoFillBackground(True)
+		self.deleteButton.setStyleSheet("color: white")
+		self.deleteButton.setFlat(True)
+		self.deleteButton.setObjectName("deleteButton")
+		self.editDeleteHBox.addWidget(self.deleteButton)
+		spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+		self.editDeleteHBox.addItem(spacerItem)
+		self.editButton = QtWidgets.QPushButton(parent=MediaAttachment)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.editButton.sizePolicy().hasHeightForWidth())
+		self.editButton.setSizePolicy(sizePolicy)
+		self.editButton.setMaximumSize(QtCore.QSize(32, 32))
+		palette = QtGui.QPalette()
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.WindowText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 64))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Button, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Text, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.ButtonText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255, 128))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.PlaceholderText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.WindowText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 64))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Button, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Text, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.ButtonText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255, 128))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.PlaceholderText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(145, 145, 144))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.WindowText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 64))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Button, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Text, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.ButtonText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255, 128))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.PlaceholderText, brush)
+		self.editButton.setPalette(palette)
+		font = QtGui.QFont()
+		font.setPointSize(16)
+		font.setBold(True)
+		self.editButton.setFont(font)
+		self.editButton.setAutoFillBackground(True)
+		self.editButton.setStyleSheet("color: white")
+		self.editButton.setFlat(True)
+		self.editButton.setObjectName("editButton")
+		self.editDeleteHBox.addWidget(self.editButton)
+		self.verticalLayout.addLayout(self.editDeleteHBox)
+		spacerItem1 = QtWidgets.QSpacerItem(177, 28, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+		self.verticalLayout.addItem(spacerItem1)
+		self.descriptionLabel = QtWidgets.QLabel(parent=MediaAttachment)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.descriptionLabel.sizePolicy().hasHeightForWidth())
+		self.descriptionLabel.setSizePolicy(sizePolicy)
+		self.descriptionLabel.setMinimumSize(QtCore.QSize(1, 32))
+		palette = QtGui.QPalette()
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.WindowText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Base, brush)
+		brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 64))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Window, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.WindowText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(251, 251, 251))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Base, brush)
+		brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 64))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Window, brush)
+		brush = QtGui.QBrush(QtGui.QColor(145, 145, 144))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.WindowText, brush)
+		brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 64))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Base, brush)
+		brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 64))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Window, brush)
+		self.descriptionLabel.setPalette(palette)
+		font = QtGui.QFont()
+		font.setBold(True)
+		self.descriptionLabel.setFont(font)
+		self.descriptionLabel.setAutoFillBackground(True)
+		self.descriptionLabel.setLineWidth(0)
+		self.descriptionLabel.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+		self.descriptionLabel.setScaledContents(False)
+		self.descriptionLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+		self.descriptionLabel.setWordWrap(True)
+		self.descriptionLabel.setTextInteractionFlags(QtCore.Qt.TextInteractionFlag.NoTextInteraction)
+		self.descriptionLabel.setObjectName("descriptionLabel")
+		self.verticalLayout.addWidget(self.descriptionLabel)
+
+		self.retranslateUi(MediaAttachment)
+		QtCore.QMetaObject.connectSlotsByName(MediaAttachment)
+
+	def retranslateUi(self, MediaAttachment):
+		_translate = QtCore.QCoreApplication.translate
+		MediaAttachment.setWindowTitle(_translate("MediaAttachment", "Form"))
+		self.deleteButton.setToolTip(_translate("MediaAttachment", "Delete"))
+		self.deleteButton.setText(_translate("MediaAttachment", "❌"))
+		self.editButton.setToolTip(_translate("MediaAttachment", "Edit"))
+		self.editButton.setText(_translate("MediaAttachment", "🖍️"))
+
+
+FORM_CLASS = "Ui_MediaAttachment"
+UI_HASH = "bd470c364981561370b43b08c34de7f461c31672"
@@ -0,0 +1,104 @@
+# Form implementation generated from reading ui file 'mammudon/ui/name_list_entry.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_NameListEntry(object):
+	def setupUi(self, NameListEntry):
+		NameListEntry.setObjectName("NameListEntry")
+		NameListEntry.resize(415, 68)
+		NameListEntry.setAutoFillBackground(False)
+		self.verticalLayout_2 = QtWidgets.QVBoxLayout(NameListEntry)
+		self.verticalLayout_2.setContentsMargins(0, 1, 0, 0)
+		self.verticalLayout_2.setSpacing(0)
+		self.verticalLayout_2.setObjectName("verticalLayout_2")
+		self.frame = QtWidgets.QFrame(parent=NameListEntry)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.frame.sizePolicy().hasHeightForWidth())
+		self.frame.setSizePolicy(sizePolicy)
+		self.frame.setMinimumSize(QtCore.QSize(0, 1))
+		self.frame.setMaximumSize(QtCore.QSize(16777215, 1))
+		self.frame.setFrameShape(QtWidgets.QFrame.Shape.Box)
+		self.frame.setFrameShadow(QtWidgets.QFrame.Shadow.Plain)
+		self.frame.setObjectName("frame")
+		self.verticalLayout_2.addWidget(self.frame)
+		self.horizontalLayout = QtWidgets.QHBoxLayout()
+		self.horizontalLayout.setContentsMargins(4, -1, -1, -1)
+		self.horizontalLayout.setSpacing(6)
+		self.horizontalLayout.setObjectName("horizontalLayout")
+		self.avatarLabel = QtWidgets.QLabel(parent=NameListEntry)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.avatarLabel.sizePolicy().hasHeightForWidth())
+		self.avatarLabel.setSizePolicy(sizePolicy)
+		self.avatarLabel.setMinimumSize(QtCore.QSize(45, 45))
+		self.avatarLabel.setMaximumSize(QtCore.QSize(45, 45))
+		self.avatarLabel.setAutoFillBackground(False)
+		self.avatarLabel.setText("")
+		self.avatarLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+		self.avatarLabel.setObjectName("avatarLabel")
+		self.horizontalLayout.addWidget(self.avatarLabel)
+		self.verticalLayout = QtWidgets.QVBoxLayout()
+		self.verticalLayout.setContentsMargins(0, 3, -1, -1)
+		self.verticalLayout.setSpacing(2)
+		self.verticalLayout.setObjectName("verticalLayout")
+		self.displayNameView = QtWebEngineWidgets.QWebEngineView(parent=NameListEntry)
+		self.displayNameView.setEnabled(True)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.displayNameView.sizePolicy().hasHeightForWidth())
+		self.displayNameView.setSizePolicy(sizePolicy)
+		self.displayNameView.setMinimumSize(QtCore.QSize(0, 24))
+		self.displayNameView.setMaximumSize(QtCore.QSize(16777215, 24))
+		self.displayNameView.setAutoFillBackground(True)
+		self.displayNameView.setStyleSheet("body { background-color: #fff; }")
+		self.displayNameView.setUrl(QtCore.QUrl("about:blank"))
+		self.displayNameView.setObjectName("displayNameView")
+		self.verticalLayout.addWidget(self.displayNameView)
+		self.usernameLabel = QtWidgets.QLabel(parent=NameListEntry)
+		self.usernameLabel.setObjectName("usernameLabel")
+		self.verticalLayout.addWidget(self.usernameLabel)
+		spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+		self.verticalLayout.addItem(spacerItem)
+		self.horizontalLayout.addLayout(self.verticalLayout)
+		self.followBtn = QtWidgets.QPushButton(parent=NameListEntry)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.followBtn.sizePolicy().hasHeightForWidth())
+		self.followBtn.setSizePolicy(sizePolicy)
+		self.followBtn.setMinimumSize(QtCore.QSize(48, 48))
+		self.followBtn.setMaximumSize(QtCore.QSize(48, 48))
+		self.followBtn.setText("")
+		icon = QtGui.QIcon()
+		icon.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/follow.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+		icon.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/unfollow.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+		self.followBtn.setIcon(icon)
+		self.followBtn.setIconSize(QtCore.QSize(32, 32))
+		self.followBtn.setCheckable(True)
+		self.followBtn.setObjectName("followBtn")
+		self.horizontalLayout.addWidget(self.followBtn)
+		self.verticalLayout_2.addLayout(self.horizontalLayout)
+
+		self.retranslateUi(NameListEntry)
+		QtCore.QMetaObject.connectSlotsByName(NameListEntry)
+
+	def retranslateUi(self, NameListEntry):
+		_translate = QtCore.QCoreApplication.translate
+		NameListEntry.setWindowTitle(_translate("NameListEntry", "Name List Entry"))
+		self.usernameLabel.setText(_translate("NameListEntry", "@a@bc.de"))
+from PyQt6 import QtWebEngineWidgets
+
+
+FORM_CLASS = "Ui_NameListEntry"
+UI_HASH = "9ff9b7c4842a42847a305b9ecfbc0f703ed11a71"
@@ -0,0 +1,93 @@
+# Form implementation generated from reading ui file 'mammudon/ui/notification_view.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_NotificationView(object):
+	def setupUi(self, NotificationView):
+		NotificationView.setObjectName("NotificationView")
+		NotificationView.resize(315, 66)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(NotificationView.sizePolicy().hasHeightForWidth())
+		NotificationView.setSizePolicy(sizePolicy)
+		NotificationView.setMinimumSize(QtCore.QSize(0, 0))
+		NotificationView.setMaximumSize(QtCore.QSize(16777215, 16777215))
+		palette = QtGui.QPalette()
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Window, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Window, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Base, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Window, brush)
+		NotificationView.setPalette(palette)
+		NotificationView.setAutoFillBackground(True)
+		self.verticalLayout = QtWidgets.QVBoxLayout(NotificationView)
+		self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+		self.verticalLayout.setSpacing(2)
+		self.verticalLayout.setObjectName("verticalLayout")
+		self.notificationView = QtWebEngineWidgets.QWebEngineView(parent=NotificationView)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.MinimumExpanding)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(16)
+		sizePolicy.setHeightForWidth(self.notificationView.sizePolicy().hasHeightForWidth())
+		self.notificationView.setSizePolicy(sizePolicy)
+		self.notificationView.setMinimumSize(QtCore.QSize(0, 48))
+		self.notificationView.setMaximumSize(QtCore.QSize(16777215, 16777215))
+		self.notificationView.setAcceptDrops(False)
+		self.notificationView.setUrl(QtCore.QUrl("about:blank"))
+		self.notificationView.setObjectName("notificationView")
+		self.verticalLayout.addWidget(self.notificationView)
+		self.timestampLabel = QtWidgets.QLabel(parent=NotificationView)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.timestampLabel.sizePolicy().hasHeightForWidth())
+		self.timestampLabel.setSizePolicy(sizePolicy)
+		self.timestampLabel.setMaximumSize(QtCore.QSize(16777215, 16))
+		font = QtGui.QFont()
+		font.setPointSize(9)
+		self.timestampLabel.setFont(font)
+		self.timestampLabel.setObjectName("timestampLabel")
+		self.verticalLayout.addWidget(self.timestampLabel)
+		self.debugCopyRaw = QtGui.QAction(parent=NotificationView)
+		self.debugCopyRaw.setMenuRole(QtGui.QAction.MenuRole.NoRole)
+		self.debugCopyRaw.setObjectName("debugCopyRaw")
+		self.debugCopyHtml = QtGui.QAction(parent=NotificationView)
+		self.debugCopyHtml.setMenuRole(QtGui.QAction.MenuRole.NoRole)
+		self.debugCopyHtml.setObjectName("debugCopyHtml")
+		self.notificationActionReload = QtGui.QAction(parent=NotificationView)
+		icon = QtGui.QIcon()
+		icon.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/reload.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+		self.notificationActionReload.setIcon(icon)
+		self.notificationActionReload.setMenuRole(QtGui.QAction.MenuRole.NoRole)
+		self.notificationActionReload.setObjectName("notificationActionReload")
+
+		self.retranslateUi(NotificationView)
+		QtCore.QMetaObject.connectSlotsByName(NotificationView)
+
+	def retranslateUi(self, NotificationView):
+		_translate = QtCore.QCoreApplication.translate
+		NotificationView.setWindowTitle(_translate("NotificationView", "Notification View"))
+		self.timestampLabel.setText(_translate("NotificationView", "-"))
+		self.debugCopyRaw.setText(_translate("NotificationView", "Copy Raw Post"))
+		self.debugCopyHtml.setText(_translate("NotificationView", "Copy HTML Source"))
+		self.notificationActionReload.setText(_translate("NotificationView", "Reload Notification"))
+from PyQt6 import QtWebEngineWidgets
+
+
+FORM_CLASS = "Ui_NotificationView"
+UI_HASH = "7c56c183dec29f76a20f1975f5f64f768a62576d"
@@ -0,0 +1,418 @@
+# Form implementation generated from reading ui file 'mammudon/ui/postview.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_PostView(object):
+	def setupUi(self, PostView):
+		PostView.setObjectName("PostView")
+		PostView.setEnabled(True)
+		PostView.resize(339, 204)
+		PostView.setMinimumSize(QtCore.QSize(0, 0))
+		palette = QtGui.QPalette()
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Base, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Window, brush)
+		brush = QtGui.QBrush(QtGui.QColor(251, 251, 251))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Base, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Window, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Base, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Window, brush)
+		PostView.setPalette(palette)
+		PostView.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+		PostView.setAutoFillBackground(True)
+		self.horizontalLayout = QtWidgets.QHBoxLayout(PostView)
+		self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+		self.horizontalLayout.setSpacing(2)
+		self.horizontalLayout.setObjectName("horizontalLayout")
+		self.threadingMarker = QtWidgets.QWidget(parent=PostView)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.MinimumExpanding)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.threadingMarker.sizePolicy().hasHeightForWidth())
+		self.threadingMarker.setSizePolicy(sizePolicy)
+		self.threadingMarker.setMinimumSize(QtCore.QSize(8, 0))
+		self.threadingMarker.setMaximumSize(QtCore.QSize(16, 16777215))
+		palette = QtGui.QPalette()
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Base, brush)
+		brush = QtGui.QBrush(QtGui.QColor(113, 139, 170))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Window, brush)
+		brush = QtGui.QBrush(QtGui.QColor(251, 251, 251))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Base, brush)
+		brush = QtGui.QBrush(QtGui.QColor(113, 139, 170))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Window, brush)
+		brush = QtGui.QBrush(QtGui.QColor(113, 139, 170))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Base, brush)
+		brush = QtGui.QBrush(QtGui.QColor(113, 139, 170))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Window, brush)
+		self.threadingMarker.setPalette(palette)
+		self.threadingMarker.setAutoFillBackground(True)
+		self.threadingMarker.setObjectName("threadingMarker")
+		self.horizontalLayout.addWidget(self.threadingMarker)
+		self.threadVLayout = QtWidgets.QVBoxLayout()
+		self.threadVLayout.setSpacing(2)
+		self.threadVLayout.setObjectName("threadVLayout")
+		self.postVLayout = QtWidgets.QVBoxLayout()
+		self.postVLayout.setSpacing(0)
+		self.postVLayout.setObjectName("postVLayout")
+		self.unreadColor = QtWidgets.QWidget(parent=PostView)
+		self.unreadColor.setEnabled(True)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.unreadColor.sizePolicy().hasHeightForWidth())
+		self.unreadColor.setSizePolicy(sizePolicy)
+		self.unreadColor.setMinimumSize(QtCore.QSize(0, 4))
+		palette = QtGui.QPalette()
+		brush = QtGui.QBrush(QtGui.QColor(224, 69, 72))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Window, brush)
+		brush = QtGui.QBrush(QtGui.QColor(224, 69, 72))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Window, brush)
+		brush = QtGui.QBrush(QtGui.QColor(255, 255, 255))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Window, brush)
+		self.unreadColor.setPalette(palette)
+		self.unreadColor.setAutoFillBackground(True)
+		self.unreadColor.setObjectName("unreadColor")
+		self.postVLayout.addWidget(self.unreadColor)
+		self.postView = QtWebEngineWidgets.QWebEngineView(parent=PostView)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.MinimumExpanding)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(16)
+		sizePolicy.setHeightForWidth(self.postView.sizePolicy().hasHeightForWidth())
+		self.postView.setSizePolicy(sizePolicy)
+		self.postView.setMinimumSize(QtCore.QSize(0, 48))
+		self.postView.setAcceptDrops(False)
+		self.postView.setUrl(QtCore.QUrl("about:blank"))
+		self.postView.setObjectName("postView")
+		self.postVLayout.addWidget(self.postView)
+		self.postDataHLayout = QtWidgets.QHBoxLayout()
+		self.postDataHLayout.setSpacing(0)
+		self.postDataHLayout.setObjectName("postDataHLayout")
+		self.editedBtn = QtWidgets.QPushButton(parent=PostView)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.editedBtn.sizePolicy().hasHeightForWidth())
+		self.editedBtn.setSizePolicy(sizePolicy)
+		self.editedBtn.setMaximumSize(QtCore.QSize(16777215, 16))
+		font = QtGui.QFont()
+		font.setFamily("Noto Sans")
+		font.setPointSize(9)
+		self.editedBtn.setFont(font)
+		self.editedBtn.setStyleSheet("text-align: left; padding: 0")
+		self.editedBtn.setFlat(True)
+		self.editedBtn.setObjectName("editedBtn")
+		self.postDataHLayout.addWidget(self.editedBtn)
+		spacerItem = QtWidgets.QSpacerItem(100, 1, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+		self.postDataHLayout.addItem(spacerItem)
+		self.postedWithLabel = QtWidgets.QLabel(parent=PostView)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.postedWithLabel.sizePolicy().hasHeightForWidth())
+		self.postedWithLabel.setSizePolicy(sizePolicy)
+		self.postedWithLabel.setMaximumSize(QtCore.QSize(16777215, 16))
+		font = QtGui.QFont()
+		font.setFamily("Noto Sans")
+		font.setPointSize(9)
+		self.postedWithLabel.setFont(font)
+		self.postedWithLabel.setStyleSheet("text-align: right")
+		self.postedWithLabel.setObjectName("postedWithLabel")
+		self.postDataHLayout.addWidget(self.postedWithLabel)
+		self.postDataHLayout.setStretch(0, 1)
+		self.postDataHLayout.setStretch(1, 100)
+		self.postDataHLayout.setStretch(2, 1)
+		self.postVLayout.addLayout(self.postDataHLayout)
+		self.buttonHLayout = QtWidgets.QHBoxLayout()
+		self.buttonHLayout.setSpacing(0)
+		self.buttonHLayout.setObjectName("buttonHLayout")
+		self.conversationBtn = QtWidgets.QPushButton(parent=PostView)
+		self.conversationBtn.setEnabled(True)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.conversationBtn.sizePolicy().hasHeightForWidth())
+		self.conversationBtn.setSizePolicy(sizePolicy)
+		self.conversationBtn.setMinimumSize(QtCore.QSize(24, 24))
+		self.conversationBtn.setMaximumSize(QtCore.QSize(24, 24))
+		font = QtGui.QFont()
+		font.setPointSize(8)
+		font.setBold(True)
+		self.conversationBtn.setFont(font)
+		self.conversationBtn.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+		self.conversationBtn.setStyleSheet("border: none;")
+		self.conversationBtn.setText("")
+		icon = QtGui.QIcon()
+		icon.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/conversation.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+		icon.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/conversation_on.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+		icon.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/conversation_disabled.png"), QtGui.QIcon.Mode.Disabled, QtGui.QIcon.State.Off)
+		self.conversationBtn.setIcon(icon)
+		self.conversationBtn.setIconSize(QtCore.QSize(24, 24))
+		self.conversationBtn.setCheckable(True)
+		self.conversationBtn.setFlat(True)
+		self.conversationBtn.setObjectName("conversationBtn")
+		self.buttonHLayout.addWidget(self.conversationBtn)
+		self.replyBtn = QtWidgets.QPushButton(parent=PostView)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.replyBtn.sizePolicy().hasHeightForWidth())
+		self.replyBtn.setSizePolicy(sizePolicy)
+		self.replyBtn.setMinimumSize(QtCore.QSize(24, 24))
+		self.replyBtn.setMaximumSize(QtCore.QSize(24, 24))
+		font = QtGui.QFont()
+		font.setPointSize(8)
+		font.setBold(True)
+		self.replyBtn.setFont(font)
+		self.replyBtn.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+		self.replyBtn.setStyleSheet("border: none;")
+		self.replyBtn.setText("")
+		icon1 = QtGui.QIcon()
+		icon1.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/reply.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+		icon1.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/reply_on.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+		self.replyBtn.setIcon(icon1)
+		self.replyBtn.setIconSize(QtCore.QSize(24, 24))
+		self.replyBtn.setFlat(True)
+		self.replyBtn.setObjectName("replyBtn")
+		self.buttonHLayout.addWidget(self.replyBtn)
+		self.replyCount = QtWidgets.QLabel(parent=PostView)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(1)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.replyCount.sizePolicy().hasHeightForWidth())
+		self.replyCount.setSizePolicy(sizePolicy)
+		self.replyCount.setMinimumSize(QtCore.QSize(24, 24))
+		self.replyCount.setMaximumSize(QtCore.QSize(32, 24))
+		font = QtGui.QFont()
+		font.setPointSize(11)
+		font.setBold(False)
+		self.replyCount.setFont(font)
+		self.replyCount.setObjectName("replyCount")
+		self.buttonHLayout.addWidget(self.replyCount)
+		self.boostBtn = QtWidgets.QPushButton(parent=PostView)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.boostBtn.sizePolicy().hasHeightForWidth())
+		self.boostBtn.setSizePolicy(sizePolicy)
+		self.boostBtn.setMinimumSize(QtCore.QSize(24, 24))
+		self.boostBtn.setMaximumSize(QtCore.QSize(24, 24))
+		font = QtGui.QFont()
+		font.setPointSize(8)
+		font.setBold(True)
+		self.boostBtn.setFont(font)
+		self.boostBtn.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+		self.boostBtn.setStyleSheet("border: none;")
+		self.boostBtn.setText("")
+		icon2 = QtGui.QIcon()
+		icon2.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/boost.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+		icon2.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/boost_on.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+		self.boostBtn.setIcon(icon2)
+		self.boostBtn.setIconSize(QtCore.QSize(24, 24))
+		self.boostBtn.setCheckable(True)
+		self.boostBtn.setFlat(True)
+		self.boostBtn.setObjectName("boostBtn")
+		self.buttonHLayout.addWidget(self.boostBtn)
+		self.boostCount = QtWidgets.QLabel(parent=PostView)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(1)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.boostCount.sizePolicy().hasHeightForWidth())
+		self.boostCount.setSizePolicy(sizePolicy)
+		self.boostCount.setMinimumSize(QtCore.QSize(24, 24))
+		self.boostCount.setMaximumSize(QtCore.QSize(32, 24))
+		font = QtGui.QFont()
+		font.setPointSize(11)
+		font.setBold(False)
+		self.boostCount.setFont(font)
+		self.boostCount.setObjectName("boostCount")
+		self.buttonHLayout.addWidget(self.boostCount)
+		self.favoriteBtn = QtWidgets.QPushButton(parent=PostView)
+		self.favoriteBtn.setEnabled(True)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.favoriteBtn.sizePolicy().hasHeightForWidth())
+		self.favoriteBtn.setSizePolicy(sizePolicy)
+		self.favoriteBtn.setMinimumSize(QtCore.QSize(24, 24))
+		self.favoriteBtn.setMaximumSize(QtCore.QSize(24, 24))
+		font = QtGui.QFont()
+		font.setPointSize(8)
+		font.setBold(True)
+		self.favoriteBtn.setFont(font)
+		self.favoriteBtn.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+		self.favoriteBtn.setStyleSheet("border: none;")
+		self.favoriteBtn.setText("")
+		icon3 = QtGui.QIcon()
+		icon3.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/favorite.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+		icon3.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/favorite_on.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+		self.favoriteBtn.setIcon(icon3)
+		self.favoriteBtn.setIconSize(QtCore.QSize(24, 24))
+		self.favoriteBtn.setCheckable(True)
+		self.favoriteBtn.setChecked(False)
+		self.favoriteBtn.setFlat(True)
+		self.favoriteBtn.setObjectName("favoriteBtn")
+		self.buttonHLayout.addWidget(self.favoriteBtn)
+		self.favoriteCount = QtWidgets.QLabel(parent=PostView)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(1)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.favoriteCount.sizePolicy().hasHeightForWidth())
+		self.favoriteCount.setSizePolicy(sizePolicy)
+		self.favoriteCount.setMinimumSize(QtCore.QSize(24, 24))
+		self.favoriteCount.setMaximumSize(QtCore.QSize(32, 24))
+		font = QtGui.QFont()
+		font.setPointSize(11)
+		font.setBold(False)
+		self.favoriteCount.setFont(font)
+		self.favoriteCount.setObjectName("favoriteCount")
+		self.buttonHLayout.addWidget(self.favoriteCount)
+		self.bookmarkBtn = QtWidgets.QPushButton(parent=PostView)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.bookmarkBtn.sizePolicy().hasHeightForWidth())
+		self.bookmarkBtn.setSizePolicy(sizePolicy)
+		self.bookmarkBtn.setMinimumSize(QtCore.QSize(24, 24))
+		self.bookmarkBtn.setMaximumSize(QtCore.QSize(24, 24))
+		font = QtGui.QFont()
+		font.setPointSize(8)
+		font.setBold(True)
+		self.bookmarkBtn.setFont(font)
+		self.bookmarkBtn.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+		self.bookmarkBtn.setStyleSheet("border: none;")
+		self.bookmarkBtn.setText("")
+		icon4 = QtGui.QIcon()
+		icon4.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/bookmark.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+		icon4.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/bookmark_on.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+		self.bookmarkBtn.setIcon(icon4)
+		self.bookmarkBtn.setIconSize(QtCore.QSize(24, 24))
+		self.bookmarkBtn.setCheckable(True)
+		self.bookmarkBtn.setFlat(True)
+		self.bookmarkBtn.setObjectName("bookmarkBtn")
+		self.buttonHLayout.addWidget(self.bookmarkBtn)
+		spacerItem1 = QtWidgets.QSpacerItem(0, 20, QtWidgets.QSizePolicy.Policy.MinimumExpanding, QtWidgets.QSizePolicy.Policy.Minimum)
+		self.buttonHLayout.addItem(spacerItem1)
+		self.postOptionsBtn = QtWidgets.QToolButton(parent=PostView)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.postOptionsBtn.sizePolicy().hasHeightForWidth())
+		self.postOptionsBtn.setSizePolicy(sizePolicy)
+		self.postOptionsBtn.setMinimumSize(QtCore.QSize(24, 24))
+		self.postOptionsBtn.setMaximumSize(QtCore.QSize(24, 24))
+		font = QtGui.QFont()
+		font.setPointSize(8)
+		font.setBold(True)
+		self.postOptionsBtn.setFont(font)
+		self.postOptionsBtn.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+		self.postOptionsBtn.setText("")
+		icon5 = QtGui.QIcon()
+		icon5.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/meatballs_menu.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+		self.postOptionsBtn.setIcon(icon5)
+		self.postOptionsBtn.setIconSize(QtCore.QSize(24, 24))
+		self.postOptionsBtn.setCheckable(False)
+		self.postOptionsBtn.setPopupMode(QtWidgets.QToolButton.ToolButtonPopupMode.InstantPopup)
+		self.postOptionsBtn.setAutoRaise(True)
+		self.postOptionsBtn.setArrowType(QtCore.Qt.ArrowType.NoArrow)
+		self.postOptionsBtn.setObjectName("postOptionsBtn")
+		self.buttonHLayout.addWidget(self.postOptionsBtn)
+		self.postVLayout.addLayout(self.buttonHLayout)
+		self.threadVLayout.addLayout(self.postVLayout)
+		self.horizontalLayout.addLayout(self.threadVLayout)
+		self.postActionDelete = QtGui.QAction(parent=PostView)
+		icon6 = QtGui.QIcon()
+		icon6.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/trashcan.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+		self.postActionDelete.setIcon(icon6)
+		self.postActionDelete.setObjectName("postActionDelete")
+		self.postActionMute = QtGui.QAction(parent=PostView)
+		self.postActionMute.setCheckable(True)
+		icon7 = QtGui.QIcon()
+		icon7.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/unmute.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+		self.postActionMute.setIcon(icon7)
+		self.postActionMute.setObjectName("postActionMute")
+		self.postActionCopyLink = QtGui.QAction(parent=PostView)
+		icon8 = QtGui.QIcon()
+		icon8.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/copy.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+		self.postActionCopyLink.setIcon(icon8)
+		self.postActionCopyLink.setObjectName("postActionCopyLink")
+		self.postActionBrowser = QtGui.QAction(parent=PostView)
+		icon9 = QtGui.QIcon()
+		icon9.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/web_browser.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+		self.postActionBrowser.setIcon(icon9)
+		self.postActionBrowser.setObjectName("postActionBrowser")
+		self.debugCopyRaw = QtGui.QAction(parent=PostView)
+		self.debugCopyRaw.setMenuRole(QtGui.QAction.MenuRole.NoRole)
+		self.debugCopyRaw.setObjectName("debugCopyRaw")
+		self.debugCopyHtml = QtGui.QAction(parent=PostView)
+		self.debugCopyHtml.setMenuRole(QtGui.QAction.MenuRole.NoRole)
+		self.debugCopyHtml.setObjectName("debugCopyHtml")
+		self.postActionReload = QtGui.QAction(parent=PostView)
+		icon10 = QtGui.QIcon()
+		icon10.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/reload.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+		self.postActionReload.setIcon(icon10)
+		self.postActionReload.setMenuRole(QtGui.QAction.MenuRole.NoRole)
+		self.postActionReload.setObjectName("postActionReload")
+
+		self.retranslateUi(PostView)
+		QtCore.QMetaObject.connectSlotsByName(PostView)
+
+	def retranslateUi(self, PostView):
+		_translate = QtCore.QCoreApplication.translate
+		PostView.setWindowTitle(_translate("PostView", "Post View"))
+		self.editedBtn.setText(_translate("PostView", "-"))
+		self.postedWithLabel.setText(_translate("PostView", "-"))
+		self.conversationBtn.setToolTip(_translate("PostView", "Open/Close Thread"))
+		self.replyBtn.setToolTip(_translate("PostView", "Reply"))
+		self.replyCount.setToolTip(_translate("PostView", "Reply Count"))
+		self.replyCount.setText(_translate("PostView", "0"))
+		self.boostBtn.setToolTip(_translate("PostView", "Boost"))
+		self.boostCount.setToolTip(_translate("PostView", "Boost Count"))
+		self.boostCount.setText(_translate("PostView", "999"))
+		self.favoriteBtn.setToolTip(_translate("PostView", "Favorite"))
+		self.favoriteCount.setToolTip(_translate("PostView", "Favorite Count"))
+		self.favoriteCount.setText(_translate("PostView", "0"))
+		self.bookmarkBtn.setToolTip(_translate("PostView", "Bookmark"))
+		self.postOptionsBtn.setToolTip(_translate("PostView", "More Actions"))
+		self.postActionDelete.setText(_translate("PostView", "Delete Post"))
+		self.postActionDelete.setToolTip(_translate("PostView", "Delete this post"))
+		self.postActionMute.setText(_translate("PostView", "Mute Conversation"))
+		self.postActionMute.setToolTip(_translate("PostView", "Mute notifications for this conversation."))
+		self.postActionCopyLink.setText(_translate("PostView", "Copy Link"))
+		self.postActionCopyLink.setToolTip(_translate("PostView", "Copy link to this post"))
+		self.postActionBrowser.setText(_translate("PostView", "Open in Web Browser"))
+		self.postActionBrowser.setToolTip(_translate("PostView", "Open this post in a web browser"))
+		self.debugCopyRaw.setText(_translate("PostView", "Copy Raw Post"))
+		self.debugCopyHtml.setText(_translate("PostView", "Copy HTML Source"))
+		self.postActionReload.setText(_translate("PostView", "Reload Post"))
+from PyQt6 import QtWebEngineWidgets
+
+
+FORM_CLASS = "Ui_PostView"
+UI_HASH = "efdb996401abf4712181e603425e03ac1a2c5fb6"
@@ -0,0 +1,130 @@
+# Form implementation generated from reading ui file 'mammudon/ui/timeline.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Form(object):
+	def setupUi(self, Form):
+		Form.setObjectName("Form")
+		Form.resize(374, 639)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Expanding)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(Form.sizePolicy().hasHeightForWidth())
+		Form.setSizePolicy(sizePolicy)
+		self.verticalLayout = QtWidgets.QVBoxLayout(Form)
+		self.verticalLayout.setObjectName("verticalLayout")
+		self.topLabelHBox = QtWidgets.QHBoxLayout()
+		self.topLabelHBox.setSizeConstraint(QtWidgets.QLayout.SizeConstraint.SetMaximumSize)
+		self.topLabelHBox.setObjectName("topLabelHBox")
+		self.timelineIconWidget = QtWidgets.QWidget(parent=Form)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.timelineIconWidget.sizePolicy().hasHeightForWidth())
+		self.timelineIconWidget.setSizePolicy(sizePolicy)
+		self.timelineIconWidget.setMinimumSize(QtCore.QSize(32, 32))
+		self.timelineIconWidget.setMaximumSize(QtCore.QSize(32, 32))
+		self.timelineIconWidget.setObjectName("timelineIconWidget")
+		self.horizontalLayout = QtWidgets.QHBoxLayout(self.timelineIconWidget)
+		self.horizontalLayout.setContentsMargins(12, 20, 0, 0)
+		self.horizontalLayout.setSpacing(0)
+		self.horizontalLayout.setObjectName("horizontalLayout")
+		self.unreadLabel = QtWidgets.QLabel(parent=self.timelineIconWidget)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.unreadLabel.sizePolicy().hasHeightForWidth())
+		self.unreadLabel.setSizePolicy(sizePolicy)
+		self.unreadLabel.setMinimumSize(QtCore.QSize(0, 0))
+		self.unreadLabel.setMaximumSize(QtCore.QSize(20, 12))
+		font = QtGui.QFont()
+		font.setFamily("Noto Sans Black")
+		font.setPointSize(8)
+		self.unreadLabel.setFont(font)
+		self.unreadLabel.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+		self.unreadLabel.setStyleSheet("color: #ffffff; background: red; border-radius: 5px; border-image: unset;")
+		self.unreadLabel.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+		self.unreadLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+		self.unreadLabel.setTextInteractionFlags(QtCore.Qt.TextInteractionFlag.NoTextInteraction)
+		self.unreadLabel.setObjectName("unreadLabel")
+		self.horizontalLayout.addWidget(self.unreadLabel)
+		self.topLabelHBox.addWidget(self.timelineIconWidget)
+		self.accountLabel = QtWidgets.QLabel(parent=Form)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.MinimumExpanding, QtWidgets.QSizePolicy.Policy.Preferred)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.accountLabel.sizePolicy().hasHeightForWidth())
+		self.accountLabel.setSizePolicy(sizePolicy)
+		self.accountLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+		self.accountLabel.setObjectName("accountLabel")
+		self.topLabelHBox.addWidget(self.accountLabel)
+		self.timelineReloadBtn = QtWidgets.QPushButton(parent=Form)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.timelineReloadBtn.sizePolicy().hasHeightForWidth())
+		self.timelineReloadBtn.setSizePolicy(sizePolicy)
+		self.timelineReloadBtn.setMaximumSize(QtCore.QSize(49, 16777215))
+		self.timelineReloadBtn.setIconSize(QtCore.QSize(18, 18))
+		self.timelineReloadBtn.setObjectName("timelineReloadBtn")
+		self.topLabelHBox.addWidget(self.timelineReloadBtn)
+		self.closeBtn = QtWidgets.QPushButton(parent=Form)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Fixed)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.closeBtn.sizePolicy().hasHeightForWidth())
+		self.closeBtn.setSizePolicy(sizePolicy)
+		self.closeBtn.setMinimumSize(QtCore.QSize(20, 20))
+		self.closeBtn.setMaximumSize(QtCore.QSize(20, 32))
+		self.closeBtn.setText("")
+		icon = QtGui.QIcon()
+		icon.addPixmap(QtGui.QPixmap("mammudon/ui/../icons/close.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+		self.closeBtn.setIcon(icon)
+		self.closeBtn.setIconSize(QtCore.QSize(32, 32))
+		self.closeBtn.setFlat(True)
+		self.closeBtn.setObjectName("closeBtn")
+		self.topLabelHBox.addWidget(self.closeBtn)
+		self.verticalLayout.addLayout(self.topLabelHBox)
+		self.timelineScrollArea = QtWidgets.QScrollArea(parent=Form)
+		sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+		sizePolicy.setHorizontalStretch(0)
+		sizePolicy.setVerticalStretch(0)
+		sizePolicy.setHeightForWidth(self.timelineScrollArea.sizePolicy().hasHeightForWidth())
+		self.timelineScrollArea.setSizePolicy(sizePolicy)
+		palette = QtGui.QPalette()
+		brush = QtGui.QBrush(QtGui.QColor(85, 170, 127))
+		brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+		palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Base, brush)
+		self.timelineScrollArea.setPalette(palette)
+		self.timelineScrollArea.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
+		self.timelineScrollArea.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+		self.timelineScrollArea.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.SizeAdjustPolicy.AdjustIgnored)
+		self.timelineScrollArea.setWidgetResizable(True)
+		self.timelineScrollArea.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignTop)
+		self.timelineScrollArea.setObjectName("timelineScrollArea")
+		self.scrollAreaWidgetContents = QtWidgets.QWidget()
+		self.scrollAreaWidgetContents.setGeometry(QtCore.QRect(0, 0, 340, 579))
+		self.scrollAreaWidgetContents.setObjectName("scrollAreaWidgetContents")
+		self.timelineScrollArea.setWidget(self.scrollAreaWidgetContents)
+		self.verticalLayout.addWidget(self.timelineScrollArea)
+
+		self.retranslateUi(Form)
+		QtCore.QMetaObject.connectSlotsByName(Form)
+
+	def retranslateUi(self, Form):
+		_translate = QtCore.QCoreApplication.translate
+		Form.setWindowTitle(_translate("Form", "Timeline"))
+		self.unreadLabel.setText(_translate("Form", "0"))
+		self.accountLabel.setText(_translate("Form", "@a@b.cd"))
+		self.timelineReloadBtn.setText(_translate("Form", "10"))
+
+
+FORM_CLASS = "Ui_Form"
+UI_HASH = "325fcddba1a1be570dd9bc1661a3c8146875e031"
@@ -0,0 +1,77 @@
+import json
+import re
+
+# parts of a post document that can be swapped in place in an already loaded page, they are marked up in
+# the layouts as <div id="fragment-name">...</div><!-- /fragment-name -->, the closing comment makes
+# finding the end of a fragment easy, even if there are more nested tags of the same kind inside
+fragment_pattern = re.compile(r'<(div|span|style) id="fragment-([a-z_]+)"([^>]*)>(.*?)</\1><!-- /fragment-\2 -->', re.DOTALL)
+
+
+# returns the document with all fragment contents taken out, and the fragment contents by element id
+def split_fragments(html: str) -> tuple[str, dict[str, str]]:
+	fragments: dict[str, str] = {}
+
+	def take_out(match: re.Match) -> str:
+		fragments["fragment-" + match.group(2)] = match.group(4)
+		return '<' + match.group(1) + ' id="fragment-' + match.group(2) + '"' + match.group(3) + '></' + match.group(1) + '>'
+
+	return fragment_pattern.sub(take_out, html), fragments
+
+
+# returns the fragments that changed between two renderings of the same post by element id, or None
+# when anything outside of the fragments changed, so the page needs to be loaded again completely
+def fragment_patches(old_html: str, new_html: str) -> dict[str, str] | None:
+	old_skeleton, old_fragments = split_fragments(old_html)
+	new_skeleton, new_fragments = split_fragments(new_html)
+
+	if old_skeleton != new_skeleton:
+		return None
+
+	patches: dict[str, str] = {}
+	for element_id, fragment in new_fragments.items():
+		if old_fragments.get(element_id) != fragment:
+			patches[element_id] = fragment
+
+	return patches
+
+
+# JavaScript to apply the patches to the loaded page, evaluates to false if the page does not
+# have all the fragment elements (anymore), so the caller can fall back to loading it again
+def patch_script(patches: dict[str, str]) -> str:
+	return (
+		'(function(patches) {' +
+		' for (const id in patches) { if (!document.getElementById(id)) { return false; } }' +
+		' for (const id in patches) { document.getElementById(id).innerHTML = patches[id]; }' +
+		' return true;' +
+		'})(' + json.dumps(patches) + ');'
+	)
+
+
+# a CSS rule, its selectors and its declaration block, the post CSS has no nested blocks like @media
+css_rule_pattern = re.compile(r'([^{}]+)(\{[^{}]*\})')
+
+
+# returns the CSS with every selector limited to the element with the given id, like "#post-1 .media-hover-0"
+def scope_css(css: str, element_id: str) -> str:
+	def prefix(match: re.Match) -> str:
+		selectors = ", ".join("#" + element_id + " " + selector.strip() for selector in match.group(1).split(","))
+		return "\n" + selectors + "\n" + match.group(2)
+
+	return css_rule_pattern.sub(prefix, css)
+
+
+# the single document timeline needs the contents of a post document without the surrounding page, returns the
+# body without the end of page marker, and the post's own media hover CSS, both made to fit into the element with
+# the given id, the fragment ids get it as a suffix, so they stay unique when there are many posts in the document
+def post_body(html: str, element_id: str) -> tuple[str, str]:
+	body_start = html.find("<body>")
+	body_end = html.rfind("</body>")
+	if body_start == -1 or body_end == -1:
+		return html, ""
+
+	body = html[body_start + len("<body>"):body_end].replace('<div id="endofpage"></div>', "")
+	body = re.sub(r'id="fragment-([a-z_]+)"', r'id="fragment-\1-' + element_id + '"', body)
+
+	_skeleton, fragments = split_fragments(html[:body_start])
+
+	return body, scope_css(fragments.get("fragment-media_css", ""), element_id)
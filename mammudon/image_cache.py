@@ -0,0 +1,319 @@
+import base64
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import requests
+from PyQt6 import QtCore
+from PyQt6.QtCore import QObject, QBuffer, QIODevice, QMimeDatabase, QStandardPaths, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader
+
+from mammudon.debugging import debug
+
+# image URLs look like mammudon-img:avatar/aHR0cHM6Ly9..., the remote URL in URL-safe base64, see image_url()
+IMAGE_SCHEME = b"mammudon-img"
+
+# what the images are used for, avatars get scaled down when they are stored, everything else is kept as it is
+IMAGE_KINDS = ["avatar", "emoji", "preview", "card", "header"]
+
+# avatars are shown at 48 pixels in posts and 100 in user profiles, so this is enough for high DPI screens, too
+AVATAR_SIZE = 120
+
+# most recently used images kept in memory, the rest gets read back from the disk cache
+MAX_MEMORY_BYTES = 64 * 1024 * 1024
+
+# the disk cache gets pruned down to this size, oldest images first, once per start
+MAX_DISK_BYTES = 512 * 1024 * 1024
+
+# seconds to wait for an image server to answer
+DOWNLOAD_TIMEOUT = 30
+
+
+# turn a remote image URL into one served by the ImageSchemeHandler, the formatters run this on all image URLs
+def image_url(kind: str, url: str) -> str:
+	# local files, e.g. in the preferences preview, and missing images stay as they are
+	if not url.startswith(("https://", "http://")):
+		return url
+
+	return IMAGE_SCHEME.decode() + ":" + kind + "/" + base64.urlsafe_b64encode(url.encode()).decode().rstrip("=")
+
+
+# returns kind and remote URL of a mammudon-img: URL path, or None if it's malformed
+def decode_image_path(path: str) -> tuple[str, str] | None:
+	parts = path.split("/")
+	if len(parts) != 2 or parts[0] not in IMAGE_KINDS:
+		return None
+
+	try:
+		return parts[0], base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4)).decode()
+	except ValueError:
+		return None
+
+
+# keep aspect ratio, but don't let avatars be larger than needed, animated avatars stay as they are
+def scale_avatar(data: bytes) -> bytes:
+	buffer = QBuffer()
+	buffer.setData(data)
+	buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+
+	reader = QImageReader(buffer)
+	if reader.supportsAnimation() and reader.imageCount() != 1:
+		return data
+
+	image = QImage()
+	if not image.loadFromData(data):
+		return data
+
+	if image.width() <= AVATAR_SIZE and image.height() <= AVATAR_SIZE:
+		return data
+
+	image = image.scaled(
+		AVATAR_SIZE, AVATAR_SIZE, QtCore.Qt.AspectRatioMode.KeepAspectRatio, QtCore.Qt.TransformationMode.SmoothTransformation
+	)
+
+	scaled = QBuffer()
+	scaled.open(QIODevice.OpenModeFlag.WriteOnly)
+	image.save(scaled, "PNG")
+	return bytes(scaled.data())
+
+
+# one download per image for all timelines, accounts and dialogs: keeps images in memory and on disk, and
+# lets all pages that ask for the same image while it's still downloading wait for the same download
+class ImageCache(QObject):
+
+	# signals, emitted by the worker threads, delivered on the GUI thread
+	fetched = pyqtSignal(str, object, object, str)  # key, MIME type, image data (empty if failed), "disk" or "download"
+
+	def __init__(self):
+		super().__init__()
+
+		# key -> (MIME type, image data), oldest first
+		self.memory: OrderedDict[str, tuple[bytes, bytes]] = OrderedDict()
+		self.memory_bytes = 0
+
+		# callbacks waiting for an image that is being loaded, by key
+		self.waiting: dict[str, list[Callable[[bytes, bytes], None]]] = {}
+
+		self.workers = ThreadPoolExecutor(max_workers=4, thread_name_prefix="image_cache")
+
+		# found on first use, QStandardPaths needs the application name to be set
+		self.cache_folder = ""
+
+		self.memory_hits = 0
+		self.disk_hits = 0
+		self.downloads = 0
+		self.downloaded_bytes = 0
+		self.shared = 0
+		self.failures = 0
+
+		self.fetched.connect(self.on_fetched)
+
+	def folder(self) -> str:
+		if not self.cache_folder:
+			self.cache_folder = os.path.join(
+				QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation), "images"
+			)
+			os.makedirs(self.cache_folder, exist_ok=True)
+
+			self.workers.submit(self.prune, self.cache_folder)
+
+		return self.cache_folder
+
+	# hand the image to callback(mime_type, data) as soon as it's there, right away if it's in memory
+	def request(self, kind: str, url: str, callback: Callable[[bytes, bytes], None]) -> None:
+		key = kind + "/" + url
+
+		cached = self.from_memory(key)
+		if cached:
+			callback(*cached)
+			return
+
+		waiting = self.waiting.get(key, None)
+		if waiting:
+			self.shared += 1
+			waiting.append(callback)
+			return
+
+		self.waiting[key] = [callback]
+		self.workers.submit(self.fetch, key, kind, url, self.folder())
+
+	# the image data right away, blocking until it's downloaded if needed, for dialogs that can't wait for a callback
+	def data(self, kind: str, url: str) -> bytes:
+		key = kind + "/" + url
+
+		cached = self.from_memory(key)
+		if cached:
+			return cached[1]
+
+		mime_type, data, source = self.load(kind, url, self.folder())
+		self.count(source, data)
+
+		if data:
+			self.to_memory(key, mime_type, data)
+
+		return data
+
+	def from_memory(self, key: str) -> tuple[bytes, bytes] | None:
+		cached = self.memory.get(key, None)
+		if cached:
+			self.memory_hits += 1
+			self.memory.move_to_end(key)
+
+		return cached
+
+	def to_memory(self, key: str, mime_type: bytes, data: bytes) -> None:
+		if key in self.memory:
+			return
+
+		self.memory[key] = (mime_type, data)
+		self.memory_bytes += len(data)
+
+		while self.memory_bytes > MAX_MEMORY_BYTES and len(self.memory) > 1:
+			_key, (_mime_type, old_data) = self.memory.popitem(last=False)
+			self.memory_bytes -= len(old_data)
+
+	# drop the least recently used images from memory until at most max_bytes are left, returns the bytes freed
+	def shrink(self, max_bytes: int) -> int:
+		freed = 0
+
+		while self.memory and self.memory_bytes > max_bytes:
+			_key, (_mime_type, data) = self.memory.popitem(last=False)
+			self.memory_bytes -= len(data)
+			freed += len(data)
+
+		return freed
+
+	# runs in the worker threads
+	def fetch(self, key: str, kind: str, url: str, folder: str) -> None:
+		mime_type, data, source = self.load(kind, url, folder)
+		self.fetched.emit(key, mime_type, data, source)
+
+	@staticmethod
+	def load(kind: str, url: str, folder: str) -> tuple[bytes, bytes, str]:
+		file_name = os.path.join(folder, hashlib.sha1((kind + "/" + url).encode()).hexdigest())
+
+		data = b""
+		source = "disk"
+
+		try:
+			with open(file_name, "rb") as file:
+				data = file.read()
+		except OSError:
+			pass
+
+		if not data:
+			source = "download"
+
+			try:
+				response = requests.get(url, timeout=DOWNLOAD_TIMEOUT)
+				response.raise_for_status()
+				data = response.content
+			except Exception as e:
+				debug("could not download image", url, ":", e)
+				return b"", b"", "failed"
+
+			if kind == "avatar":
+				data = scale_avatar(data)
+
+			try:
+				# write to a temporary file first, so no other thread can read a half written image
+				with open(file_name + ".tmp", "wb") as file:
+					file.write(data)
+				os.replace(file_name + ".tmp", file_name)
+			except OSError as e:
+				debug("could not cache image", url, ":", e)
+
+		mime_type = QMimeDatabase().mimeTypeForData(data).name().encode()
+		return mime_type, data, source
+
+	def count(self, source: str, data: bytes) -> None:
+		if source == "disk":
+			self.disk_hits += 1
+		elif source == "download":
+			self.downloads += 1
+			self.downloaded_bytes += len(data)
+		else:
+			self.failures += 1
+
+	# slot
+	def on_fetched(self, key: str, mime_type: bytes, data: bytes, source: str) -> None:
+		self.count(source, data)
+
+		if data:
+			self.to_memory(key, mime_type, data)
+
+		for callback in self.waiting.pop(key, []):
+			callback(mime_type, data)
+
+	# runs in the worker threads, removes the least recently used images until the disk cache fits MAX_DISK_BYTES
+	@staticmethod
+	def prune(folder: str) -> None:
+		files: list[tuple[float, int, str]] = []
+		total_bytes = 0
+
+		for file_name in os.listdir(folder):
+			path = os.path.join(folder, file_name)
+			try:
+				stat = os.stat(path)
+			except OSError:
+				continue
+
+			files.append((stat.st_atime, stat.st_size, path))
+			total_bytes += stat.st_size
+
+		if total_bytes <= MAX_DISK_BYTES:
+			return
+
+		files.sort()
+
+		removed = 0
+		for _atime, size, path in files:
+			if total_bytes <= MAX_DISK_BYTES:
+				break
+
+			try:
+				os.remove(path)
+			except OSError:
+				continue
+
+			total_bytes -= size
+			removed += 1
+
+		debug("removed", removed, "images from the image cache")
+
+	def stats(self) -> dict[str, int]:
+		return {
+			"memory_images": len(self.memory),
+			"memory_bytes": self.memory_bytes,
+			"memory_hits": self.memory_hits,
+			"disk_hits": self.disk_hits,
+			"downloads": self.downloads,
+			"downloaded_bytes": self.downloaded_bytes,
+			"shared": self.shared,
+			"failures": self.failures,
+			"waiting": len(self.waiting),
+		}
+
+	def log_stats(self) -> None:
+		debug(
+			"image cache:", len(self.memory), "images using", self.memory_bytes // 1024 // 1024, "MB in memory,",
+			self.memory_hits, "memory hits,", self.disk_hits, "disk hits,", self.downloads, "downloads",
+			"(" + str(self.downloaded_bytes // 1024) + " kB),", self.shared, "shared downloads,",
+			self.failures, "failed,", len(self.waiting), "loading"
+		)
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
+
+
+# offer global "image_cache" to all other modules
+image_cache = ImageCache()
@@ -0,0 +1,83 @@
+from functools import partial
+
+from PyQt6.QtCore import QBuffer, QByteArray
+from PyQt6.QtWebEngineCore import QWebEngineUrlScheme, QWebEngineUrlSchemeHandler, QWebEngineUrlRequestJob, \
+	QWebEngineProfile
+
+from mammudon.debugging import debug
+from mammudon.image_cache import IMAGE_SCHEME, decode_image_path, image_cache
+
+
+# needs to be called before the QApplication gets created
+def register_image_scheme() -> None:
+	scheme = QWebEngineUrlScheme(IMAGE_SCHEME)
+	scheme.setSyntax(QWebEngineUrlScheme.Syntax.Path)
+	scheme.setFlags(QWebEngineUrlScheme.Flag.SecureScheme | QWebEngineUrlScheme.Flag.CorsEnabled)
+	QWebEngineUrlScheme.registerScheme(scheme)
+
+
+class ImageSchemeHandler(QWebEngineUrlSchemeHandler):
+	def __init__(self):
+		super().__init__()
+
+		# jobs waiting for their image by number, the web engine deletes a job when its page goes away
+		# in the meantime, so it must not be answered anymore
+		self.jobs: dict[int, QWebEngineUrlRequestJob] = {}
+		self.job_number = 0
+
+	def requestStarted(self, job: QWebEngineUrlRequestJob) -> None:
+		decoded = decode_image_path(job.requestUrl().path())
+		if not decoded:
+			debug("malformed image URL:", job.requestUrl().toString())
+			job.fail(QWebEngineUrlRequestJob.Error.UrlInvalid)
+			return
+
+		self.job_number += 1
+		self.jobs[self.job_number] = job
+		job.destroyed.connect(partial(self.forget_job, self.job_number))
+
+		kind, url = decoded
+		image_cache.request(kind, url, partial(self.reply, self.job_number))
+
+	def forget_job(self, job_number: int, *_args) -> None:
+		self.jobs.pop(job_number, None)
+
+	def reply(self, job_number: int, mime_type: bytes, data: bytes) -> None:
+		job = self.jobs.pop(job_number, None)
+		if not job:
+			return
+
+		if not data:
+			job.fail(QWebEngineUrlRequestJob.Error.RequestFailed)
+			return
+
+		# the job takes care of deleting the buffer once the reply was read
+		buffer = QBuffer(job)
+		buffer.setData(QByteArray(data))
+		job.reply(mime_type, buffer)
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
+
+
+# one handler serves all web profiles
+image_scheme_handler: ImageSchemeHandler | None = None
+
+
+def install_image_scheme_handler(profile: QWebEngineProfile) -> None:
+	global image_scheme_handler
+
+	if not image_scheme_handler:
+		image_scheme_handler = ImageSchemeHandler()
+
+	if profile.urlSchemeHandler(IMAGE_SCHEME):
+		return
+
+	profile.installUrlSchemeHandler(IMAGE_SCHEME, image_scheme_handler)
@@ -13,13 +13,17 @@ from mammudon.account import Account
 from mammudon.account_manager import AccountManager
 from mammudon.conversations import Conversations
 from mammudon.debugging import debug
+from mammudon.document_timeline import DocumentTimeline
+from mammudon.drain_scheduler import drain_scheduler
 from mammudon.media_attachment import MediaAttachment
+from mammudon.memory_governor import memory_governor
 from mammudon.new_post import NewPost
 from mammudon.notifications import Notifications
 from mammudon.prefs import preferences
 from mammudon.scroller import Scroller
 from mammudon.timeline import Timeline
 from mammudon.user_profile import UserProfile
+from mammudon.virtual_timeline import VirtualTimeline
 
 
 # TODO: for Help / About - make sure we only have one place in the project that defines
@@ -465,11 +469,17 @@ class MainWindow(QMainWindow):
 		elif name == "conversations":
 			# WIP
 			timeline = Conversations(account, name, friendly_name)
+		elif preferences.values["timeline_renderer"] == "document":
+			timeline = DocumentTimeline(account, name, friendly_name)
+		elif preferences.values["timeline_renderer"] == "virtual":
+			timeline = VirtualTimeline(account, name, friendly_name)
 		else:
 			timeline = Timeline(account, name, friendly_name)
 
 		account.stream_listener_ready.connect(timeline.connect_to_stream_listener)
 		account.add_timeline(name, friendly_name, timeline)
+		memory_governor.add_scroller(timeline)
+		drain_scheduler.add_scroller(timeline)
 
 		# -1 = add at the end
 		self.add_scroller(-1, timeline)
@@ -485,6 +495,12 @@ class MainWindow(QMainWindow):
 
 	def close_scroller(self, scroller: Scroller, num_unreads: int = 0) -> None:
 		debug("close_scroller received from scroller", scroller.friendly_name, scroller.account.account_username)
+		memory_governor.remove_scroller(scroller)
+		drain_scheduler.remove_scroller(scroller)
+
+		# let go of the statuses this column shared with the other columns of the account
+		scroller.release_statuses()
+
 		self.remove_scroller(scroller)
 		self.adjust_unreads(-num_unreads)
 		scroller.account.remove_timeline(scroller.scroller_name)
@@ -506,7 +522,8 @@ class MainWindow(QMainWindow):
 	def open_profile(self, account_id: int) -> None:
 		profile: UserProfile = UserProfile(
 			self.last_used_account.mastodon, account_id,
-			self.last_used_account.account["id"]
+			self.last_used_account.account["id"],
+			self.last_used_account.emoji_index
 		)
 
 		self.add_scroller(self.timeline_scroller_layout.indexOf(self.sender()), profile)
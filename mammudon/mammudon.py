@@ -5,9 +5,18 @@ from PyQt6.QtWidgets import QApplication
 
 from mammudon.prefs import preferences
 from mammudon.main_window import MainWindow
+from mammudon.memory_governor import memory_governor
+from mammudon.post_view_pool import post_view_pool
+from mammudon.image_scheme import register_image_scheme
+from mammudon.theme_scheme import register_theme_scheme
+from mammudon.web_profile import web_profile
 
 
 def main() -> int:
+	# custom URL schemes must be known before the QApplication gets created
+	register_theme_scheme()
+	register_image_scheme()
+
 	app = QApplication(sys.argv)
 
 	app.setOrganizationName("Mammudon")
@@ -16,9 +25,18 @@ def main() -> int:
 	preferences.app = app
 	preferences.load_settings()
 
+	# all web pages share one persistent profile with an on-disk cache, it gets created with the first page
+	web_profile.set_cache_size(preferences.values["web_cache_size"])
+
 	app.setQuitOnLastWindowClosed(not preferences.values["minimize_to_tray"])
 
 	window = MainWindow()
 	window.show()
 
+	# have a few PostViews ready by the time the first timeline posts come in
+	post_view_pool.warm_up()
+
+	memory_governor.set_budget(preferences.values["memory_budget"])
+	memory_governor.start()
+
 	return app.exec()
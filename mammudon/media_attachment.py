@@ -1,8 +1,5 @@
-import os
-
 from PyQt6 import QtCore
 
-from PyQt6.uic import loadUi
 
 from PyQt6.QtCore import pyqtSignal
 
@@ -10,6 +7,7 @@ from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWidgets import QLabel, QPushButton
 
 from mammudon.debugging import debug
+from mammudon.ui_forms import load_form
 
 
 # this class does not hold the actual media data, only a preview image
@@ -30,7 +28,7 @@ class MediaAttachment(QLabel):
 		# mastodon media uses -1.0..1.0, so it needs to be recalculated on upload
 		self.focus: tuple[float, float] = (0.5, 0.5)
 
-		loadUi(os.path.join(os.path.dirname(__file__), "ui", "media_attachment.ui"), self)
+		load_form("media_attachment", self)
 
 		self.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
 
@@ -1,10 +1,12 @@
 from PyQt6.QtCore import QSettings, QSize, QPoint, pyqtSignal
 from PyQt6.QtGui import QCloseEvent
-from PyQt6.QtWebEngineCore import QWebEngineSettings
+from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineSettings
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 
 from PyQt6.QtWidgets import QWidget
 
+from mammudon.web_profile import web_profile
+
 
 class MediaPlayback(QWebEngineView):
 	closed = pyqtSignal(QWidget)
@@ -21,6 +23,8 @@ class MediaPlayback(QWebEngineView):
 		self.move(QPoint(settings.value("pos", QPoint(100, 100))))
 		settings.endGroup()
 
+		self.setPage(QWebEnginePage(web_profile.profile(), self))
+
 		self.settings().setAttribute(QWebEngineSettings.WebAttribute.ShowScrollBars, False)
 		self.settings().setAttribute(QWebEngineSettings.WebAttribute.PlaybackRequiresUserGesture, False)
 
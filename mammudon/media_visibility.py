@@ -0,0 +1,98 @@
+import time
+from typing import Callable
+
+from PyQt6.QtCore import QObject, QEvent, QPoint, QRect, QTimer
+from PyQt6.QtWidgets import QScrollArea
+
+# milliseconds to wait for scrolling or resizing to settle before checking which posts are on screen
+MEDIA_CHECK_DELAY = 100
+
+# seconds a post's media stays paused off screen before it gets unloaded to free the decoder's memory
+MEDIA_UNLOAD_DELAY = 60
+
+
+# pauses the videos and audio players of PostViews that are outside the visible part of a scroller, and in
+# scrollers that are hidden, plays them again when they come back into view, and unloads them after a while
+class MediaVisibility(QObject):
+	def __init__(self, scroll_area: QScrollArea, post_views: Callable[[], list]):
+		super().__init__()
+
+		self.scroll_area = scroll_area
+		self.post_views = post_views
+
+		self.check_timer = QTimer()
+		self.check_timer.timeout.connect(self.update_media)
+		self.check_timer.setSingleShot(True)
+
+		# runs again when the next paused media is due to be unloaded
+		self.unload_timer = QTimer()
+		self.unload_timer.timeout.connect(self.update_media)
+		self.unload_timer.setSingleShot(True)
+
+		self.scroll_area.installEventFilter(self)
+		self.scroll_area.viewport().installEventFilter(self)
+		self.scroll_area.widget().installEventFilter(self)
+		self.scroll_area.verticalScrollBar().valueChanged.connect(self.schedule_update)
+
+	def eventFilter(self, o: QObject, e: QEvent) -> bool:
+		# posts moved around, the visible part changed, or the whole scroller got hidden or shown
+		if e.type() in [QEvent.Type.LayoutRequest, QEvent.Type.Resize, QEvent.Type.Show, QEvent.Type.Hide]:
+			self.schedule_update()
+
+		return False
+
+	def schedule_update(self, *_args) -> None:
+		if not self.check_timer.isActive():
+			self.check_timer.start(MEDIA_CHECK_DELAY)
+
+	def update_media(self) -> None:
+		viewport = self.scroll_area.viewport()
+		visible = self.scroll_area.isVisible()
+		visible_rect = viewport.rect()
+
+		now = time.monotonic()
+		next_unload = 0.0
+
+		for post_view in self.post_views():
+			if not post_view.playable_media:
+				continue
+
+			on_screen = (
+				visible and
+				post_view.isVisible() and
+				visible_rect.intersects(QRect(post_view.mapTo(viewport, QPoint(0, 0)), post_view.size()))
+			)
+
+			if on_screen:
+				post_view.resume_media()
+				continue
+
+			post_view.pause_media()
+
+			if post_view.media_unloaded or not post_view.media_paused_since:
+				continue
+
+			unload_at = post_view.media_paused_since + MEDIA_UNLOAD_DELAY
+			if unload_at <= now:
+				post_view.unload_media()
+			elif not next_unload or unload_at < next_unload:
+				next_unload = unload_at
+
+		if next_unload:
+			self.unload_timer.start(int((next_unload - now) * 1000) + 1)
+
+	# the application got minimized, nobody sees anything anymore
+	def pause_all(self) -> None:
+		for post_view in self.post_views():
+			if post_view.playable_media:
+				post_view.pause_media()
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
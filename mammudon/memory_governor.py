@@ -0,0 +1,184 @@
+from PyQt6.QtCore import QTimer
+
+from mammudon.debugging import debug
+from mammudon.image_cache import image_cache
+from mammudon.post_view_pool import post_view_pool
+from mammudon.render_stats import render_stats
+
+# milliseconds between two checks of the memory use
+GOVERNOR_INTERVAL = 30 * 1000
+
+# default memory budget for all columns together, changeable in the preferences
+DEFAULT_MEMORY_BUDGET_MB = 1024
+
+# once over budget, free memory until the estimated use is down to this part of the budget
+RELIEF_TARGET = 0.8
+
+# memory of a shown web page as long as render_stats couldn't measure the render processes yet
+WEB_PAGE_ESTIMATE = 4 * 1024 * 1024
+
+# memory of a status dict on top of its content
+STATUS_OVERHEAD = 4 * 1024
+
+# web pages of posts closer than this many pixels to the visible part of a timeline are never discarded
+KEEP_PAGES_DISTANCE = 2000
+
+
+# estimates the memory used by each column and the caches shared between them, and when the total goes over
+# the budget, frees memory step by step, cheapest to restore first, until the total is back below RELIEF_TARGET:
+#   1. web pages of posts far away from the visible part of their timeline, they load again when scrolled to
+#   2. spare PostViews waiting in the post_view_pool
+#   3. rendered HTML in the timelines and the accounts' render caches, posts get formatted again when needed
+#   4. half of the images in the image cache's memory, they get read back from its disk cache
+#   5. web pages of all posts that are not on screen
+class MemoryGovernor:
+	def __init__(self):
+		self.budget = DEFAULT_MEMORY_BUDGET_MB * 1024 * 1024
+
+		# all columns by id(), Scroller can't be put in a set or used as a key, see its __eq__()
+		self.scrollers: dict[int, object] = {}
+
+		self.timer: QTimer | None = None
+
+		self.reliefs = 0
+		self.freed = 0
+
+	# QTimer needs a running QApplication, so this gets called once the main window is up
+	def start(self) -> None:
+		if not self.timer:
+			self.timer = QTimer()
+			self.timer.timeout.connect(self.check)
+
+		self.timer.start(GOVERNOR_INTERVAL)
+
+	def set_budget(self, budget_mb: int) -> None:
+		self.budget = budget_mb * 1024 * 1024
+
+	def add_scroller(self, scroller) -> None:
+		self.scrollers[id(scroller)] = scroller
+
+	def remove_scroller(self, scroller) -> None:
+		self.scrollers.pop(id(scroller), None)
+
+	# what a shown web page costs, measured from the render processes if possible
+	@staticmethod
+	def page_bytes() -> int:
+		stats = render_stats.stats()
+		return stats["web_memory_per_page"] or WEB_PAGE_ESTIMATE
+
+	def accounts(self) -> list:
+		accounts = {}
+		for scroller in self.scrollers.values():
+			accounts[id(scroller.account)] = scroller.account
+
+		return list(accounts.values())
+
+	# estimated memory use in bytes, by column and for everything shared between the columns
+	def usage(self) -> tuple[dict[int, int], int]:
+		page_bytes = self.page_bytes()
+
+		columns: dict[int, int] = {}
+		for key, scroller in self.scrollers.items():
+			usage = scroller.memory_usage()
+			columns[key] = usage["pages"] * page_bytes + usage["html"] + usage["statuses"]
+
+		shared = (
+			image_cache.memory_bytes +
+			len(post_view_pool.spare_views) * page_bytes +
+			sum(account.render_cache.size() for account in self.accounts())
+		)
+
+		return columns, shared
+
+	def check(self) -> None:
+		columns, shared = self.usage()
+		total = sum(columns.values()) + shared
+
+		self.show_usage(columns)
+
+		if total <= self.budget:
+			return
+
+		debug("memory use of about", total // 1024 // 1024, "MB is over the budget of", self.budget // 1024 // 1024, "MB")
+		self.relieve(columns, total)
+
+	def show_usage(self, columns: dict[int, int]) -> None:
+		# every column gets an equal share of the budget
+		column_budget = self.budget // max(1, len(self.scrollers))
+
+		for key, scroller in self.scrollers.items():
+			scroller.show_memory_usage(columns[key], column_budget)
+
+	def relieve(self, columns: dict[int, int], total: int) -> None:
+		target = int(self.budget * RELIEF_TARGET)
+		start_total = total
+
+		self.reliefs += 1
+
+		# the biggest columns have to give up their memory first
+		scrollers = [self.scrollers[key] for key in sorted(columns, key=lambda key: -columns[key])]
+		page_bytes = self.page_bytes()
+
+		for scroller in scrollers:
+			if total <= target:
+				break
+			total -= scroller.discard_pages(KEEP_PAGES_DISTANCE) * page_bytes
+
+		if total > target:
+			total -= post_view_pool.shrink(0) * page_bytes
+
+		if total > target:
+			for scroller in scrollers:
+				total -= scroller.drop_html()
+
+			for account in self.accounts():
+				total -= account.render_cache.trim(0)
+
+		if total > target:
+			total -= image_cache.shrink(image_cache.memory_bytes // 2)
+
+		for scroller in scrollers:
+			if total <= target:
+				break
+			total -= scroller.discard_pages(0) * page_bytes
+
+		self.freed += start_total - total
+
+		debug("freed about", (start_total - total) // 1024 // 1024, "MB,", "now at about", total // 1024 // 1024, "MB")
+
+		self.show_usage(self.usage()[0])
+
+	def stats(self) -> dict[str, int]:
+		columns, shared = self.usage()
+
+		return {
+			"budget": self.budget,
+			"columns": len(columns),
+			"columns_bytes": sum(columns.values()),
+			"shared_bytes": shared,
+			"reliefs": self.reliefs,
+			"freed": self.freed,
+		}
+
+	def log_stats(self) -> None:
+		stats = self.stats()
+
+		debug(
+			"memory governor:", stats["columns"], "columns using about", stats["columns_bytes"] // 1024 // 1024, "MB,",
+			stats["shared_bytes"] // 1024 // 1024, "MB shared,", "budget", stats["budget"] // 1024 // 1024, "MB,",
+			stats["reliefs"], "times over budget,", stats["freed"] // 1024 // 1024, "MB freed"
+		)
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
+
+
+# offer global "memory_governor" to all other modules
+memory_governor = MemoryGovernor()
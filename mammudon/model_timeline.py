@@ -0,0 +1,533 @@
+# the parts Timeline, VirtualTimeline and DocumentTimeline have in common: they keep their posts in a TimelineModel,
+# poll and queue posts, format them in the format_pool and send the status actions of the account, the subclasses
+# only decide how the posts in the model get shown
+
+import webbrowser
+
+from PyQt6.QtCore import Qt, QTimer, QObject, pyqtSignal
+from PyQt6.QtWidgets import QMessageBox
+
+from mammudon.account import Account
+from mammudon.debugging import debug
+from mammudon.drain_scheduler import drain_scheduler
+from mammudon.format_pool import format_pool
+from mammudon.format_post import format_native_post
+from mammudon.history import History
+from mammudon.listener import Listener
+from mammudon.post_index import PostIndex
+from mammudon.post_view_pool import post_view_pool
+from mammudon.prefs import preferences
+from mammudon.scroller import Scroller
+from mammudon.status_post import PostView
+from mammudon.status_store import status_differs
+from mammudon.timeline_model import PostRecord, TimelineModel
+
+
+class ModelTimeline(Scroller):
+
+	# (status dict, rendered HTML, format ticket) handed back from the format_pool worker threads
+	post_formatted = pyqtSignal(object, str, int)
+
+	# plain text posts get shown natively without a web page, see format_native_post(), subclasses that render
+	# all posts as HTML turn this off
+	native_posts = True
+
+	def __init__(
+			self,
+			account: Account,
+			name: str,
+			friendly_name: str):
+
+		super().__init__(name=name, friendly_name=friendly_name, account=account)
+
+		self.history_view: History | None = None
+
+		self.count_as_unread = (self.scroller_name not in ["public", "local"])
+
+		# the statuses of this timeline, their threads and unread state, the subclasses only show them
+		self.model = TimelineModel(count_as_unread=self.count_as_unread, status_store=self.account.status_store)
+
+		# PostViews of the posts this timeline shows as widgets, by post id, subclasses decide which posts get one
+		self.post_views: dict[int, PostView] = {}
+
+		# contains status dicts by id, added e.g. from the account listener to be added to this timeline
+		self.post_queue: dict[int, dict] = {}
+
+		# the ticket of the newest version of a queued post that is being formatted, by queued post id, the
+		# format_pool workers can finish two versions of the same post in any order, see on_post_formatted()
+		self.format_tickets: dict[int, int] = {}
+		self.format_ticket = 0
+		self.stale_formats = 0
+
+		# connect signals
+		self.reload_button.clicked.connect(self.on_reload_button_clicked)
+		self.close_button.clicked.connect(self.on_close_button_clicked)
+		self.post_formatted.connect(self.on_post_formatted)
+		self.model.post_inserted.connect(self.on_post_inserted)
+		self.model.post_updated.connect(self.on_post_updated)
+		self.model.post_removed.connect(self.on_post_removed)
+		self.model.post_reparented.connect(self.on_post_reparented)
+		self.model.unread_changed.connect(self.on_post_unread_changed)
+
+		# updates from the other timelines only come in after the update that caused them is done, so the model
+		# already knows the newest version if it was this timeline's own update
+		self.account.status_store.status_changed.connect(self.on_status_changed, Qt.ConnectionType.QueuedConnection)
+		self.account.status_store.status_deleted.connect(self.on_status_deleted)
+
+		# catch mouse clicks on the timeline icon to jump to next unread post
+		self.timeline_icon_widget.installEventFilter(self)
+
+		# reload all posts in the timeline instead of just from the newest post on
+		self.full_reload = True
+
+		# 1 minute timeline auto update - TODO: make configurable
+		self.refresh_time = 60 * 1000
+
+		self.newest_id = 0
+
+		# timeline poll timer
+		self.update_timer = QTimer()
+		self.update_timer.timeout.connect(self.update_timeline)
+		self.update_timer.setSingleShot(True)
+
+		# first timeline update shortly after creating the container, will be adjusted in the reload function
+		self.update_timer.start(1000)
+
+		# the remaining time display on the reload button gets updated periodically by the drain_scheduler
+
+	def open_account_profile(self, account_id: int) -> None:
+		self.open_profile.emit(account_id)
+
+	def media_post_views(self) -> list[PostView]:
+		return list(self.post_views.values())
+
+	# the posts that count towards the maximum timeline length, oldest last, needs to be re-implemented by
+	# subclasses that purge replies together with the post they are threaded under
+	def purge_index(self) -> PostIndex:
+		return self.model.post_index
+
+	def purge_posts(self) -> None:
+		# public/local are excluded from the active window rule for the amount of data coming in
+
+		# TODO: only purge posts from the last one backwards until we hit one that is not marked as read,
+		#       needs better logic here
+		if self.window().isActiveWindow() or self.scroller_name in ["public", "local"]:
+			purge_index = self.purge_index()
+			timeline_length = self.timeline_length()
+			while len(purge_index) > timeline_length:
+				# the oldest post is always the last one, boosts are sorted by the boost's id
+				id_to_delete = purge_index.oldest()
+
+				debug("timeline exceeds", timeline_length, "... removing post", id_to_delete)
+				self.model.remove(id_to_delete)
+
+	def inserts_done(self) -> None:
+		self.purge_posts()
+
+	def release_statuses(self) -> None:
+		# posts still waiting to be inserted would share their statuses again
+		self.pending_inserts.clear()
+		self.post_queue.clear()
+		self.format_tickets.clear()
+
+		self.model.clear()
+
+	def application_minimized(self) -> None:
+		self.purge_posts()
+		super().application_minimized()
+
+	def load_post_context(self, post_id: int) -> None:
+		try:
+			context = self.mastodon.status_context(post_id)
+			for post in context["ancestors"]:
+				self.post_queue[post["id"]] = post
+			for post in context["descendants"]:
+				self.post_queue[post["id"]] = post
+		except Exception as e:
+			debug("could not fetch context for post", post_id, str(e))
+
+	# the account's ActionThread sends it to the server, status_update_callback() gets the answer
+	def send_status_action(self, post_id: int, action: str, **options) -> None:
+		self.account.status_action({"status_id": post_id, "action": action, "callback": self.status_update_callback, **options})
+
+	# TODO: boost with visibility
+	def boost_post(self, post_view: PostView, checked: bool) -> None:
+		post_view.boost_button.setEnabled(False)
+		self.send_status_action(post_view.id, "boost", boosted=checked)
+
+	def favorite_post(self, post_view: PostView, checked: bool) -> None:
+		post_view.favorite_button.setEnabled(False)
+		self.send_status_action(post_view.id, "favourite", favourited=checked)
+
+	def bookmark_post(self, post_view: PostView, checked: bool) -> None:
+		post_view.bookmark_button.setEnabled(False)
+		self.send_status_action(post_view.id, "bookmark", bookmarked=checked)
+
+	# TODO: ask for confirmation
+	def delete_post(self, post_view: PostView) -> None:
+		post_view.post_action_delete.setEnabled(False)
+		self.send_status_action(post_view.id, "delete")
+
+	def mute_post(self, post_view: PostView, checked: bool) -> None:
+		post_view.post_action_mute.setEnabled(False)
+		self.send_status_action(post_view.id, "mute", muted=checked)
+
+	def reload_post(self, post_view: PostView) -> None:
+		post_view.setEnabled(False)
+		self.send_status_action(post_view.id, "reload")
+
+	def status_update_callback(self, post_id, update: dict) -> None:
+		if post_id not in self.model:
+			return
+
+		# the status_store hands the updated post to all timelines showing it, see on_status_changed()
+		action: str = update["action"]
+		if action == "delete":
+			self.model.remove(post_id)
+			return
+
+		if action == "reload":
+			self.queue_post(update["result"])
+		elif action not in ["boost", "favourite", "bookmark", "mute"]:
+			debug("unknown status update", update)
+			return
+
+		# the post might have no PostView, or it scrolled out of view in the meantime
+		post_view = self.post_views.get(post_id, None)
+		if not post_view:
+			return
+
+		if action == "boost":
+			post_view.boost_button.setEnabled(True)
+		elif action == "favourite":
+			post_view.favorite_button.setEnabled(True)
+		elif action == "bookmark":
+			post_view.bookmark_button.setEnabled(True)
+		elif action == "mute":
+			post_view.post_action_mute.setEnabled(True)
+		else:
+			post_view.setEnabled(True)
+
+	# slot, a status action or another timeline of this account brought a newer version of one of our posts
+	def on_status_changed(self, status: dict) -> None:
+		record = self.model.record(status["id"])
+		if record and status_differs(record.post, status):
+			self.queue_post(dict(status))
+
+			# pull it into our timeline right after
+			drain_scheduler.countdown_soon(self)
+
+	# slot
+	def on_status_deleted(self, status_id: int) -> None:
+		self.model.remove(status_id)
+
+	@staticmethod
+	def in_browser(post: dict) -> None:
+		webbrowser.open(post["url"])
+
+	def show_post_history(self, post_view: PostView) -> None:
+		record = self.model.record(post_view.id)
+		if not record:
+			return
+
+		if not record.history:
+			record.history = self.mastodon.status_history(post_view.id)
+			post_view.set_history(record.history)
+
+		self.history_view = History(None, record.history)
+		self.history_view.show()
+
+	def vote_in_poll(self, post_id: int, poll_id: int, voted_options: list[int]) -> None:
+		try:
+			# TODO: in an upcoming mastodon API version this will return the resulting votes in the poll, so
+			#       switch to that when it becomes available
+			# TODO: move this into the Account's ActionThread
+			self.mastodon.poll_vote(int(poll_id), voted_options)
+			requested_post = self.mastodon.status(post_id)
+			self.post_queue[post_id] = requested_post
+
+		except Exception as e:
+			str_args: list[str] = []
+			for x in e.args:
+				str_args.append(str(x))
+			QMessageBox.information(self, "Mammudon", "Could not vote in the poll:\n" + str_args[0] + "\n" + " - ".join(str_args[1:]))
+
+	def refresh_poll(self, post_id: int) -> None:
+		record = self.model.record(post_id)
+		if not record or not record.post["poll"]:
+			return
+
+		# we could use mastodon.poll(poll_id) to update the poll but that won't read changes in the text
+		# or spoilers etc. so we just reload the whole post
+		record.refresh_poll = True
+		self.send_status_action(post_id, "reload")
+
+	def on_poll_vote(self, poll_id: int, voted_options: list[int]) -> None:
+		post_view: QObject = self.sender()
+		post_view: PostView
+
+		self.vote_in_poll(post_view.id, poll_id, voted_options)
+
+	def on_poll_refresh(self, _poll_id: int) -> None:
+		post_view: QObject = self.sender()
+		post_view: PostView
+
+		self.refresh_poll(post_view.id)
+
+	# TODO: allow showing poll results and switching back to voting
+	def on_poll_show_results(self, poll_id: int) -> None:
+		post_view: QObject = self.sender()
+		post_view: PostView
+		debug(poll_id, post_view.id)
+
+	# slot
+	def on_reply_to_post(self, post: dict) -> None:
+		self.reply_to_post.emit(post, True)
+
+	# slot
+	def on_view_unread_changed(self, unread: bool) -> None:
+		post_view: QObject = self.sender()
+		post_view: PostView
+
+		self.model.set_unread(post_view.id, unread)
+
+	# hooks up a PostView that is about to show one of our posts, post_view_pool.release() disconnects it again
+	def connect_post_view(self, post_view: PostView) -> None:
+		self.minimized.connect(post_view.minimized)
+
+		# TODO: not sure this is the best way to hook this up, this will just pop up the
+		#       current NewPost() dialog if one is already open, and no reply stuff will
+		#       be added to it. Should we just open multiple post dialogs?
+		post_view.reply_to_post_clicked.connect(self.on_reply_to_post)
+
+		# the model keeps the unread state and forwards changes to on_post_unread_changed()
+		post_view.is_unread.connect(self.on_view_unread_changed)
+
+		post_view.post_context_requested.connect(self.load_post_context)
+		post_view.show_history_clicked.connect(self.show_post_history)
+		post_view.boost_post.connect(self.boost_post)
+		post_view.favorite_post.connect(self.favorite_post)
+		post_view.bookmark_post.connect(self.bookmark_post)
+		post_view.delete_post.connect(self.delete_post)
+		post_view.mute_post.connect(self.mute_post)
+		post_view.in_browser.connect(self.in_browser)
+		post_view.reload_post.connect(self.reload_post)
+		post_view.account_clicked.connect(self.open_account_profile)
+		post_view.mouse_wheel_event.connect(self.scroll_event)
+		post_view.poll_vote.connect(self.on_poll_vote)
+		post_view.poll_refresh.connect(self.on_poll_refresh)
+		post_view.poll_show_results.connect(self.on_poll_show_results)
+
+	# hands the PostView of a post back to the post_view_pool, the post stays in the model
+	def release_view(self, post_id: int) -> None:
+		post_view = self.post_views.pop(post_id)
+		self.minimized.disconnect(post_view.minimized)
+		post_view_pool.release(post_view)
+
+	# brings a PostView up to date with the record it shows, the HTML only when it changed or the view is new
+	def update_view(self, post_view: PostView, record: PostRecord, content_changed: bool = True) -> None:
+		post = record.post
+
+		# remember the last known post content, the same dict as the record's, see refresh_poll()
+		post_view.set_original_post(post)
+		post_view.set_history(record.history)
+
+		post_view.set_reply_count(post["replies_count"])
+		post_view.set_boost_count(post["reblogs_count"])
+		post_view.set_favorite_count(post["favourites_count"])
+
+		# streaming posts don't provide these, so guard against NoneType
+		post_view.set_boosted(post.get("reblogged", False))
+		post_view.set_favorited(post.get("favourited", False))
+		post_view.set_bookmarked(post.get("bookmarked", False))
+		post_view.set_muted(post.get("muted", False))
+
+		if not content_changed:
+			return
+
+		if record.native_html:
+			post_view.set_native_html(record.native_html)
+		else:
+			# the HTML might have been dropped to save memory, see VirtualTimeline.drop_html()
+			if not record.post_html:
+				record.post_html = self.account.format_post(post, record.boosted_by)
+
+			post_view.set_html(record.post_html)
+
+	# post_html can be passed in when the post was already formatted in the format_pool
+	def add_post(self, post: dict, post_html: str = "") -> None:
+		# the model tells on_post_inserted() or on_post_updated() about it right away
+		record, content_changed = self.model.add_status(post)
+
+		# a reloaded post, or one updated by another timeline, got formatted without the boost it is shown with here
+		if record.boosted_by and not post["reblog"]:
+			post_html = ""
+
+		if content_changed:
+			record.native_html = format_native_post(preferences.values, record.post, record.boosted_by) if self.native_posts else ""
+			if record.native_html:
+				record.post_html = ""
+			else:
+				if not post_html:
+					post_html = self.account.format_post(record.post, record.boosted_by)
+				record.post_html = post_html
+
+		self.show_post(record, content_changed)
+
+	# needs to be re-implemented by subclasses, shows the post of a record that was just added or updated
+	def show_post(self, record: PostRecord, content_changed: bool) -> None:
+		pass
+
+	# slot, needs to be re-implemented by subclasses
+	def on_post_inserted(self, post_id: int) -> None:
+		pass
+
+	# slot, needs to be re-implemented by subclasses that thread replies under the post they reply to
+	def on_post_reparented(self, post_id: int, parent_id: int) -> None:
+		pass
+
+	# slot
+	def on_post_updated(self, post_id: int, content_changed: bool) -> None:
+		if not content_changed:
+			return
+
+		# this is an edited post, so fetch its history, the model set it to unread already
+		record = self.model.record(post_id)
+		try:
+			record.history = self.mastodon.status_history(post_id)
+		except Exception as e:
+			debug("could not load history for post", post_id, str(e))
+			return
+
+		post_view = self.post_views.get(post_id, None)
+		if post_view:
+			post_view.set_history(record.history)
+
+	# slot, needs to be re-implemented by subclasses
+	def on_post_removed(self, post_id: int, _record: PostRecord) -> None:
+		pass
+
+	def on_reload_button_clicked(self) -> None:
+		self.full_reload = True
+		self.update_timeline()
+
+	def update_timeline(self) -> None:
+		try:
+			if self.full_reload:
+				# first time loading or manual reload will pull in the whole timeline
+				timeline: list[dict] = self.mastodon.timeline(self.scroller_name, limit=self.timeline_length(), only_media=False)
+			else:
+				# get the newest posts
+				timeline: list[dict] = self.mastodon.timeline(self.scroller_name, limit=self.timeline_length(), only_media=False, since_id=self.newest_id)
+
+			if len(timeline):
+				debug("Loaded timeline, length:", len(timeline), "for", self.friendly_name)
+
+			for post in timeline:
+				# record the newest automatically loaded post id
+				if post["id"] > self.newest_id:
+					self.newest_id = post["id"]
+				self.queue_post(post)
+
+			# DEBUG: test loading specific post IDs
+			# requested_post = self.mastodon.status(XXXXXXXXXXXXXXX)
+			# self.post_queue[requested_post["id"]] = requested_post
+
+		except Exception as e:
+			str_args: list[str] = []
+			for x in e.args:
+				str_args.append(str(x))
+			QMessageBox.information(self, "Mammudon", "Could not reload timeline " + self.friendly_name + ":\n" + " - ".join(str_args))
+
+		self.update_timer.start(self.refresh_time)
+
+		# pull the queued posts into our timeline right after
+		drain_scheduler.countdown_soon(self)
+
+		self.full_reload = False
+
+	def remaining_time(self) -> None:
+		remaining_update_time = self.update_timer.remainingTime()
+		if remaining_update_time < 0:
+			remaining_update_time = 0
+		self.reload_button.setText(str(remaining_update_time // 1000))
+		self.add_queued_posts()
+
+	def queue_post(self, post: dict) -> None:
+		self.post_queue[post["id"]] = post
+
+	def add_queued_posts(self) -> None:
+		# use a copy of the queue so a possible streaming thread in the background does not
+		# mess with it while we are working at inserting the queued posts
+		insert_queue = self.post_queue.copy()
+		if insert_queue:
+			# restart the update timer, so we only poll updates when
+			# there was no streaming content until the update timeout
+			self.update_timer.start(self.refresh_time)
+			# update the button, too
+			self.reload_button.setText(str(self.update_timer.remainingTime() // 1000))
+
+			# hand the posts over to the format_pool, on_post_formatted() adds them when the HTML is ready
+			for post in insert_queue.values():
+				self.format_ticket += 1
+				self.format_tickets[post["id"]] = self.format_ticket
+
+				format_pool.submit(self.format_queued_post, post, self.format_ticket)
+				self.post_queue.pop(post["id"])
+
+		if len(self.post_queue):
+			debug("post queue not yet empty, probably a thread put something in it while we were adding ... will be in the next round - in timeline", self.scroller_name)
+
+	# runs in a format_pool worker thread, so only read from the post and don't touch any widgets here
+	def format_queued_post(self, post: dict, ticket: int) -> None:
+		boosted_by = {}
+		status = post
+		if post["reblog"]:
+			boosted_by = post["account"]
+			status = post["reblog"]
+
+		try:
+			post_html = self.account.format_post(status, boosted_by)
+		except Exception as e:
+			# add_post() will try again on the GUI thread
+			debug("could not format post", post["id"], "in the background:", e)
+			post_html = ""
+
+		try:
+			self.post_formatted.emit(post, post_html, ticket)
+		except RuntimeError as e:
+			# the timeline was closed while the post was being formatted
+			debug("formatted post", post["id"], "has no timeline to go to anymore:", e)
+
+	# slot
+	def on_post_formatted(self, post: dict, post_html: str, ticket: int) -> None:
+		# a newer version of this post was queued after this one, it will come in on its own
+		if self.format_tickets.get(post["id"], None) != ticket:
+			self.stale_formats += 1
+			return
+
+		del self.format_tickets[post["id"]]
+
+		# the same status can come in as a boost and on its own, don't go back to an older edit of it
+		status = post["reblog"] or post
+		record = self.model.record(status["id"])
+		if record and record.post["edited_at"] and status["edited_at"] and status["edited_at"] < record.post["edited_at"]:
+			self.stale_formats += 1
+			return
+
+		# the formatted posts come in one by one, insert them in batches
+		self.schedule_insert(post, post_html)
+
+	def connect_to_stream_listener(self, stream_name: str, stream_listener: Listener) -> None:
+		if stream_name == self.scroller_name:
+			stream_listener.incoming_post.connect(self.queue_post)
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
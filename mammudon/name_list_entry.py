@@ -1,24 +1,24 @@
-import os
-import requests
-
 from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtGui import QImage, QPixmap
-from PyQt6.QtWebEngineCore import QWebEngineSettings
+from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineSettings
 
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 
-from PyQt6.uic import loadUi
 
 from PyQt6.QtWidgets import QWidget, QLabel, QPushButton
 
 from mammudon.debugging import debug
+from mammudon.emojis import EmojiIndex
+from mammudon.image_cache import image_cache
+from mammudon.ui_forms import load_form
+from mammudon.web_profile import web_profile
 
 
 class NameListEntry(QWidget):
-	def __init__(self, account: dict, following: bool):
+	def __init__(self, account: dict, following: bool, emoji_index: EmojiIndex):
 		super().__init__()
 
-		loadUi(os.path.join(os.path.dirname(__file__), "ui", "name_list_entry.ui"), self)
+		load_form("name_list_entry", self)
 
 		self.account: dict = account
 
@@ -27,20 +27,17 @@ class NameListEntry(QWidget):
 		self.username_label: QLabel = self.findChild(QLabel, "usernameLabel")
 		self.follow_button: QPushButton = self.findChild(QPushButton, "followBtn")
 
+		self.displayNameView.setPage(QWebEnginePage(web_profile.profile(), self.displayNameView))
 		self.displayNameView.settings().setAttribute(QWebEngineSettings.WebAttribute.ShowScrollBars, False)
 
-		# TODO: image cache
 		avatar_image = QImage()
-		avatar_image.loadFromData(requests.get(account["avatar"]).content)
+		avatar_image.loadFromData(image_cache.data("avatar", account["avatar"]))
 
 		self.avatar_label.setPixmap(QPixmap.fromImage(avatar_image.scaled(QSize(45, 45), Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)))
 		self.username_label.setText("@" + account["acct"])
 
 		# custom emojis
-		display_name_html: str = account["display_name"]
-		emoji: dict
-		for emoji in account["emojis"]:
-			display_name_html = display_name_html.replace(":" + emoji["shortcode"] + ":", "<img class=\"custom-emoji\" title=\"&#58;" + emoji["shortcode"] + "&#58;\" src=\"" + emoji["url"] + "\">")
+		display_name_html: str = emoji_index.replace(account["display_name"], account["emojis"])
 
 		# mark external links with an impossible URL extension, so link_clicked() can decide upon those later
 		display_name_html = display_name_html.replace('" target="_blank"', ' EXTERNAL LINK"')
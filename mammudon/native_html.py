@@ -0,0 +1,94 @@
+from html import escape
+from html.parser import HTMLParser
+
+# tags Qt's rich text engine shows just like a web page would, anything else needs the web path
+native_tags = frozenset({
+	"p", "br", "a", "span", "b", "strong", "i", "em", "u", "s", "del", "code", "pre", "blockquote", "ul", "ol", "li",
+})
+
+
+# turns the sanitized HTML of a status' content into the subset of HTML that QLabel can show, dropping all attributes
+# except the link targets, "supported" turns False as soon as the content uses markup outside of that subset
+class NativeHtml(HTMLParser):
+	def __init__(self):
+		super().__init__()
+
+		self.html = ""
+		self.supported = True
+
+		# mastodon hides the "https://" and the end of long links inside <span class="invisible">
+		self.spans: list[str] = []
+		self.invisible = 0
+
+	def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+		if tag not in native_tags:
+			self.supported = False
+			return
+
+		if tag == "br":
+			self.html += "<br>"
+			return
+
+		if tag == "span":
+			span_class = dict(attrs).get("class") or ""
+			self.spans.append(span_class)
+			if "invisible" in span_class.split():
+				self.invisible += 1
+			return
+
+		if tag == "a":
+			self.html += '<a href="' + escape(dict(attrs).get("href") or "") + '">'
+			return
+
+		self.html += "<" + tag + ">"
+
+	def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+		if tag == "br":
+			self.html += "<br>"
+			return
+
+		if tag not in native_tags:
+			self.supported = False
+
+	def handle_endtag(self, tag: str) -> None:
+		if tag not in native_tags or tag == "br":
+			return
+
+		if tag == "span":
+			if not self.spans:
+				return
+
+			span_class = self.spans.pop().split()
+			if "invisible" in span_class:
+				self.invisible -= 1
+			elif "ellipsis" in span_class:
+				self.html += "…"
+			return
+
+		self.html += "</" + tag + ">"
+
+	def handle_data(self, data: str) -> None:
+		if not self.invisible:
+			self.html += escape(data, quote=False)
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
+
+
+# returns the content in native HTML, or None if it needs a web page to show correctly
+def native_html(content: str) -> str | None:
+	parser = NativeHtml()
+	parser.feed(content)
+	parser.close()
+
+	if not parser.supported:
+		return None
+
+	return parser.html
@@ -6,16 +6,17 @@ from PyQt6.QtGui import QAction, QContextMenuEvent
 from PyQt6.QtWebEngineCore import QWebEngineSettings, QWebEnginePage
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWidgets import QWidget, QMenu, QApplication, QLabel
-from PyQt6.uic import loadUi
 
 from mammudon.debugging import debug
+from mammudon.ui_forms import load_form
+from mammudon.web_profile import web_profile
 
 
 # TODO: Why do we need a subclass for this to make installEventFilter work?
 class NotificationPage(QWebEnginePage):
 
 	def __init__(self, parent):
-		super(QWebEnginePage, self).__init__(parent)
+		super(QWebEnginePage, self).__init__(web_profile.profile(), parent)
 
 
 class NotificationView(QWidget):
@@ -28,7 +29,7 @@ class NotificationView(QWidget):
 
 		self.id = notification_id
 
-		loadUi(os.path.join(os.path.dirname(__file__), "ui", "notification_view.ui"), self)
+		load_form("notification_view", self)
 
 		self.web_view: QWebEngineView = self.findChild(QWebEngineView, "notificationView")
 		self.timestamp_label: QLabel = self.findChild(QLabel, "timestampLabel")
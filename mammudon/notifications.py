@@ -3,16 +3,16 @@ import sys
 import weakref
 import webbrowser
 
-from PyQt6.QtCore import pyqtSignal, QTimer
-from PyQt6.QtWidgets import QMessageBox, QApplication, QWidget
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer
+from PyQt6.QtWidgets import QMessageBox, QWidget
 
 from mammudon.account import Account
 from mammudon.debugging import debug
-from mammudon.format_post import format_notification
+from mammudon.drain_scheduler import drain_scheduler
 from mammudon.listener import Listener
 from mammudon.notification_view import NotificationView
-from mammudon.prefs import preferences
 from mammudon.scroller import Scroller
+from mammudon.status_store import status_differs
 
 
 class Notifications(Scroller):
@@ -36,6 +36,9 @@ class Notifications(Scroller):
 		# contains notification dicts by id, added e.g. from the account listener to be added to this timeline
 		self.notification_queue: dict[int, dict] = {}
 
+		# ids of the notifications about a status by the status' id, their statuses come from the status_store
+		self.status_notifications: dict[int, dict[int, None]] = {}
+
 		# DEBUG: add some signatures to these lists/dicts to be able to recognize them in gc.ger_references
 		#        this is done here separately so the pycharm parser doesn't think these are the types we want
 		self.deleted_notifications[self.DELETED_NOTIFICATIONS_SIGNATURE] = weakref.ref(self)  # DEBUG: add debugging signature
@@ -45,6 +48,10 @@ class Notifications(Scroller):
 		self.reload_button.clicked.connect(self.on_reload_button_clicked)  # TODO
 		self.close_button.clicked.connect(self.on_close_button_clicked)
 
+		# updates only come in after the update that caused them is done, see Timeline
+		self.account.status_store.status_changed.connect(self.on_status_changed, Qt.ConnectionType.QueuedConnection)
+		self.account.status_store.status_deleted.connect(self.on_status_deleted)
+
 		# reload all notifications in the timeline instead of just from the newest post on
 		self.full_reload = True
 
@@ -61,11 +68,7 @@ class Notifications(Scroller):
 		# first timeline update shortly after creating the container, will be adjusted in the reload function
 		self.update_timer.start(1000)
 
-		# update the remaining time display on the reload button periodically
-		self.remaining_time_updater = QTimer()
-		self.remaining_time_updater.timeout.connect(self.remaining_time)
-		self.remaining_time_updater.setSingleShot(True)
-		# timer gets started in self.on_reload_button_clicked() first, and then in each self.remaining_time() call
+		# the remaining time display on the reload button gets updated periodically by the drain_scheduler
 
 	def __del__(self) -> None:
 		debug("__del__eting timeline", self.scroller_name, "of account", self.account.account_username)
@@ -87,6 +90,7 @@ class Notifications(Scroller):
 		# debug("purging notification", id_to_delete, "from tracking dict")
 
 		if id_to_delete in self.notifications:
+			self.release_status(self.notifications[id_to_delete])
 			self.deleted_notifications[id_to_delete] = weakref.ref(self.notifications[id_to_delete])
 			del self.notifications[id_to_delete]
 			debug("popped notification", id_to_delete, "from timeline", self.scroller_name)
@@ -100,6 +104,7 @@ class Notifications(Scroller):
 	def delete_notification(self, notification_view: NotificationView) -> None:
 		# remove the post from the internal list of root posts
 		if notification_view.id in self.notifications:
+			self.release_status(notification_view)
 			del self.notifications[notification_view.id]
 
 		self.sender().deleteLater()   # tell qt to delete the NotificationView widget after returning from this signal
@@ -114,10 +119,45 @@ class Notifications(Scroller):
 	def in_browser(notification: dict) -> None:
 		webbrowser.open(notification["url"])
 
+	# let go of the status a notification was about, see add_post()
+	def release_status(self, notification_view: NotificationView) -> None:
+		status: dict = notification_view.original_post.get("status", None)
+		if not status:
+			return
+
+		self.account.status_store.release(status["id"])
+
+		notification_ids = self.status_notifications[status["id"]]
+		del notification_ids[notification_view.id]
+		if not notification_ids:
+			del self.status_notifications[status["id"]]
+
+	def release_statuses(self) -> None:
+		# notifications still waiting to be inserted would share their statuses again
+		self.pending_inserts.clear()
+		self.notification_queue.clear()
+
+		for status_id, notification_ids in self.status_notifications.items():
+			for _notification_id in notification_ids:
+				self.account.status_store.release(status_id)
+
+		self.status_notifications.clear()
+
 	def add_post(self, notification: dict) -> NotificationView:
 		notification_id: int = notification["id"]
 
 		notification_view: NotificationView = self.notifications.get(notification_id, None)
+
+		# the status a mention, boost or favourite is about, shared with the timelines that show it, too
+		status: dict = notification.get("status", None)
+		if status:
+			notification = dict(notification)
+			notification["status"] = self.account.status_store.share(status)
+
+			if not notification_view:
+				self.account.status_store.retain(status["id"])
+				self.status_notifications.setdefault(status["id"], {})[notification_id] = None
+
 		if not notification_view:
 			notification_view = NotificationView(notification_id=notification_id)
 
@@ -132,7 +172,7 @@ class Notifications(Scroller):
 			#               # In case of reblog / favourite, the reblogged / favourited status
 			# }
 
-			notification_html = format_notification(preferences.values, self.my_id, notification)
+			notification_html = self.account.format_notification(notification)
 			notification_view.set_html(notification_html)
 			# notification_view.set_html(
 			# 	notification["type"] + "\n" +
@@ -160,7 +200,7 @@ class Notifications(Scroller):
 
 		else:
 			# TODO: is there something else we need to do when we already know this notification?
-			notification_view.set_html(format_notification(preferences.values, self.my_id, notification))
+			notification_view.set_html(self.account.format_notification(notification))
 
 		notification_view.set_original_post(notification)
 
@@ -175,12 +215,12 @@ class Notifications(Scroller):
 			if self.full_reload:
 				# first time loading or manual reload will pull in the whole timeline
 				timeline: list[dict] = self.mastodon.notifications(
-					limit=preferences.values["max_timeline_length"]
+					limit=self.timeline_length()
 				)
 			else:
 				# get the newest posts
 				timeline: list[dict] = self.mastodon.notifications(
-					limit=preferences.values["max_timeline_length"], since_id=self.newest_id
+					limit=self.timeline_length(), since_id=self.newest_id
 				)
 
 			if len(timeline):
@@ -205,7 +245,7 @@ class Notifications(Scroller):
 		self.update_timer.start(self.refresh_time)
 
 		# pull the queued posts into our timeline right after
-		self.remaining_time_updater.start(10)
+		drain_scheduler.countdown_soon(self)
 
 		self.full_reload = False
 
@@ -215,7 +255,6 @@ class Notifications(Scroller):
 			remaining_update_time = 0
 		self.reload_button.setText(str(remaining_update_time // 1000))
 		self.add_queued_notifications()
-		self.remaining_time_updater.start(5000)
 
 		# DEBUG: check if all deleted notifications really get freed from memory
 		# if self.deleted_posts:  # this is how it should be later without the debugging signature
@@ -252,23 +291,50 @@ class Notifications(Scroller):
 			# update the button, too
 			self.reload_button.setText(str(self.update_timer.remainingTime() // 1000))
 
+			# they all go in together with the next run of the event loop, see Scroller.insert_pending()
 			for notification in insert_queue.values():
 				debug("adding queued notification", notification["id"], "in timeline", self.scroller_name)
-				self.add_post(notification)
+				self.schedule_insert(notification)
 				self.notification_queue.pop(notification["id"])
-				QApplication.instance().processEvents()
 
 		if len(self.notification_queue):
 			debug("notification queue not yet empty, probably a thread put something in it while we were adding ... will be in the next round - in timeline", self.scroller_name)
 		# else:
 		# 	debug("notification queue empty, good! - in timeline", self.scroller_name)
 
+		# with notifications waiting to be inserted, inserts_done() purges once they are in
+		if not self.pending_inserts:
+			self.purge_notifications()
+
+	def inserts_done(self) -> None:
 		self.purge_notifications()
 
 	def connect_to_stream_listener(self, stream_name: str, stream_listener: Listener) -> None:
 		if stream_name == self.scroller_name:
 			stream_listener.incoming_notification.connect(self.queue_notification)
 
+	# slot, a status action or a timeline of this account brought a newer version of a status we have notifications about
+	def on_status_changed(self, status: dict) -> None:
+		for notification_id in self.status_notifications.get(status["id"], {}):
+			notification: dict = self.notifications[notification_id].original_post
+			if not status_differs(notification["status"], status):
+				continue
+
+			notification = dict(notification)
+			notification["status"] = dict(status)
+			self.queue_notification(notification)
+
+			# pull it into our timeline right after
+			drain_scheduler.countdown_soon(self)
+
+	# slot, the notifications about a deleted status go, too
+	def on_status_deleted(self, status_id: int) -> None:
+		for notification_id in list(self.status_notifications.get(status_id, {})):
+			notification_view = self.notifications[notification_id]
+
+			self.purge_notification(notification_id)
+			notification_view.deleteLater()
+
 	def reload_notification(self, notification_view: NotificationView) -> None:
 		notification_view.setEnabled(False)
 		self.account.status_action({"status_id": notification_view.id, "action": "reload_notification", "callback": self.status_update_callback})
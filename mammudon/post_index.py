@@ -0,0 +1,81 @@
+import bisect
+
+
+# the posts of a timeline in the order they are shown, newest mammudon_sort_id first, so the position of a new post
+# is found by bisecting instead of sorting all ids again for every post, the position of a post in ids is its
+# position in the timeline's layout
+class PostIndex:
+	def __init__(self):
+		# post ids in timeline order, and their negated sort ids in the same order, which makes keys ascending
+		self.ids: list[int] = []
+		self.keys: list[int] = []
+
+		# negated sort id by post id, the sort id a post had when it got inserted, so it can be found again even
+		# after its status dict got a new mammudon_sort_id, e.g. from being boosted again
+		self.post_keys: dict[int, int] = {}
+
+	def __len__(self) -> int:
+		return len(self.ids)
+
+	def __contains__(self, post_id: int) -> bool:
+		return post_id in self.post_keys
+
+	# adds the post behind all posts with the same or a newer sort id and returns its position
+	def insert(self, post_id: int, sort_id: int) -> int:
+		if post_id in self.post_keys:
+			self.remove(post_id)
+
+		key = -sort_id
+		position = bisect.bisect_right(self.keys, key)
+
+		self.keys.insert(position, key)
+		self.ids.insert(position, post_id)
+		self.post_keys[post_id] = key
+
+		return position
+
+	def position(self, post_id: int) -> int | None:
+		key = self.post_keys.get(post_id, None)
+		if key is None:
+			return None
+
+		# posts with the same sort id are few, usually only one
+		position = bisect.bisect_left(self.keys, key)
+		while self.ids[position] != post_id:
+			position += 1
+
+		return position
+
+	# takes the post out and returns where it was, None if it wasn't in the index
+	def remove(self, post_id: int) -> int | None:
+		position = self.position(post_id)
+		if position is None:
+			return None
+
+		del self.keys[position]
+		del self.ids[position]
+		del self.post_keys[post_id]
+
+		return position
+
+	# id of the post with the oldest sort id, the first one to go when the timeline gets too long
+	def oldest(self) -> int | None:
+		if not self.ids:
+			return None
+
+		return self.ids[-1]
+
+	def clear(self) -> None:
+		self.ids.clear()
+		self.keys.clear()
+		self.post_keys.clear()
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
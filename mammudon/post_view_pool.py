@@ -0,0 +1,150 @@
+import time
+
+from PyQt6.QtCore import QTimer
+
+from mammudon.debugging import debug
+from mammudon.status_post import PostView
+
+# number of spare PostViews to create right after startup, before the first timeline loads
+WARM_UP_VIEWS = 8
+
+# spare PostViews to keep around at most, any further returned views get deleted, the federated
+# timeline can easily purge more posts at once than this, so tune it by watching log_stats()
+MAX_SPARE_VIEWS = 50
+
+
+# keeps PostViews that were purged or deleted from a timeline, so the next new post can reuse their
+# widgets and web page, instead of loading the .ui file and starting up a new web page every time
+class PostViewPool:
+	def __init__(self, max_spare_views: int = MAX_SPARE_VIEWS):
+		self.max_spare_views = max_spare_views
+
+		self.spare_views: list[PostView] = []
+
+		# number of views the warm up timer still has to create
+		self.warm_up_remaining = 0
+		self.warm_up_timer: QTimer | None = None
+
+		self.checkouts = 0
+		self.hits = 0
+		self.misses = 0
+		self.returns = 0
+		self.discarded = 0
+
+		# time spent creating new PostViews, in seconds, the warm up cost is counted separately
+		self.create_time = 0.0
+		self.warm_up_time = 0.0
+		self.warm_up_views = 0
+
+	# create a few PostViews in the background, one per run of the event loop, so the UI stays responsive
+	def warm_up(self, count: int = WARM_UP_VIEWS) -> None:
+		self.warm_up_remaining = count
+
+		# QTimer needs a running QApplication, so create it only now
+		if not self.warm_up_timer:
+			self.warm_up_timer = QTimer()
+			self.warm_up_timer.timeout.connect(self.warm_up_step)
+
+		self.warm_up_timer.start(0)
+
+	def warm_up_step(self) -> None:
+		if self.warm_up_remaining <= 0 or len(self.spare_views) >= self.max_spare_views:
+			self.warm_up_timer.stop()
+			debug("post view pool warmed up with", self.warm_up_views, "views in", "%.0f" % (self.warm_up_time * 1000), "ms")
+			return
+
+		start = time.perf_counter()
+		post_view = PostView(authored_by_me=False, post_id=0)
+		# the web page is what takes the longest to start up, so have it ready, too
+		post_view.create_page()
+		self.spare_views.append(post_view)
+		self.warm_up_time += time.perf_counter() - start
+
+		self.warm_up_views += 1
+		self.warm_up_remaining -= 1
+
+	# hand out a spare PostView set up for this post, or a new one if there are no spare views left
+	def checkout(self, *, authored_by_me: bool, post_id: int, threaded=False, count_as_unread=True) -> PostView:
+		self.checkouts += 1
+
+		if self.spare_views:
+			self.hits += 1
+
+			post_view = self.spare_views.pop()
+			post_view.recycle(post_id=post_id, authored_by_me=authored_by_me, unread=False, threaded=threaded, count_as_unread=count_as_unread)
+			return post_view
+
+		self.misses += 1
+
+		start = time.perf_counter()
+		post_view = PostView(authored_by_me=authored_by_me, post_id=post_id, threaded=threaded, count_as_unread=count_as_unread)
+		self.create_time += time.perf_counter() - start
+
+		return post_view
+
+	# take back a PostView that is not needed anymore, the caller has already removed it from its layout
+	# and tracking dicts, any signal connections to it get cut here
+	def release(self, post_view: PostView) -> None:
+		self.returns += 1
+
+		post_view.disconnect_signals()
+		post_view.hide()
+		post_view.setParent(None)
+
+		if len(self.spare_views) >= self.max_spare_views:
+			self.discarded += 1
+			post_view.deleteLater()
+			return
+
+		# stops any media playback and frees the memory of the old post's page
+		post_view.clear()
+		self.spare_views.append(post_view)
+
+	# delete spare views until only "keep" are left, returns the number of deleted views
+	def shrink(self, keep: int) -> int:
+		removed = 0
+
+		while len(self.spare_views) > keep:
+			self.spare_views.pop().deleteLater()
+			self.discarded += 1
+			removed += 1
+
+		return removed
+
+	def stats(self) -> dict[str, int | float]:
+		return {
+			"spare_views": len(self.spare_views),
+			"max_spare_views": self.max_spare_views,
+			"checkouts": self.checkouts,
+			"hits": self.hits,
+			"misses": self.misses,
+			"returns": self.returns,
+			"discarded": self.discarded,
+			"create_ms": self.create_time * 1000 / self.misses if self.misses else 0.0,
+			"warm_up_views": self.warm_up_views,
+			"warm_up_ms": self.warm_up_time * 1000,
+		}
+
+	def log_stats(self) -> None:
+		debug(
+			"post view pool:", len(self.spare_views), "of", self.max_spare_views, "spare views,",
+			self.checkouts, "checkouts,", self.hits, "hits,", self.misses, "misses,",
+			self.returns, "returns,", self.discarded, "discarded,",
+			"(" + str(self.hits * 100 // self.checkouts) + "% hit rate)" if self.checkouts else "",
+			"%.1f ms per new view," % (self.create_time * 1000 / self.misses) if self.misses else "",
+			"warm up", self.warm_up_views, "views in", "%.0f ms" % (self.warm_up_time * 1000)
+		)
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
+
+
+# offer global "post_view_pool" to all other modules
+post_view_pool = PostViewPool()
@@ -13,6 +13,13 @@ from PyQt6.uic import loadUi
 
 from mammudon.debugging import debug
 from mammudon.format_post import format_post
+from mammudon.memory_governor import memory_governor, DEFAULT_MEMORY_BUDGET_MB
+from mammudon.web_profile import web_profile, DEFAULT_CACHE_SIZE_MB
+
+# most posts a timeline keeps, every post of the "One View per Post" and "Single Document" renderers costs a web page
+# or a part of one, the virtualized timeline only has PostViews for the posts on screen, so it can keep a lot more
+MAX_TIMELINE_LENGTH = 1000
+MAX_VIRTUAL_TIMELINE_LENGTH = 10000
 
 
 class PreferencesDialog(QDialog):
@@ -77,6 +84,9 @@ class Preferences(QObject):
 		self.show_media_combo: QComboBox = self.preferences_dialog.findChild(QComboBox, "showMediaCombo")
 		self.theme_combo: QComboBox = self.preferences_dialog.findChild(QComboBox, "themeCombo")
 		self.layout_combo: QComboBox = self.preferences_dialog.findChild(QComboBox, "layoutCombo")
+		self.timeline_renderer_combo: QComboBox = self.preferences_dialog.findChild(QComboBox, "timelineRendererCombo")
+		self.web_cache_size_spinner: QSpinBox = self.preferences_dialog.findChild(QSpinBox, "webCacheSizeSpinner")
+		self.memory_budget_spinner: QSpinBox = self.preferences_dialog.findChild(QSpinBox, "memoryBudgetSpinner")
 		self.minimize_to_tray_check: QCheckBox = self.preferences_dialog.findChild(QCheckBox, "minimizeToTrayCheck")
 
 		self.post_preview: QWebEngineView = self.preferences_dialog.findChild(QWebEngineView, "postPreview")
@@ -107,6 +117,14 @@ class Preferences(QObject):
 			self.layout_combo.setItemText(item, text.split(":")[0])
 			self.layout_combo.setItemData(item, text.split(":")[1])
 
+		# since Designer doesn't let us define user data per combo item, we do it
+		# ourselves by splitting the text at the ":"
+		num_items: int = self.timeline_renderer_combo.count()
+		for item in range(num_items):
+			text: str = self.timeline_renderer_combo.itemText(item)
+			self.timeline_renderer_combo.setItemText(item, text.split(":")[0])
+			self.timeline_renderer_combo.setItemData(item, text.split(":")[1])
+
 		# since Designer doesn't let us define user data per combo item, we do it
 		# ourselves by using the lower case of the name
 		num_items = self.feature_set_combo.count()
@@ -114,6 +132,7 @@ class Preferences(QObject):
 			self.feature_set_combo.setItemData(item, self.feature_set_combo.itemText(item).lower())
 
 		self.post_preview.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.NoContextMenu)
+		self.post_preview.setPage(QWebEnginePage(web_profile.profile(), self.post_preview))
 		page: QWebEnginePage = self.post_preview.page()
 
 		# allow QWebEnginePage to load local image files from "file:" URLs, needs BaseUrl being set in setHtml()
@@ -125,6 +144,9 @@ class Preferences(QObject):
 		self.show_media_combo.currentIndexChanged.connect(self.set_dirty)
 		self.theme_combo.currentIndexChanged.connect(self.set_dirty)
 		self.layout_combo.currentIndexChanged.connect(self.set_dirty)
+		self.timeline_renderer_combo.currentIndexChanged.connect(self.set_dirty)
+		self.web_cache_size_spinner.valueChanged.connect(self.set_dirty)
+		self.memory_budget_spinner.valueChanged.connect(self.set_dirty)
 		self.minimize_to_tray_check.stateChanged.connect(self.set_dirty)
 
 		self.update_ui()
@@ -169,6 +191,22 @@ class Preferences(QObject):
 			o: QComboBox
 			self.values["layout"] = str(o.currentData())
 
+		# only affects timelines opened after the change
+		elif o is self.timeline_renderer_combo:
+			o: QComboBox
+			self.values["timeline_renderer"] = str(o.currentData())
+			self.update_max_timeline_length()
+
+		elif o is self.web_cache_size_spinner:
+			o: QSpinBox
+			self.values["web_cache_size"] = o.value()
+			web_profile.set_cache_size(self.values["web_cache_size"])
+
+		elif o is self.memory_budget_spinner:
+			o: QSpinBox
+			self.values["memory_budget"] = o.value()
+			memory_governor.set_budget(self.values["memory_budget"])
+
 		# TODO: actually add/remove the systray icon at runtime
 		elif o is self.minimize_to_tray_check:
 			o: QCheckBox
@@ -178,13 +216,24 @@ class Preferences(QObject):
 
 		self.update_preview()
 
+	# only the virtualized timeline gets to keep more posts, see MAX_VIRTUAL_TIMELINE_LENGTH
+	def update_max_timeline_length(self) -> None:
+		if self.values["timeline_renderer"] == "virtual":
+			self.max_timeline_length_spinner.setMaximum(MAX_VIRTUAL_TIMELINE_LENGTH)
+		else:
+			self.max_timeline_length_spinner.setMaximum(MAX_TIMELINE_LENGTH)
+
 	def update_ui(self) -> None:
 		self.feature_set_combo.setCurrentIndex(self.feature_set_combo.findData(self.values["feature_set"]))
 		self.expand_spoilers_check.setChecked(self.values["expand_spoilers"])
+		self.update_max_timeline_length()
 		self.max_timeline_length_spinner.setValue(self.values["max_timeline_length"])
 		self.show_media_combo.setCurrentIndex(self.show_media_combo.findData(self.values["show_media_policy"]))
 		self.theme_combo.setCurrentIndex(self.theme_combo.findData(self.values["theme"]))
 		self.layout_combo.setCurrentIndex(self.layout_combo.findData(self.values["layout"]))
+		self.timeline_renderer_combo.setCurrentIndex(self.timeline_renderer_combo.findData(self.values["timeline_renderer"]))
+		self.web_cache_size_spinner.setValue(self.values["web_cache_size"])
+		self.memory_budget_spinner.setValue(self.values["memory_budget"])
 		self.minimize_to_tray_check.setChecked(self.values["minimize_to_tray"])
 
 	def load_settings(self) -> None:
@@ -201,6 +250,9 @@ class Preferences(QObject):
 		self.values["show_media_policy"]: str = settings.value("show_media_policy", "show")
 		self.values["theme"]: str = settings.value("theme", "light")
 		self.values["layout"]: str = settings.value("layout", "default")
+		self.values["timeline_renderer"]: str = settings.value("timeline_renderer", "widgets")  # widgets, document, virtual
+		self.values["web_cache_size"]: int = int(settings.value("web_cache_size", DEFAULT_CACHE_SIZE_MB))  # MB
+		self.values["memory_budget"]: int = int(settings.value("memory_budget", DEFAULT_MEMORY_BUDGET_MB))  # MB
 		self.values["minimize_to_tray"]: bool = bool(int(settings.value("minimize_to_tray", True)))  # why on earth does bool() by itself not suffice?
 
 		self.values["preferred_post_language"]: str = settings.value("preferred_post_language", "en")
@@ -227,6 +279,9 @@ class Preferences(QObject):
 		settings.setValue("show_media_policy", self.values["show_media_policy"])
 		settings.setValue("theme", self.values["theme"])
 		settings.setValue("layout", self.values["layout"])
+		settings.setValue("timeline_renderer", self.values["timeline_renderer"])
+		settings.setValue("web_cache_size", self.values["web_cache_size"])
+		settings.setValue("memory_budget", self.values["memory_budget"])
 		settings.setValue("minimize_to_tray", int(self.values["minimize_to_tray"]))
 
 		settings.setValue("preferred_post_language", self.values["preferred_post_language"])
@@ -268,7 +323,7 @@ class Preferences(QObject):
 		with open(os.path.join(os.path.dirname(__file__), "res", "demo_boosted_by.dict"), 'r') as file:
 			demo_boosted_by = eval(file.read())
 
-		html = format_post(self.values, demo_status, demo_boosted_by, [])
+		html = format_post(self.values, demo_status, demo_boosted_by, None)
 
 		# make sure the preview doesn't allow clicking of links
 		html = html.replace(" href=", " off=")
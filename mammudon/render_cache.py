@@ -0,0 +1,181 @@
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from mammudon.debugging import debug
+from mammudon.emojis import EmojiIndex
+
+
+# everything about a poll that shows up in the rendered HTML
+def poll_fingerprint(poll: dict) -> tuple | None:
+	if not poll:
+		return None
+
+	return (
+		poll["id"],
+		poll["expired"],
+		poll["multiple"],
+		poll.get("voted", False),
+		tuple(poll.get("own_votes", [])),
+		poll["voters_count"],
+		str(poll["expires_at"]),
+		tuple((poll_item["title"], poll_item["votes_count"]) for poll_item in poll["options"]),
+		hash(repr(poll.get("emojis"))),
+	)
+
+
+# everything about an account that shows up in the rendered HTML, people change their names, avatars and
+# the custom emojis in their names while their posts stay the same
+def account_fingerprint(account: dict) -> tuple | None:
+	if not account:
+		return None
+
+	return (
+		account["id"],
+		account["acct"],
+		account["url"],
+		account["display_name"],
+		account.get("username"),
+		account["avatar"],
+		hash(repr(account.get("emojis"))),
+	)
+
+
+# everything about a status that shows up in the rendered HTML, status ids alone are not enough,
+# since posts can be edited, polls get votes and the theme, layout or custom emojis can change
+def status_fingerprint(values: dict, post: dict, emoji_index: EmojiIndex | None) -> tuple:
+	return (
+		post["id"],
+		str(post.get("edited_at")),
+		account_fingerprint(post["account"]),
+		post.get("in_reply_to_account_id"),
+		hash(repr(post.get("mentions"))),
+		hash(post["content"]),
+		hash(post["spoiler_text"]),
+		hash(repr(post.get("media_attachments"))),
+		hash(repr(post.get("card"))),
+		hash(repr(post["emojis"])),
+		poll_fingerprint(post.get("poll")),
+		values["theme"],
+		values["layout"],
+		values["expand_spoilers"],
+		emoji_index.version if emoji_index else 0,
+	)
+
+
+def post_fingerprint(values: dict, post: dict, boosted_by: dict, emoji_index: EmojiIndex | None) -> tuple:
+	return (
+		"post",
+		account_fingerprint(boosted_by),
+		status_fingerprint(values, post, emoji_index),
+	)
+
+
+def notification_fingerprint(values: dict, notification: dict) -> tuple:
+	notification_status: dict = notification.get("status")
+
+	return (
+		"notification",
+		notification["id"],
+		notification["type"],
+		account_fingerprint(notification["account"]),
+		status_fingerprint(values, notification_status, None) if notification_status else (values["theme"], values["layout"]),
+	)
+
+
+def conversation_fingerprint(values: dict, conversation: dict) -> tuple:
+	last_status: dict = conversation.get("last_status")
+
+	return (
+		"conversation",
+		conversation["id"],
+		tuple(account_fingerprint(account) for account in conversation["accounts"]),
+		status_fingerprint(values, last_status, None) if last_status else (values["theme"], values["layout"]),
+	)
+
+
+class RenderCache:
+	def __init__(self, max_entries: int = 1000):
+		self.max_entries = max_entries
+
+		# fingerprint -> rendered HTML, oldest used entries first
+		self.entries: OrderedDict[tuple, str] = OrderedDict()
+
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+
+		# posts get formatted from the format_pool worker threads, too
+		self.lock = threading.Lock()
+
+	# return the cached HTML for this fingerprint, or call render() to create it and keep it for next time
+	def render(self, fingerprint: tuple, render: Callable[..., str], *args) -> str:
+		with self.lock:
+			html = self.entries.get(fingerprint)
+			if html is not None:
+				self.hits += 1
+				self.entries.move_to_end(fingerprint)
+				return html
+
+			self.misses += 1
+
+		# render outside the lock, so other threads don't have to wait for us, in the rare case of
+		# two threads rendering the same post at the same time, the second result simply wins
+		html = render(*args)
+
+		with self.lock:
+			self.entries[fingerprint] = html
+
+			while len(self.entries) > self.max_entries:
+				self.entries.popitem(last=False)
+				self.evictions += 1
+
+		return html
+
+	def clear(self) -> None:
+		with self.lock:
+			self.entries.clear()
+
+	# approximate memory used by the rendered HTML in bytes
+	def size(self) -> int:
+		with self.lock:
+			return sum(len(html) for html in self.entries.values())
+
+	# drop the oldest used entries until only "keep" are left, returns the approximate number of bytes freed
+	def trim(self, keep: int) -> int:
+		freed = 0
+
+		with self.lock:
+			while len(self.entries) > keep:
+				_fingerprint, html = self.entries.popitem(last=False)
+				freed += len(html)
+				self.evictions += 1
+
+		return freed
+
+	def stats(self) -> dict[str, int]:
+		return {
+			"entries": len(self.entries),
+			"max_entries": self.max_entries,
+			"hits": self.hits,
+			"misses": self.misses,
+			"evictions": self.evictions,
+		}
+
+	def log_stats(self, name: str) -> None:
+		lookups = self.hits + self.misses
+		debug(
+			"render cache", name + ":", len(self.entries), "of", self.max_entries, "entries,",
+			self.hits, "hits,", self.misses, "misses,", self.evictions, "evictions",
+			"(" + str(self.hits * 100 // lookups) + "% hit rate)" if lookups else ""
+		)
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
@@ -0,0 +1,92 @@
+import os
+import weakref
+
+from mammudon.debugging import debug
+
+# the two ways a PostView can show a post
+RENDER_PATHS = ["web", "native"]
+
+
+# resident memory of a process in bytes, only available where there is a /proc file system
+def resident_memory(pid: int) -> int:
+	try:
+		with open("/proc/" + str(pid) + "/statm") as statm:
+			return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+	except (OSError, ValueError, IndexError):
+		return 0
+
+
+# keeps track of how long it takes to show posts with a web page compared to a native QLabel, and how much
+# memory the web pages use, which lives in the web engine's render processes, not in our own process
+class RenderStats:
+	def __init__(self):
+		self.posts: dict[str, int] = dict.fromkeys(RENDER_PATHS, 0)
+		self.seconds: dict[str, float] = dict.fromkeys(RENDER_PATHS, 0.0)
+		self.max_seconds: dict[str, float] = dict.fromkeys(RENDER_PATHS, 0.0)
+
+		# all web pages (QWebEnginePage) that are still alive, to find their render processes
+		self.pages: weakref.WeakSet = weakref.WeakSet()
+
+	# time from handing the HTML over until the post was shown
+	def add(self, render_path: str, seconds: float) -> None:
+		self.posts[render_path] += 1
+		self.seconds[render_path] += seconds
+		self.max_seconds[render_path] = max(self.max_seconds[render_path], seconds)
+
+	def add_page(self, page) -> None:
+		self.pages.add(page)
+
+	# several pages can share one render process, so count every process only once
+	def web_memory(self) -> int:
+		pids = set()
+		for page in list(self.pages):
+			pid = page.renderProcessPid()
+			if pid > 0:
+				pids.add(pid)
+
+		return sum(resident_memory(pid) for pid in pids)
+
+	def stats(self) -> dict[str, int | float]:
+		stats: dict[str, int | float] = {}
+		for render_path in RENDER_PATHS:
+			stats[render_path + "_posts"] = self.posts[render_path]
+			stats[render_path + "_mean_ms"] = self.seconds[render_path] * 1000 / self.posts[render_path] if self.posts[render_path] else 0.0
+			stats[render_path + "_max_ms"] = self.max_seconds[render_path] * 1000
+
+		web_pages = len(self.pages)
+		web_memory = self.web_memory()
+
+		stats["web_pages"] = web_pages
+		stats["web_memory"] = web_memory
+		stats["web_memory_per_page"] = web_memory // web_pages if web_pages else 0
+		stats["process_memory"] = resident_memory(os.getpid())
+
+		return stats
+
+	def log_stats(self) -> None:
+		stats = self.stats()
+
+		for render_path in RENDER_PATHS:
+			debug(
+				render_path, "posts:", stats[render_path + "_posts"], "shown,",
+				"%.1f ms mean, %.1f ms max until shown" % (stats[render_path + "_mean_ms"], stats[render_path + "_max_ms"])
+			)
+
+		debug(
+			stats["web_pages"], "web pages using", stats["web_memory"] // 1024 // 1024, "MB in their render processes,",
+			stats["web_memory_per_page"] // 1024, "kB per page,", stats["process_memory"] // 1024 // 1024, "MB in our own process"
+		)
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
+
+
+# offer global "render_stats" to all other modules
+render_stats = RenderStats()
@@ -1,20 +1,29 @@
 # TODO: The naming of "Scroller" and "Timeline" classes appears to be a bit confusing
 
 import os
+import time
+from collections import deque
 
 from PyQt6 import QtCore
 from PyQt6.QtCore import pyqtSignal, QEvent
 from PyQt6.QtGui import QWheelEvent
 from PyQt6.QtWidgets import QWidget, QPushButton, QScrollArea, QLabel, QVBoxLayout
-from PyQt6.uic import loadUi
 from mastodon import Mastodon
 
 from mammudon.account import Account
+from mammudon.debugging import debug
+from mammudon.drain_scheduler import drain_scheduler
 from mammudon.listener import Listener
+from mammudon.media_visibility import MediaVisibility
+from mammudon.prefs import preferences, MAX_TIMELINE_LENGTH
+from mammudon.ui_forms import load_form
 
 
 class Scroller(QWidget):
 
+	# most posts this kind of column keeps, whatever the preferences say, see timeline_length()
+	max_timeline_length = MAX_TIMELINE_LENGTH
+
 	current_account = pyqtSignal(Account)  # fires on mouse entry
 	open_profile = pyqtSignal(object)  # account_id: int as object because 64bit
 	reply_to_post = pyqtSignal(object, bool)  # dict with the post to reply to inside
@@ -30,7 +39,7 @@ class Scroller(QWidget):
 		self.account = account
 
 		# TODO: needs to be renamed to scroller.ui
-		loadUi(os.path.join(os.path.dirname(__file__), "ui", "timeline.ui"), self)
+		load_form("timeline", self)
 
 		self.timeline_icon_widget: QWidget = self.findChild(QWidget, "timelineIconWidget")
 		self.unread_label: QLabel = self.findChild(QLabel, "unreadLabel")
@@ -78,6 +87,15 @@ class Scroller(QWidget):
 		self.unread_label.setVisible(False)
 		self.unread_label.setAttribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents)
 
+		# keep videos from playing where nobody can see them
+		self.media_visibility = MediaVisibility(self.scroll_area, self.media_post_views)
+
+		# arguments for add_post() of posts waiting to be inserted by the drain_scheduler, see schedule_insert()
+		self.pending_inserts: deque[tuple] = deque()
+
+		self.insert_batches = 0
+		self.inserted_posts = 0
+
 	def on_post_unread_changed(self, unread: bool) -> None:
 		if unread:
 			self.unread_count += 1
@@ -92,6 +110,63 @@ class Scroller(QWidget):
 		self.timeline_icon_widget.layout().setContentsMargins(31 - len(label) * 6 - 8, 20, 0, 0)
 		self.unread_changed.emit(unread)
 
+	# collects posts for add_post(), the drain_scheduler inserts them in batches with the next frames, instead of
+	# laying out and painting the timeline again for every single post
+	def schedule_insert(self, *args) -> None:
+		self.pending_inserts.append(args)
+		drain_scheduler.wake()
+
+	# inserts pending posts until "budget" milliseconds are used up, but at least one, returns how many went in,
+	# called by the drain_scheduler, which splits very large batches across frames
+	def insert_pending(self, budget: float) -> int:
+		start = time.perf_counter()
+		inserted = 0
+
+		# nothing gets painted while the posts go in, one layout pass afterwards takes care of all of them
+		self.timeline_view.setUpdatesEnabled(False)
+		try:
+			while self.pending_inserts:
+				self.add_post(*self.pending_inserts.popleft())
+				inserted += 1
+
+				if (time.perf_counter() - start) * 1000 > budget:
+					break
+		finally:
+			self.timeline_view.setUpdatesEnabled(True)
+
+		self.insert_batches += 1
+		self.inserted_posts += inserted
+
+		if inserted > 1:
+			debug("inserted", inserted, "posts in", int((time.perf_counter() - start) * 1000), "ms into", self.friendly_name)
+
+		if not self.pending_inserts:
+			self.inserts_done()
+
+		return inserted
+
+	# the drain_scheduler inserts posts into columns the user can see first
+	def is_on_screen(self) -> bool:
+		return self.isVisible() and not self.visibleRegion().isEmpty()
+
+	# the timeline length from the preferences, which might have been set for the virtualized timeline, which can
+	# keep more posts than the other columns
+	def timeline_length(self) -> int:
+		return min(preferences.values["max_timeline_length"], self.max_timeline_length)
+
+	# needs to be re-implemented by subclasses, takes the arguments given to schedule_insert()
+	def add_post(self, *_args) -> None:
+		pass
+
+	# called when all pending posts are inserted, needs to be re-implemented by subclasses that want to know
+	def inserts_done(self) -> None:
+		pass
+
+	# called by the drain_scheduler every few seconds to update the reload button countdown and pull the queued
+	# posts in, needs to be re-implemented by subclasses
+	def remaining_time(self) -> None:
+		pass
+
 	def on_close_button_clicked(self) -> None:
 		self.close_scroller.emit(self, self.unread_count)
 
@@ -112,13 +187,44 @@ class Scroller(QWidget):
 			QEvent.Type.Enter
 		]:
 			self.current_account.emit(self.account)
+			drain_scheduler.set_focused(self)
 
 		return super().event(e)
 
 	# slot
 	def application_minimized(self) -> None:
+		self.media_visibility.pause_all()
 		self.minimized.emit()
 
+	# approximate memory use of this column, "pages" is the number of web pages, "html" and "statuses" are in bytes,
+	# needs to be re-implemented by subclasses, see MemoryGovernor
+	def memory_usage(self) -> dict[str, int]:
+		return {"pages": 0, "html": 0, "statuses": 0}
+
+	# give up the web pages of posts further away than "distance" pixels from the visible part of the
+	# column, returns the number of pages discarded, needs to be re-implemented by subclasses
+	def discard_pages(self, _distance: int) -> int:
+		return 0
+
+	# drop any rendered HTML that can be formatted again when needed, returns the approximate number of
+	# bytes freed, needs to be re-implemented by subclasses
+	def drop_html(self) -> int:
+		return 0
+
+	def show_memory_usage(self, used: int, budget: int) -> None:
+		self.label.setToolTip(
+			"Memory use: about " + str(used // 1024 // 1024) + " MB of this column's " + str(budget // 1024 // 1024) + " MB budget"
+		)
+
+	# needs to be re-implemented by subclasses that show PostViews, so their media can be paused while off screen
+	def media_post_views(self) -> list:
+		return []
+
+	# called when the column gets closed, needs to be re-implemented by subclasses that share statuses through the
+	# account's status_store, so the statuses only this column showed get dropped
+	def release_statuses(self) -> None:
+		pass
+
 	# needs to be re-implemented by the superclass to connect to its needed Listener signal
 	def connect_to_stream_listener(self, stream_name: str, stream_listener: Listener):
 		pass
@@ -2,21 +2,131 @@
 # TODO: Display post language
 
 import gc
-import os
 import sys
+import time
 import webbrowser
 
 from PyQt6 import QtCore
 from PyQt6.QtGui import QAction, QMouseEvent, QContextMenuEvent
-from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineSettings
+from PyQt6.QtWebChannel import QWebChannel
+from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineScript, QWebEngineSettings
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWidgets import QLabel, QPushButton, QToolButton, QVBoxLayout, QWidget, QMenu, QApplication
-from PyQt6.QtCore import QEvent, QUrl, QObject, QSizeF, QChildEvent, pyqtSignal
-from PyQt6.uic import loadUi
+from PyQt6.QtCore import QEvent, QFile, QIODevice, QUrl, QObject, QSizeF, QChildEvent, pyqtSignal, pyqtSlot
 
 from mammudon.debugging import debug
+from mammudon.fragments import fragment_patches, patch_script
+from mammudon.html_to_text import HtmlToText
 from mammudon.image_browser import ImageBrowser
 from mammudon.media_playback import MediaPlayback
+from mammudon.render_stats import render_stats
+from mammudon.ui_forms import load_form
+from mammudon.web_profile import web_profile
+
+
+# characters of the post's text to show in the placeholder before the web page is loaded
+PLACEHOLDER_TEXT_LENGTH = 500
+
+
+# rough guess of a post's height in pixels until it was on screen and could be measured
+def estimate_height(post: dict) -> int:
+	# header with the account name, footer with the buttons and margins
+	height = 110
+
+	# roughly 80 characters of HTML per line of text in a default width timeline
+	height += (len(post["content"]) // 80 + 1) * 20
+
+	if post.get("media_attachments"):
+		height += 220
+
+	if post.get("card"):
+		height += 120
+
+	if post.get("poll"):
+		height += 30 * len(post["poll"]["options"]) + 40
+
+	return height
+
+
+# reports the height of the page to height_reporter whenever it changes, instead of PostView asking for it with
+# runJavaScript() after every event that might have changed it, the browser runs ResizeObserver callbacks at
+# most once per frame, so a burst of images finishing to load only results in a single report
+HEIGHT_OBSERVER_SCRIPT = """
+new QWebChannel(qt.webChannelTransport, function(channel) {
+	var height_reporter = channel.objects.height_reporter;
+	new ResizeObserver(function() {
+		if (typeof endofpage !== "undefined") {
+			height_reporter.report_height(endofpage.offsetTop);
+		}
+	}).observe(document.body);
+});
+"""
+
+# pause all playing videos and audio players, and remember which ones to play again in MEDIA_RESUME_SCRIPT
+MEDIA_PAUSE_SCRIPT = """
+for (const media of document.querySelectorAll("video, audio")) {
+	if (!media.paused) {
+		media.dataset.resume = "1";
+		media.pause();
+	}
+}
+"""
+
+# drop the videos' data, keeping their URL and position to load them again in MEDIA_RESUME_SCRIPT
+MEDIA_UNLOAD_SCRIPT = """
+for (const media of document.querySelectorAll("video[src]")) {
+	media.dataset.src = media.getAttribute("src");
+	media.dataset.time = media.currentTime;
+	media.removeAttribute("src");
+	media.load();
+}
+"""
+
+MEDIA_RESUME_SCRIPT = """
+for (const media of document.querySelectorAll("video, audio")) {
+	if (media.dataset.src) {
+		media.src = media.dataset.src;
+		media.currentTime = parseFloat(media.dataset.time) || 0;
+		delete media.dataset.src;
+		delete media.dataset.time;
+	}
+
+	if (media.dataset.resume) {
+		delete media.dataset.resume;
+		media.play();
+	}
+}
+"""
+
+# source of qwebchannel.js plus HEIGHT_OBSERVER_SCRIPT, read from Qt's resources on first use
+height_observer_source: str | None = None
+
+
+def height_observer_script() -> str:
+	global height_observer_source
+
+	if height_observer_source is None:
+		height_observer_source = ""
+
+		qwebchannel_js = QFile(":/qtwebchannel/qwebchannel.js")
+		if qwebchannel_js.open(QIODevice.OpenModeFlag.ReadOnly):
+			height_observer_source = bytes(qwebchannel_js.readAll()).decode("utf-8") + HEIGHT_OBSERVER_SCRIPT
+			qwebchannel_js.close()
+		else:
+			debug("could not load qwebchannel.js, falling back to polling the post heights")
+
+	return height_observer_source
+
+
+# the object the page's ResizeObserver talks to through the QWebChannel
+class HeightReporter(QObject):
+
+	# signals
+	height_changed = pyqtSignal(int)
+
+	@pyqtSlot(int)
+	def report_height(self, height: int) -> None:
+		self.height_changed.emit(height)
 
 
 class PostPage(QWebEnginePage):
@@ -25,7 +135,7 @@ class PostPage(QWebEnginePage):
 	link_clicked = pyqtSignal(QUrl)
 
 	def __init__(self, parent):
-		super(QWebEnginePage, self).__init__(parent)
+		super(QWebEnginePage, self).__init__(web_profile.profile(), parent)
 
 	# DEBUG: catch all events and print info on them
 	# def event(self, e):
@@ -74,11 +184,12 @@ class PostView(QWidget):
 	poll_vote = pyqtSignal(object, object)  # poll_id: int, voted_options: list[int]
 	poll_refresh = pyqtSignal(object)  # poll_id: int
 	poll_show_results = pyqtSignal(object)  # poll_id: int
+	height_reported = pyqtSignal(object, int)  # PostView, new height of the web view
 
 	def __init__(self, *, authored_by_me: bool, post_id: int, threaded=False, count_as_unread=True):
 		super(QWidget, self).__init__()
 
-		loadUi(os.path.join(os.path.dirname(__file__), "ui", "postview.ui"), self)
+		load_form("postview", self)
 
 		# pre-declare attributes that get set in the functions below
 		self.threaded = False  # bool that tells us if this post is threaded under another post
@@ -131,13 +242,50 @@ class PostView(QWidget):
 		# dicts of this post's history
 		self.history: list[dict] = []
 
-		self.web_page: PostPage | None = PostPage(self)
-		self.web_view.setPage(self.web_page)
+		# the web page only gets created when the post comes near the visible part of the timeline, see show_page(),
+		# until then a placeholder with the plain text of the post stands in for it
+		self.web_page: PostPage | None = None
+		self.page_shown = False
 
-		self.web_page.settings().setAttribute(QWebEngineSettings.WebAttribute.ShowScrollBars, False)
-		self.web_page.settings().setAttribute(QWebEngineSettings.WebAttribute.PlaybackRequiresUserGesture, False)
-		# allow QWebEnginePage to load local image files from "file:" URLs, needs BaseUrl being set in setHtml()
-		# self.settings().setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, True)
+		self.post_layout: QVBoxLayout = self.findChild(QVBoxLayout, "postVLayout")
+
+		self.placeholder = QLabel(self)
+		self.placeholder.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+		self.placeholder.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignTop)
+		self.placeholder.setWordWrap(True)
+		self.placeholder.setMargin(8)
+		self.post_layout.insertWidget(self.post_layout.indexOf(self.web_view) + 1, self.placeholder)
+
+		# posts with nothing but text and links don't need a web page at all, see set_native_html()
+		self.native = False
+
+		self.native_view = QLabel(self)
+		self.native_view.setTextFormat(QtCore.Qt.TextFormat.RichText)
+		self.native_view.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignTop)
+		self.native_view.setWordWrap(True)
+		self.native_view.setMargin(8)
+		self.native_view.setTextInteractionFlags(QtCore.Qt.TextInteractionFlag.TextBrowserInteraction)
+		self.native_view.setOpenExternalLinks(False)
+		self.native_view.linkActivated.connect(self.on_native_link_activated)
+		self.native_view.hide()
+		self.post_layout.insertWidget(self.post_layout.indexOf(self.placeholder) + 1, self.native_view)
+
+		# mouse clicks mark the post read, and the timeline wants the mouse wheel, just like with the web view
+		self.native_view.installEventFilter(self)
+
+		# when the current HTML was handed to the web page, to measure how long it takes to show up
+		self.render_start = 0.0
+
+		# posts with videos, gifvs or audio get their media paused and unloaded while off screen, see MediaVisibility
+		self.playable_media = False
+		self.media_paused_since = 0.0
+		self.media_unloaded = False
+
+		# the page pushes its height changes to us, see HEIGHT_OBSERVER_SCRIPT, when this stays None,
+		# run_size_check() asks the page for its height instead
+		self.height_reporter: HeightReporter | None = None
+
+		self.web_view.hide()
 
 		# pass on any events from the QWebEngineView to us
 		# this is needed for changes in focusProxy when we do the setPage() call below
@@ -151,13 +299,6 @@ class PostView(QWidget):
 		self.web_view.setMinimumHeight(48)
 		self.web_view.setMinimumWidth(48)
 
-		# this works well for initial sizing
-		self.web_page.loadFinished.connect(self.post_load_finished)
-		self.web_page.link_clicked.connect(self.link_clicked)
-
-		# create resize signal connection, just to make resizing look a bit smoother
-		self.web_page.contentsSizeChanged.connect(self.on_contents_size_changed)
-
 		self.image_browser: ImageBrowser | None = None
 		self.media_playback: MediaPlayback | None = None
 
@@ -183,6 +324,138 @@ class PostView(QWidget):
 
 		self.menus: QMenu | None = None
 
+		self.set_authored_by_me(authored_by_me)
+
+	def create_page(self) -> None:
+		if self.web_page:
+			return
+
+		self.web_page = PostPage(self)
+		self.web_view.setPage(self.web_page)
+		render_stats.add_page(self.web_page)
+
+		self.web_page.settings().setAttribute(QWebEngineSettings.WebAttribute.ShowScrollBars, False)
+		self.web_page.settings().setAttribute(QWebEngineSettings.WebAttribute.PlaybackRequiresUserGesture, False)
+		# allow QWebEnginePage to load local image files from "file:" URLs, needs BaseUrl being set in setHtml()
+		# self.settings().setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, True)
+
+		# this works well for initial sizing
+		self.web_page.loadFinished.connect(self.post_load_finished)
+		self.web_page.link_clicked.connect(self.link_clicked)
+
+		script_source = height_observer_script()
+		if script_source:
+			self.height_reporter = HeightReporter(self)
+			self.height_reporter.height_changed.connect(self.on_page_height_changed)
+
+			web_channel = QWebChannel(self.web_page)
+			web_channel.registerObject("height_reporter", self.height_reporter)
+			self.web_page.setWebChannel(web_channel)
+
+			script = QWebEngineScript()
+			script.setName("height_observer")
+			script.setSourceCode(script_source)
+			script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentReady)
+			script.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
+			script.setRunsOnSubFrames(False)
+			self.web_page.scripts().insert(script)
+			return
+
+		# create resize signal connection, just to make resizing look a bit smoother
+		self.web_page.contentsSizeChanged.connect(self.on_contents_size_changed)
+
+	# swap the placeholder for the real web page, creating it if this PostView doesn't have one yet
+	def show_page(self) -> None:
+		if self.page_shown or self.native:
+			return
+
+		self.page_shown = True
+		self.create_page()
+
+		self.placeholder.hide()
+		self.web_view.show()
+
+		if self.post_html:
+			self.load_html()
+
+	# free the memory of the page's content, show_page() loads it again when the post comes back into view
+	def discard_page(self) -> None:
+		if not self.page_shown:
+			return
+
+		self.web_page.setHtml("")
+		self.show_placeholder()
+
+	def load_html(self) -> None:
+		# the new page starts out with nothing paused
+		self.media_paused_since = 0.0
+		self.media_unloaded = False
+
+		self.render_start = time.perf_counter()
+		self.web_page.setHtml(self.post_html)
+
+	# show a post formatted by format_native_post() in a QLabel instead of the web page
+	def set_native_html(self, html: str) -> None:
+		start = time.perf_counter()
+
+		if not self.native:
+			self.native = True
+			self.page_shown = False
+			self.placeholder.hide()
+			self.web_view.hide()
+
+			# stop any media that might still be playing from before
+			if self.post_html and self.web_page:
+				self.web_page.setHtml("")
+
+		self.post_html = ""
+		self.native_view.setText(html)
+		self.native_view.show()
+
+		render_stats.add("native", time.perf_counter() - start)
+
+	# the post changed in a way that needs the web page, e.g. after an edit added a poll
+	def leave_native(self) -> None:
+		self.native = False
+		self.native_view.hide()
+		self.native_view.clear()
+		self.placeholder.show()
+
+	# slot
+	def on_native_link_activated(self, link: str) -> None:
+		self.link_clicked(QUrl(link))
+
+	def show_placeholder(self) -> None:
+		self.page_shown = False
+
+		self.web_view.hide()
+		self.placeholder.show()
+
+	def update_placeholder(self) -> None:
+		post = self.original_post
+
+		text = post["account"]["display_name"] or post["account"]["username"]
+		text += " (@" + post["account"]["acct"] + ")\n\n"
+
+		# don't give away the content of posts with a content warning
+		if post["spoiler_text"]:
+			text += post["spoiler_text"]
+		else:
+			parser = HtmlToText()
+			parser.feed(post["content"])
+			text += parser.text.strip()[:PLACEHOLDER_TEXT_LENGTH]
+
+		self.placeholder.setText(text)
+
+		# the buttons below the post are not part of the placeholder
+		self.placeholder.setFixedHeight(max(48, estimate_height(post) - 40))
+
+	def set_authored_by_me(self, authored_by_me: bool) -> None:
+		self.authored_by_me = authored_by_me
+
+		for action in self.post_options_button.actions():
+			self.post_options_button.removeAction(action)
+
 		# this is a post that the user sent themselves, so add a few more functions
 		if self.authored_by_me:
 			# TODO: edit post
@@ -194,6 +467,101 @@ class PostView(QWidget):
 		self.post_options_button.addAction(self.post_action_browser)
 		self.post_options_button.addAction(self.post_action_reload)
 
+	# make this PostView show a different post, so timelines don't need to create a new QWebEngineView
+	# for every post, see PostViewPool, the caller sets the content afterwards
+	def recycle(self, *, post_id: int, authored_by_me: bool, unread: bool, threaded=False, count_as_unread=True) -> None:
+		self.id = post_id
+		self.set_authored_by_me(authored_by_me)
+
+		# don't send any unread signals, the timeline keeps track of the post's unread status itself
+		self.unread = unread
+		self.unread_marker.setEnabled(unread)
+		self.count_as_unread = count_as_unread
+
+		self.original_post = {}
+		self.post_html = ""
+		self.history = []
+
+		self.playable_media = False
+		self.media_paused_since = 0.0
+		self.media_unloaded = False
+
+		self.set_threaded(threaded)
+		if self.native:
+			self.leave_native()
+		self.show_placeholder()
+		self.conversation_button.setEnabled(False)
+		self.conversation_button.setChecked(False)
+		self.setEnabled(True)
+
+		# buttons might still be disabled from an action that was running when the post was removed
+		self.boost_button.setEnabled(True)
+		self.favorite_button.setEnabled(True)
+		self.bookmark_button.setEnabled(True)
+		self.post_action_delete.setEnabled(True)
+		self.post_action_mute.setEnabled(True)
+
+	# called by MediaVisibility when the post leaves or enters the visible part of its timeline
+	def pause_media(self) -> None:
+		if self.media_paused_since or not self.page_shown:
+			return
+
+		self.media_paused_since = time.monotonic()
+		self.web_page.runJavaScript(MEDIA_PAUSE_SCRIPT)
+
+	def unload_media(self) -> None:
+		if self.media_unloaded or not self.page_shown:
+			return
+
+		self.media_unloaded = True
+		self.web_page.runJavaScript(MEDIA_UNLOAD_SCRIPT)
+
+	def resume_media(self) -> None:
+		if not self.media_paused_since or not self.page_shown:
+			return
+
+		self.media_paused_since = 0.0
+		self.media_unloaded = False
+		self.web_page.runJavaScript(MEDIA_RESUME_SCRIPT)
+
+	# empty the page, which also stops any media playing, while this PostView waits to be recycled
+	def clear(self) -> None:
+		self.post_html = ""
+		self.original_post = {}
+		self.history = []
+
+		if self.web_page:
+			self.web_page.setHtml("")
+
+	# cut all connections to our signals, so a recycled PostView doesn't talk to its previous timeline anymore
+	def disconnect_signals(self) -> None:
+		for signal in [
+			self.post_context_requested,
+			self.post_clicked,
+			self.show_history_clicked,
+			self.reply_to_post_clicked,
+			self.boost_post,
+			self.favorite_post,
+			self.bookmark_post,
+			self.delete_post,
+			self.mute_post,
+			self.in_browser,
+			self.reload_post,
+			self.was_destroyed,
+			self.account_clicked,
+			self.is_unread,
+			self.mouse_wheel_event,
+			self.poll_vote,
+			self.poll_refresh,
+			self.poll_show_results,
+			self.height_reported,
+		]:
+			try:
+				signal.disconnect()
+			except TypeError:
+				# nothing was connected to this signal
+				pass
+
 	def __del__(self) -> None:
 		# remove from the unread counter if needed
 		self.set_unread(False, False)
@@ -308,10 +676,15 @@ class PostView(QWidget):
 
 	# slot
 	def post_load_finished(self, _ok_unused: bool) -> None:
+		if self.render_start:
+			render_stats.add("web", time.perf_counter() - self.render_start)
+			self.render_start = 0.0
+
 		self.run_size_check()
 
 	def run_size_check(self) -> None:
-		if not self.web_page:
+		# the page tells us about its height by itself
+		if not self.web_page or self.height_reporter:
 			return
 
 		# HACK: run a small javascript that tells us where (in pixels) the end of page is
@@ -321,9 +694,17 @@ class PostView(QWidget):
 		if not result:
 			return
 
-		# if the size needs to be adjusted, do so right here
-		if self.web_view.geometry().height() != (result + 2):
-			self.web_view.setFixedHeight(result + 2)
+		self.height_reported.emit(self, result + 2)
+
+	# slot
+	def on_page_height_changed(self, height: int) -> None:
+		if height:
+			self.height_reported.emit(self, height + 2)
+
+	# called by the timeline for all posts that reported a new height at once, see Timeline.apply_heights()
+	def set_page_height(self, height: int) -> None:
+		if self.web_view.geometry().height() != height:
+			self.web_view.setFixedHeight(height)
 
 	# slot
 	def on_contents_size_changed(self, _size: QSizeF) -> None:
@@ -350,11 +731,49 @@ class PostView(QWidget):
 	# we want to keep a copy of the HTML content around, so we can re-set it if needed
 	# e.g. for changing post sizes when expanding/collapsing spoilers, and reading it
 	# back from the QWebEnginePage is a pain
+	# when the page is already loaded and only some fragments (content, spoiler, poll, media, card) changed,
+	# patch those in place instead of making the web engine rebuild the whole page, which flickers
 	def set_html(self, html: str) -> None:
+		if self.native:
+			self.leave_native()
+
+		# the page will pick up the HTML in show_page()
+		if not self.page_shown:
+			self.post_html = html
+			return
+
+		patches = None
+		if self.post_html and self.web_page and not self.web_page.isLoading():
+			patches = fragment_patches(self.post_html, html)
+
 		self.post_html = html
-		self.web_page.setHtml(self.post_html)
+
+		if patches is None:
+			self.load_html()
+			return
+
+		if not patches:
+			# nothing visible changed at all
+			return
+
+		debug("patching", ", ".join(patches.keys()), "of post", self.id)
+		self.web_page.runJavaScript(patch_script(patches), self.patch_callback)
+
+	def patch_callback(self, result) -> None:
+		if not self.web_page:
+			return
+
+		if not result:
+			debug("patching post", self.id, "failed, reloading it")
+			self.load_html()
+			return
+
+		self.run_size_check()
 
 	def get_html(self) -> str:
+		if self.native:
+			return self.native_view.text()
+
 		return self.post_html
 
 	def copy_html_to_clipboard(self) -> None:
@@ -403,6 +822,11 @@ class PostView(QWidget):
 
 		self.set_posted_with(self.original_post.get("application", {}))
 		self.update_edit_button()
+		self.update_placeholder()
+
+		self.playable_media = any(
+			media["type"] in ["video", "gifv", "audio"] for media in self.original_post.get("media_attachments", [])
+		)
 
 	def set_posted_with(self, app: dict) -> None:
 		if not app:
@@ -0,0 +1,161 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from mammudon.debugging import debug
+from mammudon.render_cache import poll_fingerprint
+
+# everything about a status that can change on the server without the status getting a new id
+SHARED_FIELDS = (
+	"content", "spoiler_text", "sensitive", "edited_at", "emojis", "media_attachments", "card", "poll",
+	"replies_count", "reblogs_count", "favourites_count", "reblogged", "favourited", "bookmarked", "muted", "pinned",
+)
+
+# the parts only known for the logged-in user, streaming posts don't provide these, so a missing value
+# means "unknown" and must not overwrite what another timeline already knows
+USER_FIELDS = ("reblogged", "favourited", "bookmarked", "muted", "pinned")
+
+
+def status_differs(old: dict, new: dict) -> bool:
+	for field in SHARED_FIELDS:
+		if field in USER_FIELDS and new.get(field) is None:
+			continue
+
+		# only what gets rendered of a poll counts, see poll_fingerprint()
+		if field == "poll":
+			if poll_fingerprint(old.get("poll")) != poll_fingerprint(new.get("poll")):
+				return True
+
+		elif old.get(field) != new.get(field):
+			return True
+
+	return False
+
+
+# one copy of every status the columns of an account show, by status id, so a status that is in home, local and a
+# notification at the same time is stored only once, and an update to it, fetched by any of them, reaches all of
+# them through status_changed, the timelines get shallow copies to add their own "mammudon" fields to, which share
+# content, media, poll and account with the stored status
+class StatusStore(QObject):
+
+	# signals
+	status_changed = pyqtSignal(object)  # the stored status dict, after it got updated
+	status_deleted = pyqtSignal(object)  # status id
+
+	def __init__(self):
+		super().__init__()
+
+		# the stored statuses by id, without any of the timelines' "mammudon" fields
+		self.statuses: dict[int, dict] = {}
+
+		# how many timelines show a status, it gets dropped when the last one lets go of it
+		self.users: dict[int, int] = {}
+
+		# callbacks by status action, see request()
+		self.pending_actions: dict[tuple, list] = {}
+
+		self.shared = 0
+		self.updates = 0
+		self.joined_actions = 0
+
+	def __len__(self) -> int:
+		return len(self.statuses)
+
+	def __contains__(self, status_id: int) -> bool:
+		return status_id in self.statuses
+
+	def status(self, status_id: int) -> dict | None:
+		return self.statuses.get(status_id, None)
+
+	# takes a status as it comes from the server, without the boost around it, and returns a copy of the stored
+	# one for the timeline to keep, a status known already gets updated first, call retain() when keeping it
+	def share(self, status: dict) -> dict:
+		stored = self.statuses.get(status["id"], None)
+
+		if stored is None:
+			stored = {key: value for key, value in status.items() if not key.startswith("mammudon_")}
+			self.statuses[status["id"]] = stored
+			self.users[status["id"]] = 0
+		else:
+			self.shared += 1
+			self.update(status)
+
+		return dict(stored)
+
+	def retain(self, status_id: int) -> None:
+		if status_id in self.users:
+			self.users[status_id] += 1
+
+	def release(self, status_id: int) -> None:
+		if status_id not in self.users:
+			return
+
+		self.users[status_id] -= 1
+		if self.users[status_id] <= 0:
+			del self.users[status_id]
+			del self.statuses[status_id]
+
+	# a newer version of a status came in, e.g. the result of a favourite or a reload, tells all timelines about it
+	# if it changed anything, returns False for statuses nobody shows
+	def update(self, status: dict) -> bool:
+		stored = self.statuses.get(status["id"], None)
+		if stored is None or not status_differs(stored, status):
+			return False
+
+		for key, value in status.items():
+			if key.startswith("mammudon_"):
+				continue
+
+			if key in USER_FIELDS and value is None:
+				continue
+
+			stored[key] = value
+
+		self.updates += 1
+		self.status_changed.emit(stored)
+		return True
+
+	# the status got deleted on the server, the timelines drop it and release() it
+	def delete(self, status_id: int) -> None:
+		if status_id in self.statuses:
+			self.status_deleted.emit(status_id)
+
+	# a column asks for a status action, returns False if the very same action is on its way to the server
+	# already, the callback gets that one's answer then, so two columns favouriting or reloading the same status
+	# only cost one request
+	def request(self, key: tuple, callback) -> bool:
+		if key in self.pending_actions:
+			self.pending_actions[key].append(callback)
+			self.joined_actions += 1
+			return False
+
+		self.pending_actions[key] = [callback]
+		return True
+
+	# the server answered the action, returns the callbacks of all columns that asked for it
+	def answer(self, key: tuple) -> list:
+		return self.pending_actions.pop(key, [])
+
+	def stats(self) -> dict[str, int]:
+		return {
+			"statuses": len(self.statuses),
+			"shared": self.shared,
+			"updates": self.updates,
+			"joined_actions": self.joined_actions,
+		}
+
+	def log_stats(self, name: str) -> None:
+		stats = self.stats()
+
+		debug(
+			"status store", name + ":", stats["statuses"], "statuses,", stats["shared"], "shared between timelines,",
+			stats["updates"], "updates,", stats["joined_actions"], "actions joined a request already on its way"
+		)
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
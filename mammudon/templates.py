@@ -0,0 +1,213 @@
+import os
+import re
+import threading
+from html import escape
+
+from mammudon.debugging import debug
+
+# slots that get plain text from the outside world, like display names, media descriptions or
+# URLs, and will always be HTML escaped by Template.render() - all other slots take finished HTML
+text_slots: frozenset[str] = frozenset({
+	# post.html
+	"post_account_url", "post_account_avatar", "post_id", "post_account_display_name", "post_account_acct",
+	# boosted_by.html
+	"boosted_by_url", "boosted_by_avatar", "boosted_by_acct", "boosted_by_display_name",
+	# in_reply_to.html
+	"in_reply_to_url", "in_reply_to_acct",
+	# media and card templates
+	"media_url", "media_preview_url", "media_description",
+	"card_url", "card_image", "card_description", "card_language", "card_title", "card_provider_name",
+	# spoiler_start.html
+	"spoiler_text",
+	# poll templates
+	"poll_item_title", "poll_votes", "poll_users", "remaining", "poll_vote_url", "poll_results_url", "poll_refresh_url",
+	# notification templates
+	"notification_id", "other_account_url", "other_account_acct", "other_account_display_name", "other_account_avatar",
+	"account_url", "account_avatar",
+	# conversation templates
+	"conversation_id", "display_name",
+	# single document timeline templates
+	"sort_id",
+	# stylesheet links
+	"theme_name",
+})
+
+# combined stylesheets served once per web profile by the mammudon-theme: URL scheme, so the
+# post, notification and conversation documents only need to link to them instead of carrying
+# a full copy of all CSS files each
+stylesheets: dict[str, list[str]] = {
+	"post.css": ["body.css", "in_reply_to.css", "post.css", "media.css", "poll.css", "card.css", "spoiler.css"],
+	"notification.css": ["notification_body.css", "notification.css", "notification_post.css", "poll.css"],
+	"conversation.css": ["body.css", "conversation.css"],
+	"timeline.css": ["body.css", "in_reply_to.css", "post.css", "media.css", "poll.css", "card.css", "spoiler.css", "timeline_post.css"],
+}
+
+
+class Template:
+	# %placeholder% slots as used in the layout and theme files
+	slot_pattern = re.compile(r"%([a-z_]+)%")
+
+	def __init__(self, text: str):
+		self.text = text
+
+		# compile the template into alternating literal and slot segments, so render() only
+		# needs a single join instead of one replace() pass over the whole text per slot
+		parts: list[str] = self.slot_pattern.split(text)
+
+		self.head: str = parts[0]
+
+		# (slot name, needs HTML escaping, literal text following the slot)
+		self.segments: list[tuple[str, bool, str]] = []
+		for index in range(1, len(parts), 2):
+			self.segments.append((parts[index], parts[index] in text_slots, parts[index + 1]))
+
+		# names of all slots in this template
+		self.slots: list[str] = list(dict.fromkeys(parts[1::2]))
+
+	def render(self, **values: str) -> str:
+		result: list[str] = [self.head]
+
+		for slot, text_slot, literal in self.segments:
+			value = values.get(slot)
+			if value is None:
+				# leave unknown slots in place, like replace() did
+				result.append("%" + slot + "%")
+			elif text_slot:
+				result.append(escape(value))
+			else:
+				result.append(value)
+
+			result.append(literal)
+
+		return "".join(result)
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
+
+
+class Templates:
+	def __init__(self):
+		self.file_path: str = os.path.dirname(__file__)
+
+		self.theme_name = ""
+		self.layout_name = ""
+
+		# file name -> pre-parsed Template of the currently selected theme/layout
+		self.theme_templates: dict[str, Template] = {}
+		self.layout_templates: dict[str, Template] = {}
+
+		# "theme/stylesheet.css" -> combined stylesheet ready to be sent to the web engine
+		self.stylesheets: dict[str, bytes] = {}
+
+		# posts get formatted from the format_pool worker threads, too, so switching the theme or layout and filling
+		# the caches must not happen halfway at the same time, stylesheet() calls theme() while holding it
+		self.lock = threading.RLock()
+
+	# needs to be called with the current preferences.values before using theme() or layout(),
+	# drops the cached files whenever the theme or layout preference has changed
+	def select(self, values: dict) -> None:
+		theme: str = values["theme"]
+		layout: str = values["layout"]
+
+		with self.lock:
+			if theme != self.theme_name:
+				if self.theme_name:
+					debug("theme changed from", self.theme_name, "to", theme, "- dropping", len(self.theme_templates), "cached theme files")
+				self.theme_templates = {}
+				self.theme_name = theme
+
+			if layout != self.layout_name:
+				if self.layout_name:
+					debug("layout changed from", self.layout_name, "to", layout, "- dropping", len(self.layout_templates), "cached layout files")
+				self.layout_templates = {}
+				self.layout_name = layout
+
+	# forget all cached files, e.g. after theme or layout files were changed on disk
+	def invalidate(self) -> None:
+		with self.lock:
+			self.theme_templates = {}
+			self.layout_templates = {}
+			self.stylesheets = {}
+
+	def load(self, folder: str, name: str, file_name: str) -> Template:
+		with open(os.path.join(self.file_path, folder, name, file_name), 'r') as file:
+			return Template(file.read())
+
+	def theme(self, file_name: str) -> Template:
+		with self.lock:
+			template = self.theme_templates.get(file_name)
+			if not template:
+				template = self.load("themes", self.theme_name, file_name)
+				self.theme_templates[file_name] = template
+
+			return template
+
+	def layout(self, file_name: str) -> Template:
+		with self.lock:
+			template = self.layout_templates.get(file_name)
+			if not template:
+				template = self.load("layouts", self.layout_name, file_name)
+				self.layout_templates[file_name] = template
+
+			return template
+
+	# returns the combined stylesheet for the given theme, or None if there is no such theme or stylesheet,
+	# the theme is passed in from the stylesheet URL, so it does not need to be the currently selected one
+	def stylesheet(self, theme_name: str, stylesheet_name: str) -> bytes | None:
+		with self.lock:
+			key = theme_name + "/" + stylesheet_name
+
+			stylesheet = self.stylesheets.get(key)
+			if stylesheet is not None:
+				return stylesheet
+
+			file_names = stylesheets.get(stylesheet_name)
+			if file_names is None or theme_name not in os.listdir(os.path.join(self.file_path, "themes")):
+				debug("unknown theme stylesheet requested:", key)
+				return None
+
+			css: list[str] = []
+			for file_name in file_names:
+				try:
+					if theme_name == self.theme_name:
+						template = self.theme(file_name)
+					else:
+						template = self.load("themes", theme_name, file_name)
+				except FileNotFoundError:
+					debug("theme", theme_name, "has no", file_name, "- skipping it for", stylesheet_name)
+					continue
+
+				# the per-post media hover rules stay inline in the post, the audio player is always included
+				if "audio_player_css" in template.slots:
+					css.append(template.render(
+						media_hover_css="",
+						audio_player_css=self.load("themes", theme_name, "audio_player.css").text,
+					))
+				else:
+					css.append(template.text)
+
+			stylesheet = "\n".join(css).encode("utf-8")
+			self.stylesheets[key] = stylesheet
+
+			return stylesheet
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
+
+
+# offer global "templates" registry to all other modules
+templates: Templates = Templates()
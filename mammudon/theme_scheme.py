@@ -0,0 +1,64 @@
+from PyQt6.QtCore import QBuffer, QByteArray
+from PyQt6.QtWebEngineCore import QWebEngineUrlScheme, QWebEngineUrlSchemeHandler, QWebEngineUrlRequestJob, \
+	QWebEngineProfile
+
+from mammudon.debugging import debug
+from mammudon.templates import templates
+
+# stylesheet URLs look like mammudon-theme:light/post.css, see "stylesheets" in templates.py
+THEME_SCHEME = b"mammudon-theme"
+
+
+# needs to be called before the QApplication gets created
+def register_theme_scheme() -> None:
+	scheme = QWebEngineUrlScheme(THEME_SCHEME)
+	scheme.setSyntax(QWebEngineUrlScheme.Syntax.Path)
+	scheme.setFlags(QWebEngineUrlScheme.Flag.SecureScheme | QWebEngineUrlScheme.Flag.CorsEnabled)
+	QWebEngineUrlScheme.registerScheme(scheme)
+
+
+class ThemeSchemeHandler(QWebEngineUrlSchemeHandler):
+	def requestStarted(self, job: QWebEngineUrlRequestJob) -> None:
+		path = job.requestUrl().path()
+
+		parts = path.split("/")
+		if len(parts) != 2:
+			debug("malformed theme stylesheet URL:", job.requestUrl().toString())
+			job.fail(QWebEngineUrlRequestJob.Error.UrlInvalid)
+			return
+
+		stylesheet = templates.stylesheet(parts[0], parts[1])
+		if stylesheet is None:
+			job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+			return
+
+		# the job takes care of deleting the buffer once the reply was read
+		buffer = QBuffer(job)
+		buffer.setData(QByteArray(stylesheet))
+		job.reply(b"text/css", buffer)
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
+
+
+# one handler serves all web profiles
+theme_scheme_handler: ThemeSchemeHandler | None = None
+
+
+def install_theme_scheme_handler(profile: QWebEngineProfile) -> None:
+	global theme_scheme_handler
+
+	if not theme_scheme_handler:
+		theme_scheme_handler = ThemeSchemeHandler()
+
+	if profile.urlSchemeHandler(THEME_SCHEME):
+		return
+
+	profile.installUrlSchemeHandler(THEME_SCHEME, theme_scheme_handler)
@@ -0,0 +1,89 @@
+# keeps track of how the posts of a timeline are threaded, by post id only, so it holds no references to PostViews:
+# which parent a threaded post sits under, which posts sit under a parent, and which posts are replies to a post the
+# timeline doesn't have (yet), so they can be moved under it once it arrives, all lookups and changes take
+# constant time, no matter how many posts the timeline has
+class ThreadIndex:
+	def __init__(self):
+		# threaded post id -> id of the post it is shown under
+		self.parent_ids: dict[int, int] = {}
+
+		# post id -> ids of the posts shown under it, dicts instead of lists for constant time removal
+		self.child_ids: dict[int, dict[int, None]] = {}
+
+		# id of a missing parent -> ids of the replies to it, which are shown as root posts until it arrives
+		self.orphan_ids: dict[int, dict[int, None]] = {}
+
+		# orphaned post id -> id of the missing parent it waits for
+		self.wanted_parent_ids: dict[int, int] = {}
+
+	def add_child(self, parent_id: int, post_id: int) -> None:
+		self.parent_ids[post_id] = parent_id
+		self.child_ids.setdefault(parent_id, {})[post_id] = None
+
+	def add_orphan(self, wanted_parent_id: int, post_id: int) -> None:
+		self.wanted_parent_ids[post_id] = wanted_parent_id
+		self.orphan_ids.setdefault(wanted_parent_id, {})[post_id] = None
+
+	def parent(self, post_id: int) -> int | None:
+		return self.parent_ids.get(post_id, None)
+
+	def is_wanted(self, post_id: int) -> bool:
+		return post_id in self.orphan_ids
+
+	# the missing parent arrived, returns the ids of the posts that waited for it, they are its children now
+	def adopt(self, parent_id: int) -> list[int]:
+		orphan_ids = list(self.orphan_ids.pop(parent_id, {}))
+
+		for post_id in orphan_ids:
+			del self.wanted_parent_ids[post_id]
+			self.add_child(parent_id, post_id)
+
+		return orphan_ids
+
+	# forgets everything about the post, returns False if it wasn't known at all, its children usually get removed
+	# before it, any that are left and replies still waiting for it become root posts for good
+	def remove(self, post_id: int) -> bool:
+		known = False
+
+		parent_id = self.parent_ids.pop(post_id, None)
+		if parent_id is not None:
+			known = True
+			siblings = self.child_ids.get(parent_id, None)
+			if siblings is not None:
+				siblings.pop(post_id, None)
+				if not siblings:
+					del self.child_ids[parent_id]
+
+		wanted_parent_id = self.wanted_parent_ids.pop(post_id, None)
+		if wanted_parent_id is not None:
+			known = True
+			orphans = self.orphan_ids[wanted_parent_id]
+			del orphans[post_id]
+			if not orphans:
+				del self.orphan_ids[wanted_parent_id]
+
+		for child_id in self.child_ids.pop(post_id, {}):
+			known = True
+			del self.parent_ids[child_id]
+
+		for orphan_id in self.orphan_ids.pop(post_id, {}):
+			known = True
+			del self.wanted_parent_ids[orphan_id]
+
+		return known
+
+	def clear(self) -> None:
+		self.parent_ids.clear()
+		self.child_ids.clear()
+		self.orphan_ids.clear()
+		self.wanted_parent_ids.clear()
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
@@ -0,0 +1,244 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from mammudon.post_index import PostIndex
+from mammudon.status_store import StatusStore
+from mammudon.thread_index import ThreadIndex
+
+
+# everything a timeline knows about a post, whether it currently has a PostView or not
+class PostRecord:
+	def __init__(self, post: dict, boosted_by: dict):
+		self.post = post
+		self.boosted_by = boosted_by
+
+		# formatted post, kept around to hand it to a PostView when the post scrolls into view, plain
+		# text posts get shown natively without a web page, see format_native_post()
+		self.post_html = ""
+		self.native_html = ""
+
+		self.unread = False
+		self.history: list[dict] = []
+
+		# the user asked to refresh the post's poll, the next version of the post counts as changed then, kept here
+		# and not inside the poll, the poll dict is shared with the other timelines through the status_store
+		self.refresh_poll = False
+
+		# position and height inside a virtualized timeline, only used by VirtualTimeline, the position
+		# is -1 until it laid out the post for the first time
+		self.y = -1
+		self.height = 0
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
+
+
+# the statuses of a timeline, their sort order, how they are threaded and whether they were read, without any
+# widgets, the timelines show the model and follow its changes through the signals, so posts can be purged,
+# kept or shown partially without asking the PostViews about anything
+class TimelineModel(QObject):
+
+	# signals
+	post_inserted = pyqtSignal(object)  # post id, the record is in records already
+	post_updated = pyqtSignal(object, bool)  # post id, True if the content changed, e.g. the post got edited
+	post_removed = pyqtSignal(object, object)  # post id, the removed PostRecord
+	post_reparented = pyqtSignal(object, object)  # post id, id of the parent that finally arrived
+	unread_changed = pyqtSignal(bool)  # one post more (True) or less (False) is unread
+
+	def __init__(self, *, count_as_unread: bool, status_store: StatusStore | None = None):
+		super().__init__()
+
+		# timelines like e.g. federated/local don't count unread, it gets too busy
+		self.count_as_unread = count_as_unread
+
+		# the account's statuses, shared with its other timelines, None keeps the statuses to this model
+		self.status_store = status_store
+
+		# all posts of this timeline by id, boosts are stored as the boosted post
+		self.records: dict[int, PostRecord] = {}
+
+		# all post ids sorted by their mammudon_sort_id, newest first
+		self.post_index = PostIndex()
+
+		# the same for the posts that are not threaded under another post, in the order Timeline lays them out
+		self.root_index = PostIndex()
+
+		# which post is a reply shown under which, and which replies wait for their parent post
+		self.thread_index = ThreadIndex()
+
+	def __len__(self) -> int:
+		return len(self.records)
+
+	def __contains__(self, post_id: int) -> bool:
+		return post_id in self.records
+
+	def record(self, post_id: int) -> PostRecord | None:
+		return self.records.get(post_id, None)
+
+	def oldest(self) -> int | None:
+		return self.post_index.oldest()
+
+	# takes a status dict as it comes from the server or the streaming API, adds it as a new post or updates
+	# the known one, returns its record and whether the post is new or its content changed, so it needs to be
+	# formatted again
+	def add_status(self, post: dict) -> tuple[PostRecord, bool]:
+		# add our own parts to the post dict, prefixed by "mammudon", see below
+		post_id = post["id"]
+
+		boosted_by = {}
+		if post["reblog"]:
+			# keep this info around so PostView can check the URL on clicks
+			boosted_by = post["account"]
+
+			# we want the boosted post inside the post
+			post = post["reblog"]
+
+		# our own copy of the status the other timelines show, too, before adding our own parts to it
+		if self.status_store is not None:
+			post = self.status_store.share(post)
+
+		record = self.records.get(post["id"], None)
+
+		# a reloaded post, or one updated by another timeline, comes without the boost it is shown with here
+		if record and not boosted_by:
+			boosted_by = record.boosted_by
+
+		if boosted_by:
+			# store the boosted-by info inside the post, so we can read it later in PostView
+			post["mammudon_boosted_by_id"] = boosted_by["id"]
+			post["mammudon_boosted_by_acct"] = boosted_by["acct"]
+			post["mammudon_boosted_by_url"] = boosted_by["url"]
+
+		# add our own parts to the post dict, prefixed by "mammudon"
+		post["mammudon_sort_id"] = post_id
+
+		if not record:
+			record = PostRecord(post, boosted_by)
+			self.records[post["id"]] = record
+
+			if self.status_store is not None:
+				self.status_store.retain(post["id"])
+
+			# insert the post into the timeline by id
+			self.post_index.insert(post["id"], post["mammudon_sort_id"])
+
+			in_reply_to_id = post["in_reply_to_id"]
+			if in_reply_to_id in self.records:
+				self.thread_index.add_child(in_reply_to_id, post["id"])
+			else:
+				if in_reply_to_id:
+					self.thread_index.add_orphan(in_reply_to_id, post["id"])
+
+				self.root_index.insert(post["id"], post["mammudon_sort_id"])
+
+			self.set_unread(post["id"], True)
+			self.post_inserted.emit(post["id"])
+
+			# replies that arrived before this post belong under it now
+			for orphan_id in self.thread_index.adopt(post["id"]):
+				self.root_index.remove(orphan_id)
+				self.post_reparented.emit(orphan_id, post["id"])
+
+			return record, True
+
+		# keep the post where it is, even if it was boosted again in the meantime
+		post["mammudon_sort_id"] = record.post["mammudon_sort_id"]
+
+		old_post = record.post
+
+		# we already know this post, so check if the content has changed, polls only count when
+		# voted on or when their options changed, not with every vote from someone else
+		poll_is_same = True
+		if post["poll"] and old_post["poll"]:
+			poll_is_same = (
+				post["poll"].get("voted", False) == old_post["poll"].get("voted", False) and
+				post["poll"]["options"] == old_post["poll"]["options"] and
+				not record.refresh_poll
+			)
+
+		record.refresh_poll = False
+
+		content_changed = not (
+			post["content"] == old_post["content"] and
+			post["spoiler_text"] == old_post["spoiler_text"] and
+			post["sensitive"] == old_post["sensitive"] and
+			post["emojis"] == old_post["emojis"] and
+			post["media_attachments"] == old_post["media_attachments"] and
+			poll_is_same
+		)
+
+		record.post = post
+		record.boosted_by = boosted_by
+
+		# this is an edited post, so set it to unread again
+		if content_changed:
+			self.set_unread(post["id"], True)
+
+		self.post_updated.emit(post["id"], content_changed)
+		return record, content_changed
+
+	def set_unread(self, post_id: int, unread: bool) -> None:
+		record = self.records.get(post_id, None)
+		if not record or record.unread == unread:
+			return
+
+		record.unread = unread
+		if self.count_as_unread:
+			self.unread_changed.emit(unread)
+
+	def mark_all_read(self) -> None:
+		for post_id in self.records:
+			self.set_unread(post_id, False)
+
+	# removes a single post, its replies stay where they are until they get removed on their own
+	def remove(self, post_id: int) -> PostRecord | None:
+		if post_id not in self.records:
+			return None
+
+		self.set_unread(post_id, False)
+
+		record = self.records.pop(post_id)
+		self.post_index.remove(post_id)
+		self.root_index.remove(post_id)
+
+		# replies still threaded under the post stand on their own from now on
+		child_ids = list(self.thread_index.child_ids.get(post_id, {}))
+		self.thread_index.remove(post_id)
+
+		for child_id in child_ids:
+			self.root_index.insert(child_id, self.records[child_id].post["mammudon_sort_id"])
+
+		if self.status_store is not None:
+			self.status_store.release(post_id)
+
+		self.post_removed.emit(post_id, record)
+		return record
+
+	# lets go of all posts at once when the timeline gets closed, so the status_store can drop the statuses no other
+	# timeline shows, nobody gets told about each post, the views go away with the timeline
+	def clear(self) -> None:
+		if self.status_store is not None:
+			for post_id in self.records:
+				self.status_store.release(post_id)
+
+		# cleared in place, timelines can keep shortcuts to the records
+		self.records.clear()
+		self.post_index.clear()
+		self.root_index.clear()
+		self.thread_index.clear()
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
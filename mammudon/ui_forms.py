@@ -0,0 +1,104 @@
+import hashlib
+import importlib
+import os
+import sys
+import xml.etree.ElementTree as ElementTree
+
+from PyQt6.QtWidgets import QWidget
+from PyQt6.uic import compileUi, loadUi
+
+from mammudon.debugging import debug
+
+# forms of the widgets that get created for every post or column, these get compiled into Python code in
+# mammudon/forms/ by running "python -m mammudon.ui_forms", all other forms are only loaded once in a while
+COMPILED_FORMS = [
+	"conversation_view",
+	"media_attachment",
+	"name_list_entry",
+	"notification_view",
+	"postview",
+	"timeline",
+]
+
+UI_FOLDER = os.path.join(os.path.dirname(__file__), "ui")
+FORMS_FOLDER = os.path.join(os.path.dirname(__file__), "forms")
+
+
+def ui_file_name(name: str) -> str:
+	return os.path.join(UI_FOLDER, name + ".ui")
+
+
+def ui_hash(name: str) -> str:
+	with open(ui_file_name(name), "rb") as ui_file:
+		return hashlib.sha1(ui_file.read()).hexdigest()
+
+
+# compiled form class by form name, None if the form has to be loaded with loadUi()
+form_classes: dict[str, type | None] = {}
+
+
+def form_class(name: str) -> type | None:
+	if name in form_classes:
+		return form_classes[name]
+
+	form_classes[name] = None
+
+	if name not in COMPILED_FORMS:
+		return None
+
+	try:
+		module = importlib.import_module("mammudon.forms." + name)
+	except ImportError as e:
+		debug("no compiled form for", name, "- falling back to loadUi:", e)
+		return None
+
+	# the .ui file was changed in Qt Designer since the form was compiled, happens while developing
+	if module.UI_HASH != ui_hash(name):
+		debug("compiled form for", name, "is outdated, run \"python -m mammudon.ui_forms\" - falling back to loadUi")
+		return None
+
+	form_classes[name] = getattr(module, module.FORM_CLASS)
+	return form_classes[name]
+
+
+# builds the form "name" from mammudon/ui/ into widget, works like loadUi(), so all child widgets end up as
+# attributes of widget, but uses the compiled form if there is an up-to-date one
+def load_form(name: str, widget: QWidget) -> None:
+	form = form_class(name)
+
+	if not form:
+		loadUi(ui_file_name(name), widget)
+		return
+
+	ui = form()
+	ui.setupUi(widget)
+
+	for attribute, value in vars(ui).items():
+		setattr(widget, attribute, value)
+
+
+def compile_forms() -> None:
+	os.makedirs(FORMS_FOLDER, exist_ok=True)
+
+	init_file_name = os.path.join(FORMS_FOLDER, "__init__.py")
+	if not os.path.exists(init_file_name):
+		open(init_file_name, "w").close()
+
+	for name in COMPILED_FORMS:
+		# pyuic names the form class after the top level widget
+		top_widget = ElementTree.parse(ui_file_name(name)).getroot().find("widget")
+
+		with open(os.path.join(FORMS_FOLDER, name + ".py"), "w") as py_file:
+			# relative path, so the comment on top of the generated code doesn't depend on where the source lives
+			compileUi(os.path.relpath(ui_file_name(name)), py_file, indent=0)
+
+			py_file.write("\n\n")
+			py_file.write("FORM_CLASS = \"Ui_" + top_widget.get("name") + "\"\n")
+			py_file.write("UI_HASH = \"" + ui_hash(name) + "\"\n")
+
+		print("compiled", ui_file_name(name))
+
+
+if __name__ == "__main__":
+	compile_forms()
+	sys.exit(0)
@@ -1,6 +1,5 @@
 import os
 import re
-import requests
 import webbrowser
 
 from PyQt6.QtCore import Qt, QSizeF, QEvent, pyqtSignal, QUrl, QObject, QChildEvent
@@ -14,7 +13,10 @@ from PyQt6.uic import loadUi
 from mastodon import Mastodon
 
 from mammudon.debugging import debug
+from mammudon.emojis import EmojiIndex
+from mammudon.image_cache import image_cache
 from mammudon.name_list_entry import NameListEntry
+from mammudon.web_profile import web_profile
 
 
 class BioPage(QWebEnginePage):
@@ -23,7 +25,7 @@ class BioPage(QWebEnginePage):
 	link_clicked = pyqtSignal(QUrl)
 
 	def __init__(self, parent: QWidget):
-		super(QWebEnginePage, self).__init__(parent)
+		super(QWebEnginePage, self).__init__(web_profile.profile(), parent)
 
 		self.settings().setAttribute(QWebEngineSettings.WebAttribute.ShowScrollBars, False)
 
@@ -56,7 +58,7 @@ class UserProfile(QWidget):
 	unfollow_account = pyqtSignal(object)     # really an int() but that gets trashed by Qt because too big
 
 	# TODO: might want to pass the Account object rather than just the id and get the mastodon instance from there
-	def __init__(self, mastodon: Mastodon, account_id: int, my_id: int):
+	def __init__(self, mastodon: Mastodon, account_id: int, my_id: int, emoji_index: EmojiIndex):
 		super().__init__()
 
 		loadUi(os.path.join(os.path.dirname(__file__), "ui", "user_profile.ui"), self)
@@ -91,6 +93,7 @@ class UserProfile(QWidget):
 		self.followers_scroller: QScrollArea = self.findChild(QScrollArea, "followersScroller")
 
 		self.mastodon = mastodon
+		self.emoji_index = emoji_index
 		try:
 			self.account = self.mastodon.account(account_id)
 			debug(self.account)
@@ -107,14 +110,12 @@ class UserProfile(QWidget):
 
 		self.joined_date_label.setText(self.account["created_at"].astimezone().strftime("%x"))
 
-		# TODO: image cache
 		avatar_image = QImage()
-		avatar_image.loadFromData(requests.get(self.account["avatar"]).content)
+		avatar_image.loadFromData(image_cache.data("avatar", self.account["avatar"]))
 		self.avatar_label.setPixmap(QPixmap.fromImage(avatar_image))
 
-		# TODO: image cache
 		banner_image = QImage()
-		banner_image.loadFromData(requests.get(self.account["header"]).content)
+		banner_image.loadFromData(image_cache.data("header", self.account["header"]))
 
 		# since Qt does not give us a way to do this with a native widget, we must
 		# get creative and calculate everything ourselves
@@ -170,13 +171,7 @@ class UserProfile(QWidget):
 		self.bio_web_view.installEventFilter(self)   # pass on scroll wheel events from the QWebEngineView to us
 
 		# custom emoji
-		note_html = self.account["note"]
-		emoji: dict
-		for emoji in self.account["emojis"]:
-			note_html = note_html.replace(
-				":" + emoji["shortcode"] + ":",
-				'<img class="custom-emoji" title="&#58;' + emoji["shortcode"] + '&#58;" src="' + emoji["url"] + '">'
-			)
+		note_html = self.emoji_index.replace(self.account["note"], self.account["emojis"])
 
 		# mark external links with an impossible URL extension, so link_clicked() can decide upon those later
 		note_html = note_html.replace('" target="_blank"', ' EXTERNAL LINK"')
@@ -310,7 +305,7 @@ class UserProfile(QWidget):
 				# TODO: paginated loading when scroller hits the bottom
 				page = self.mastodon.account_following(self.account["id"], limit=10)
 				for account in page:
-					name_list_entry = NameListEntry(account, account["id"] in familiar_ids)
+					name_list_entry = NameListEntry(account, account["id"] in familiar_ids, self.emoji_index)
 					self.followers_name_list_layout.addWidget(name_list_entry)
 					name_list_entry.displayNameView.installEventFilter(self)
 					name_list_entry.displayNameView.page().installEventFilter(self)
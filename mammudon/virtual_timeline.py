@@ -0,0 +1,288 @@
+# alternative to Timeline, which keeps the posts in a TimelineModel with a lightweight PostRecord each, but only has
+# PostView widgets for the posts inside the visible part of the scroll area plus a small margin around it,
+# so the timeline length doesn't make a difference for memory use or layout time, selectable in the preferences
+
+import bisect
+
+from PyQt6.QtCore import QTimer, QObject, QEvent
+
+from mammudon.account import Account
+from mammudon.debugging import debug
+from mammudon.memory_governor import STATUS_OVERHEAD
+from mammudon.model_timeline import ModelTimeline
+from mammudon.post_view_pool import post_view_pool
+from mammudon.prefs import MAX_VIRTUAL_TIMELINE_LENGTH
+from mammudon.status_post import PostView, estimate_height
+from mammudon.timeline_model import PostRecord
+
+# pixels above and below the visible part of the timeline that get PostViews, too, so they are
+# already loaded when scrolling into view
+OVERSCAN = 400
+
+# milliseconds to collect height changes of the posts' web pages before resizing them all in one go, about one frame
+HEIGHT_UPDATE_INTERVAL = 16
+
+
+class VirtualTimeline(ModelTimeline):
+
+	# only the posts on screen have a PostView, so this one can keep a lot more posts
+	max_timeline_length = MAX_VIRTUAL_TIMELINE_LENGTH
+
+	def __init__(
+			self,
+			account: Account,
+			name: str,
+			friendly_name: str):
+
+		super().__init__(account, name, friendly_name)
+
+		# shortcuts into the model, only to be changed through it: the records by post id, and the post ids
+		# sorted by their mammudon_sort_id, newest first, in the order they are shown
+		self.records: dict[int, PostRecord] = self.model.records
+		self.order: list[int] = self.model.post_index.ids
+
+		# update_layout() positions the posts from this index in self.order on, see invalidate_layout()
+		self.layout_from = 0
+
+		# only the posts that are currently on screen have a PostView in self.post_views, they go back
+		# to the post_view_pool as soon as they scroll out of view
+
+		# the PostViews get positioned by update_layout(), not by the timeline_view's layout, which stays empty
+		self.timeline_view.installEventFilter(self)
+		self.scroll_area.viewport().installEventFilter(self)
+
+		# collect all reasons to lay out the timeline again until the next run of the event loop
+		self.layout_timer = QTimer()
+		self.layout_timer.timeout.connect(self.update_layout)
+		self.layout_timer.setSingleShot(True)
+
+		# the web pages report new heights whenever they like, so collect the reports by post id
+		# and resize all PostViews at once before laying out the timeline again
+		self.pending_heights: dict[int, tuple[PostView, int]] = {}
+
+		self.height_timer = QTimer()
+		self.height_timer.timeout.connect(self.apply_heights)
+		self.height_timer.setSingleShot(True)
+
+		self.scroll_area.verticalScrollBar().valueChanged.connect(self.schedule_layout)
+
+	def __del__(self) -> None:
+		debug("__del__eting virtual timeline", self.scroller_name, "of account", self.account.account_username)
+
+	def eventFilter(self, o: QObject, e: QEvent) -> bool:
+		if o is self.timeline_icon_widget:
+			# catch mouse clicks on the timeline icon to jump to next unread post
+			if e.type() == QEvent.Type.MouseButtonRelease:
+				self.scroll_to_next_unread()
+			return False
+
+		# a PostView changed its size, or the visible area changed its width or height
+		if e.type() in [QEvent.Type.LayoutRequest, QEvent.Type.Resize]:
+			self.schedule_layout()
+
+		return False
+
+	def schedule_layout(self, *_args) -> None:
+		if not self.layout_timer.isActive():
+			self.layout_timer.start(0)
+
+	def record_y(self, post_id: int) -> int:
+		return self.records[post_id].y
+
+	def record_bottom(self, post_id: int) -> int:
+		record = self.records[post_id]
+		return record.y + record.height
+
+	# the first post that needs its y position calculated again, the ones above it are where they were
+	def invalidate_layout(self, position: int) -> None:
+		self.layout_from = min(self.layout_from, position)
+
+	def update_layout(self) -> None:
+		scrollbar = self.scroll_area.verticalScrollBar()
+		scroll_y = scrollbar.value()
+
+		# remember which post is at the top of the visible area, so it stays in place when posts get added or
+		# change their height above it, unless we are at the very top, where new posts should show up, the
+		# positions are still the ones of the last layout, new posts start out at the position of the post
+		# below them, so the positions are sorted and the last post starting above scroll_y is the one
+		anchor: PostRecord | None = None
+		anchor_offset = 0
+		if scroll_y > 0 and self.order:
+			position = bisect.bisect_right(self.order, scroll_y, key=self.record_y) - 1
+			if position >= 0:
+				anchor = self.records[self.order[position]]
+				anchor_offset = scroll_y - anchor.y
+
+		# measure the posts on screen that finished loading, their height will be known from now on
+		for post_id, post_view in self.post_views.items():
+			if post_view.native or (post_view.page_shown and not post_view.web_page.isLoading()):
+				record = self.records[post_id]
+				height = post_view.sizeHint().height()
+				if height != record.height:
+					record.height = height
+					self.invalidate_layout(self.model.post_index.position(post_id))
+
+		# only the posts from the first new, removed or resized post on move
+		self.layout_from = min(self.layout_from, len(self.order))
+		y = self.record_bottom(self.order[self.layout_from - 1]) if self.layout_from > 0 else 0
+		for post_id in self.order[self.layout_from:]:
+			record = self.records[post_id]
+			record.y = y
+			y += record.height
+
+		self.layout_from = len(self.order)
+
+		# this makes the scroll area update its scrollbar range right away
+		self.timeline_view.setMinimumHeight(self.record_bottom(self.order[-1]) if self.order else 0)
+
+		if anchor:
+			scrollbar.setValue(anchor.y + anchor_offset)
+			scroll_y = scrollbar.value()
+
+		top = scroll_y - OVERSCAN
+		bottom = scroll_y + self.scroll_area.viewport().height() + OVERSCAN
+
+		# the posts reaching below top, up to the first one starting at bottom
+		first = bisect.bisect_right(self.order, top, key=self.record_bottom)
+		last = bisect.bisect_left(self.order, bottom, lo=first, key=self.record_y)
+		visible_ids = self.order[first:last]
+		visible_set = set(visible_ids)
+
+		for post_id in list(self.post_views.keys()):
+			if post_id not in visible_set:
+				self.release_view(post_id)
+
+		width = self.timeline_view.width()
+		for post_id in visible_ids:
+			record = self.records[post_id]
+
+			post_view = self.post_views.get(post_id, None)
+			if not post_view:
+				post_view = self.materialize_view(record)
+
+			post_view.setGeometry(0, record.y, width, record.height)
+
+	def queue_height(self, post_view: PostView, height: int) -> None:
+		self.pending_heights[post_view.id] = (post_view, height)
+
+		if not self.height_timer.isActive():
+			self.height_timer.start(HEIGHT_UPDATE_INTERVAL)
+
+	def apply_heights(self) -> None:
+		pending_heights = self.pending_heights
+		self.pending_heights = {}
+
+		for post_id, (post_view, height) in pending_heights.items():
+			# skip PostViews that went back to the post_view_pool in the meantime
+			if self.post_views.get(post_id) is not post_view:
+				continue
+
+			post_view.set_page_height(height)
+
+		self.update_layout()
+
+	# only the posts around the visible part of the timeline have a web page, so discard_pages() has nothing to do
+	def memory_usage(self) -> dict[str, int]:
+		usage = {"pages": 0, "html": 0, "statuses": 0}
+
+		for post_view in self.post_views.values():
+			if post_view.page_shown:
+				usage["pages"] += 1
+
+		for record in self.records.values():
+			usage["html"] += len(record.post_html) + len(record.native_html)
+			usage["statuses"] += len(record.post["content"]) + STATUS_OVERHEAD
+
+		return usage
+
+	# posts without a PostView get formatted again in update_view() once they scroll into view
+	def drop_html(self) -> int:
+		freed = 0
+
+		for post_id, record in self.records.items():
+			if post_id in self.post_views:
+				continue
+
+			freed += len(record.post_html)
+			record.post_html = ""
+
+		return freed
+
+	def materialize_view(self, record: PostRecord) -> PostView:
+		# unread signals are always wanted, see on_view_unread_changed()
+		post_view = post_view_pool.checkout(
+			authored_by_me=(self.my_id == record.post["account"]["id"]),
+			post_id=record.post["id"],
+			count_as_unread=True)
+		post_view.setParent(self.timeline_view)
+
+		self.connect_post_view(post_view)
+		post_view.height_reported.connect(self.queue_height)
+
+		post_view.set_unread(record.unread)
+		self.update_view(post_view, record)
+
+		# this post is on screen, so it doesn't need the placeholder
+		post_view.show_page()
+		post_view.show()
+
+		self.post_views[record.post["id"]] = post_view
+		return post_view
+
+	def scroll_to_next_unread(self) -> None:
+		scrollbar = self.scroll_area.verticalScrollBar()
+
+		start = bisect.bisect_right(self.order, scrollbar.value(), key=self.record_y)
+		for post_id in self.order[start:]:
+			record = self.records[post_id]
+			if record.unread:
+				scrollbar.setValue(record.y)
+				return
+
+	# slot
+	def on_post_inserted(self, post_id: int) -> None:
+		record = self.records[post_id]
+		record.height = estimate_height(record.post)
+
+		# keep the positions sorted until the next layout, see update_layout()
+		position = self.model.post_index.position(post_id)
+		if position + 1 < len(self.order):
+			record.y = self.record_y(self.order[position + 1])
+		else:
+			record.y = self.record_bottom(self.order[position - 1]) if position > 0 else 0
+
+		self.invalidate_layout(position)
+		self.schedule_layout()
+
+	# slot
+	def on_post_removed(self, post_id: int, record: PostRecord) -> None:
+		if post_id in self.post_views:
+			self.release_view(post_id)
+
+		# the post is gone from self.order already, the posts that were below it start at its position
+		self.invalidate_layout(bisect.bisect_left(self.order, record.y, key=self.record_y))
+		self.schedule_layout()
+
+	def application_minimized(self) -> None:
+		# posts without a PostView don't get the minimized signal
+		self.model.mark_all_read()
+
+		super().application_minimized()
+
+	def show_post(self, record: PostRecord, content_changed: bool) -> None:
+		post_view = self.post_views.get(record.post["id"], None)
+		if post_view:
+			post_view.set_unread(record.unread)
+			self.update_view(post_view, record, content_changed)
+
+		self.schedule_layout()
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
@@ -0,0 +1,90 @@
+import os
+
+from PyQt6.QtWebEngineCore import QWebEngineProfile
+
+from mammudon.debugging import debug
+from mammudon.image_scheme import install_image_scheme_handler
+from mammudon.theme_scheme import install_theme_scheme_handler
+
+# Qt keeps the profile's cache, cookies etc. in a folder of this name below the application's data location
+PROFILE_NAME = "mammudon"
+
+# default size limit of the on-disk HTTP cache, changeable in the preferences
+DEFAULT_CACHE_SIZE_MB = 256
+
+
+# one persistent web profile for all pages the app creates, so avatars, emojis, media previews and card
+# images get cached on disk, shared between all pages and accounts, and survive restarting the app, the
+# default profile is off the record and forgets everything on quit
+class WebProfile:
+	def __init__(self):
+		self.web_engine_profile: QWebEngineProfile | None = None
+
+		self.cache_size_mb = DEFAULT_CACHE_SIZE_MB
+
+	# creates the profile on first use, since it needs a running QApplication
+	def profile(self) -> QWebEngineProfile:
+		if not self.web_engine_profile:
+			self.web_engine_profile = QWebEngineProfile(PROFILE_NAME)
+			self.web_engine_profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+			self.web_engine_profile.setHttpCacheMaximumSize(self.cache_size_mb * 1024 * 1024)
+
+			# deliver theme stylesheets and cached images to the pages, too
+			install_theme_scheme_handler(self.web_engine_profile)
+			install_image_scheme_handler(self.web_engine_profile)
+
+			debug("web profile", PROFILE_NAME, "caching up to", self.cache_size_mb, "MB in", self.web_engine_profile.cachePath())
+
+		return self.web_engine_profile
+
+	def set_cache_size(self, cache_size_mb: int) -> None:
+		self.cache_size_mb = cache_size_mb
+
+		if self.web_engine_profile:
+			self.web_engine_profile.setHttpCacheMaximumSize(cache_size_mb * 1024 * 1024)
+
+	def clear_cache(self) -> None:
+		if self.web_engine_profile:
+			self.web_engine_profile.clearHttpCache()
+
+	def stats(self) -> dict[str, int]:
+		cache_files = 0
+		cache_bytes = 0
+
+		if self.web_engine_profile:
+			for folder, _sub_folders, file_names in os.walk(self.web_engine_profile.cachePath()):
+				for file_name in file_names:
+					try:
+						cache_bytes += os.path.getsize(os.path.join(folder, file_name))
+						cache_files += 1
+					except OSError:
+						# the web engine removed the file while we were looking
+						pass
+
+		return {
+			"cache_files": cache_files,
+			"cache_bytes": cache_bytes,
+			"cache_max_bytes": self.cache_size_mb * 1024 * 1024,
+		}
+
+	def log_stats(self) -> None:
+		stats = self.stats()
+
+		debug(
+			"web profile cache:", stats["cache_files"], "files using", stats["cache_bytes"] // 1024 // 1024,
+			"of", stats["cache_max_bytes"] // 1024 // 1024, "MB"
+		)
+
+	# DEBUG: catch == which is probably not desired
+	def __eq__(self, other):
+		breakpoint()
+		return False
+
+	# DEBUG: catch != which is probably not desired
+	def __ne__(self, other):
+		breakpoint()
+		return False
+
+
+# offer global "web_profile" to all other modules
+web_profile = WebProfile()
@@ -0,0 +1,110 @@
+# the StatusStore and TimelineModel work without any widgets, so these run without a display
+#
+# usage: python -m unittest discover tests
+
+import os
+import sys
+import unittest
+
+# allow running the tests straight from a source checkout
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QCoreApplication
+
+from mammudon.status_store import StatusStore
+from mammudon.timeline_model import TimelineModel
+
+application = QCoreApplication.instance() or QCoreApplication([])
+
+
+def status(status_id: int, in_reply_to_id: int | None = None, reblog: dict | None = None) -> dict:
+	return {
+		"id": status_id,
+		"in_reply_to_id": in_reply_to_id,
+		"reblog": reblog,
+		"account": {"id": 1, "acct": "someone", "url": "https://example.com/@someone"},
+		"content": "<p>status " + str(status_id) + "</p>",
+		"spoiler_text": "",
+		"sensitive": False,
+		"edited_at": None,
+		"emojis": [],
+		"media_attachments": [],
+		"card": None,
+		"poll": None,
+		"replies_count": 0,
+		"reblogs_count": 0,
+		"favourites_count": 0,
+	}
+
+
+class TestStatusStore(unittest.TestCase):
+	def setUp(self):
+		self.store = StatusStore()
+		self.home = TimelineModel(count_as_unread=True, status_store=self.store)
+		self.local = TimelineModel(count_as_unread=False, status_store=self.store)
+
+	def test_shared_status_is_stored_once(self):
+		self.home.add_status(status(1))
+		self.local.add_status(status(1))
+
+		self.assertEqual(len(self.store), 1)
+		self.assertEqual(self.store.users[1], 2)
+
+	def test_remove_keeps_status_of_other_timeline(self):
+		self.home.add_status(status(1))
+		self.local.add_status(status(1))
+
+		self.home.remove(1)
+		self.assertIn(1, self.store)
+
+		self.local.remove(1)
+		self.assertNotIn(1, self.store)
+
+	def test_boost_shares_boosted_status(self):
+		self.home.add_status(status(10, reblog=status(1)))
+		self.local.add_status(status(1))
+
+		self.assertEqual(len(self.store), 1)
+		self.assertEqual(self.store.users[1], 2)
+
+	def test_poll_refresh_stays_in_its_timeline(self):
+		poll = {
+			"id": 7, "expired": False, "multiple": False, "voted": False, "own_votes": [], "voters_count": 0,
+			"expires_at": None, "options": [{"title": "yes", "votes_count": 0}], "emojis": [],
+		}
+		self.home.add_status(dict(status(1), poll=dict(poll)))
+		self.local.add_status(dict(status(1), poll=dict(poll)))
+
+		self.home.record(1).refresh_poll = True
+
+		# an unrelated update in the local column must not use up the refresh the home column asked for
+		_record, content_changed = self.local.add_status(dict(status(1), poll=dict(poll)))
+		self.assertFalse(content_changed)
+		self.assertTrue(self.home.record(1).refresh_poll)
+
+		_record, content_changed = self.home.add_status(dict(status(1), poll=dict(poll)))
+		self.assertTrue(content_changed)
+		self.assertFalse(self.home.record(1).refresh_poll)
+
+	def test_clear_releases_all_statuses(self):
+		for status_id in range(1, 6):
+			self.home.add_status(status(status_id, in_reply_to_id=status_id - 1 if status_id % 2 else None))
+		self.local.add_status(status(3))
+
+		# closing the home column leaves only what the local column still shows
+		self.home.clear()
+		self.assertEqual(list(self.store.statuses), [3])
+		self.assertEqual(len(self.home), 0)
+		self.assertEqual(len(self.home.root_index), 0)
+
+		self.local.clear()
+		self.assertEqual(len(self.store), 0)
+		self.assertEqual(self.store.users, {})
+
+		# clearing twice, e.g. when a column reports being closed twice, must not release anything again
+		self.local.clear()
+		self.assertEqual(len(self.store), 0)
+
+
+if __name__ == "__main__":
+	unittest.main()
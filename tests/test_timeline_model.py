@@ -0,0 +1,160 @@
+# the TimelineModel, PostIndex and ThreadIndex keep the order and threads of a timeline without any widgets, so these
+# run without a display
+#
+# usage: python -m unittest discover tests
+
+import os
+import sys
+import unittest
+
+# allow running the tests straight from a source checkout
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QCoreApplication
+
+from mammudon.post_index import PostIndex
+from mammudon.thread_index import ThreadIndex
+from mammudon.timeline_model import TimelineModel
+
+application = QCoreApplication.instance() or QCoreApplication([])
+
+
+def status(status_id: int, in_reply_to_id: int | None = None, reblog: dict | None = None) -> dict:
+	return {
+		"id": status_id,
+		"in_reply_to_id": in_reply_to_id,
+		"reblog": reblog,
+		"account": {"id": 1, "acct": "someone", "url": "https://example.com/@someone"},
+		"content": "<p>status " + str(status_id) + "</p>",
+		"spoiler_text": "",
+		"sensitive": False,
+		"edited_at": None,
+		"emojis": [],
+		"media_attachments": [],
+		"card": None,
+		"poll": None,
+		"replies_count": 0,
+		"reblogs_count": 0,
+		"favourites_count": 0,
+	}
+
+
+class TestPostIndex(unittest.TestCase):
+	def setUp(self):
+		self.index = PostIndex()
+
+	def test_newest_first(self):
+		for post_id in [3, 1, 2]:
+			self.index.insert(post_id, post_id)
+
+		self.assertEqual(self.index.ids, [3, 2, 1])
+		self.assertEqual(self.index.oldest(), 1)
+
+	def test_position_with_duplicate_keys(self):
+		# posts with the same sort id keep the order they came in
+		self.assertEqual(self.index.insert(1, 10), 0)
+		self.assertEqual(self.index.insert(2, 10), 1)
+		self.assertEqual(self.index.insert(3, 10), 2)
+		self.index.insert(4, 20)
+
+		self.assertEqual(self.index.ids, [4, 1, 2, 3])
+		self.assertEqual(self.index.position(3), 3)
+
+		self.assertEqual(self.index.remove(2), 2)
+		self.assertEqual(self.index.position(3), 2)
+		self.assertIsNone(self.index.position(2))
+
+	def test_insert_again_moves_post(self):
+		self.index.insert(1, 1)
+		self.index.insert(2, 2)
+		self.index.insert(1, 3)
+
+		self.assertEqual(self.index.ids, [1, 2])
+		self.assertEqual(len(self.index), 2)
+
+
+class TestThreadIndex(unittest.TestCase):
+	def test_adopt_orphans(self):
+		threads = ThreadIndex()
+		threads.add_orphan(1, 2)
+		threads.add_orphan(1, 3)
+		self.assertTrue(threads.is_wanted(1))
+
+		self.assertEqual(threads.adopt(1), [2, 3])
+		self.assertFalse(threads.is_wanted(1))
+		self.assertEqual(threads.parent(2), 1)
+		self.assertEqual(list(threads.child_ids[1]), [2, 3])
+
+	def test_remove_parent_frees_children(self):
+		threads = ThreadIndex()
+		threads.add_child(1, 2)
+		threads.add_orphan(5, 3)
+
+		self.assertTrue(threads.remove(1))
+		self.assertIsNone(threads.parent(2))
+		self.assertNotIn(1, threads.child_ids)
+
+		self.assertTrue(threads.remove(3))
+		self.assertFalse(threads.is_wanted(5))
+		self.assertFalse(threads.remove(4))
+
+
+class TestTimelineModel(unittest.TestCase):
+	def setUp(self):
+		self.model = TimelineModel(count_as_unread=True)
+
+		self.reparented = []
+		self.model.post_reparented.connect(lambda post_id, parent_id: self.reparented.append((post_id, parent_id)))
+
+	def test_orphan_gets_adopted(self):
+		self.model.add_status(status(2, in_reply_to_id=1))
+		self.assertEqual(self.model.root_index.ids, [2])
+
+		self.model.add_status(status(1))
+		self.assertEqual(self.reparented, [(2, 1)])
+		self.assertEqual(self.model.thread_index.parent(2), 1)
+		self.assertEqual(self.model.root_index.ids, [1])
+		self.assertEqual(self.model.post_index.ids, [2, 1])
+
+	def test_remove_re_roots_children(self):
+		self.model.add_status(status(1))
+		self.model.add_status(status(2, in_reply_to_id=1))
+		self.model.add_status(status(3, in_reply_to_id=1))
+		self.assertEqual(self.model.root_index.ids, [1])
+
+		self.model.remove(1)
+		self.assertEqual(self.model.root_index.ids, [3, 2])
+		self.assertIsNone(self.model.thread_index.parent(2))
+		self.assertNotIn(1, self.model)
+
+	def test_boost_sorts_by_boost_id(self):
+		self.model.add_status(status(50))
+		self.model.add_status(status(100, reblog=status(5)))
+
+		self.assertEqual(self.model.post_index.ids, [5, 50])
+		self.assertEqual(self.model.record(5).boosted_by["id"], 1)
+
+	def test_boosts_with_same_sort_id(self):
+		# boosted again, the post keeps its place from the first boost
+		self.model.add_status(status(100, reblog=status(5)))
+		self.model.add_status(status(60))
+		self.model.add_status(status(200, reblog=status(5)))
+
+		self.assertEqual(self.model.post_index.ids, [5, 60])
+		self.assertEqual(self.model.record(5).post["mammudon_sort_id"], 100)
+		self.assertEqual(len(self.model), 2)
+
+	def test_unread_count(self):
+		unread = []
+		self.model.unread_changed.connect(unread.append)
+
+		self.model.add_status(status(1))
+		self.model.add_status(status(2))
+		self.model.mark_all_read()
+		self.model.remove(1)
+
+		self.assertEqual(unread, [True, True, False, False])
+
+
+if __name__ == "__main__":
+	unittest.main()